@@ -93,10 +93,12 @@ def _build_output(
                 tool_policy=rt.tool_policy,
             ),
             message_history_json=_serialize_history(all_msgs),
+            message_count=len(all_msgs),
         )
     return WorkItemOutput(
         text=result_output,
         message_history_json=_serialize_history(all_msgs),
+        message_count=len(all_msgs),
     )
 
 
@@ -182,6 +184,7 @@ def run_agent_step(work_item_dict: dict[str, Any]) -> dict[str, Any]:
                 output = WorkItemOutput(
                     text=exc.user_message,
                     message_history_json=_serialize_history(history),
+                    message_count=len(history),
                 )
             except AgentRunError as exc:
                 raise _wrap_agent_run_error(exc) from exc
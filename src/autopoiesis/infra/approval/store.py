@@ -58,6 +58,11 @@ class ApprovalStore:
         with closing(self._connect()) as conn, conn:
             init_schema(conn)
 
+    @property
+    def db_path(self) -> Path:
+        """Filesystem path of the backing SQLite database."""
+        return self._db_path
+
     @classmethod
     def from_env(cls, *, base_dir: Path) -> ApprovalStore:
         ttl = _read_positive_int("APPROVAL_TTL_SECONDS", _DEFAULT_APPROVAL_TTL_SECONDS)
@@ -21,10 +21,60 @@ def init_schema(conn: sqlite3.Connection) -> None:
     """Create or migrate the approval envelope schema to current shape."""
     if not _table_exists(conn, "approval_envelopes"):
         _create_schema(conn)
-        return
-    if _schema_is_current(conn):
-        return
-    _migrate_legacy_schema(conn)
+    elif not _schema_is_current(conn):
+        _migrate_legacy_schema(conn)
+    _ensure_pending_counter(conn)
+
+
+def _ensure_pending_counter(conn: sqlite3.Connection) -> None:
+    """Install the trigger-maintained pending counter and resync its value.
+
+    Dashboards poll the pending count on a short cadence; reading one counter
+    row avoids a ``COUNT(*)`` scan of the envelope table per poll.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS approval_counters (
+            state TEXT PRIMARY KEY,
+            count INTEGER NOT NULL
+        )
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS approval_counters_after_insert
+        AFTER INSERT ON approval_envelopes WHEN NEW.state = 'pending'
+        BEGIN
+            UPDATE approval_counters SET count = count + 1 WHERE state = 'pending';
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS approval_counters_after_update
+        AFTER UPDATE OF state ON approval_envelopes WHEN OLD.state IS NOT NEW.state
+        BEGIN
+            UPDATE approval_counters
+            SET count = count + (NEW.state = 'pending') - (OLD.state = 'pending')
+            WHERE state = 'pending';
+        END
+        """
+    )
+    conn.execute(
+        """
+        CREATE TRIGGER IF NOT EXISTS approval_counters_after_delete
+        AFTER DELETE ON approval_envelopes WHEN OLD.state = 'pending'
+        BEGIN
+            UPDATE approval_counters SET count = count - 1 WHERE state = 'pending';
+        END
+        """
+    )
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO approval_counters (state, count)
+        SELECT 'pending', COUNT(*) FROM approval_envelopes WHERE state = 'pending'
+        """
+    )
 
 
 def _create_schema(conn: sqlite3.Connection) -> None:
@@ -83,6 +83,8 @@ class WorkItemOutput(BaseModel):
 
     text: str | None = None
     message_history_json: str | None = None
+    message_count: int | None = None
+    """Number of messages in ``message_history_json``, when the producer knows it."""
     deferred_tool_requests_json: str | None = None
 
 
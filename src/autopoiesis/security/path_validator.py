@@ -33,7 +33,7 @@ class PathValidator:
         candidate = Path(path).expanduser()
         base = self.workspace_root if base_dir is None else self._resolve_base_dir(base_dir)
         resolved = candidate.resolve() if candidate.is_absolute() else (base / candidate).resolve()
-        if not self.is_allowed(resolved):
+        if not self._within_roots(resolved):
             raise ValueError(f"Path escapes allowed roots: {path}")
         return resolved
 
@@ -53,11 +53,17 @@ class PathValidator:
 
     def is_allowed(self, path: Path) -> bool:
         """Return whether *path* stays under one of the allowlist roots."""
-        resolved = path.expanduser().resolve()
+        return self._within_roots(path.expanduser().resolve())
+
+    def _within_roots(self, resolved: Path) -> bool:
+        # Takes an already-resolved path: resolving again would repeat the
+        # per-component lstat/readlink walk for the same answer.  Results are
+        # deliberately not cached, since a symlink may be retargeted between
+        # calls.
         return any(resolved.is_relative_to(root) for root in self.allowed_roots)
 
     def _resolve_base_dir(self, base_dir: Path) -> Path:
         resolved = base_dir.expanduser().resolve()
-        if not self.is_allowed(resolved):
+        if not self._within_roots(resolved):
             raise ValueError(f"Base directory escapes allowed roots: {base_dir}")
         return resolved
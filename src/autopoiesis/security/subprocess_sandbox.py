@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import resource
+import shutil
 import subprocess  # nosec B404 — intentional: sandbox controls all subprocess calls
 from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass
@@ -14,6 +15,15 @@ _DEFAULT_MAX_PROCESSES = 512
 _DEFAULT_MAX_FILE_SIZE_BYTES = 16 * 1024 * 1024
 _DEFAULT_MAX_CPU_SECONDS = 30
 
+# util-linux ``prlimit`` sets the limits and execs the command, so ``run`` can
+# skip ``preexec_fn`` and keep CPython's vfork/posix_spawn fast path.
+_PRLIMIT_BINARY = "prlimit"
+_PRLIMIT_FLAGS: dict[str, str] = {
+    "RLIMIT_NPROC": "--nproc",
+    "RLIMIT_FSIZE": "--fsize",
+    "RLIMIT_CPU": "--cpu",
+}
+
 
 @dataclass(frozen=True)
 class SandboxLimits:
@@ -38,17 +48,33 @@ def _bounded_soft_limit(target: int, hard: int) -> int:
     return min(target, hard)
 
 
-def _set_limit(limit_name: str, target: int, *, preserve_inherited_soft: bool = False) -> None:
-    limit = getattr(resource, limit_name, None)
-    if limit is None:
-        return
+def _soft_limit(limit: int, target: int, *, preserve_inherited_soft: bool) -> tuple[int, int]:
     soft, hard = resource.getrlimit(limit)
     bounded_target = _bounded_soft_limit(target, hard)
     if preserve_inherited_soft:
         next_soft = soft if soft == resource.RLIM_INFINITY else max(soft, bounded_target)
     else:
         next_soft = bounded_target
-    resource.setrlimit(limit, (next_soft, hard))
+    return next_soft, hard
+
+
+def _set_limit(limit_name: str, target: int, *, preserve_inherited_soft: bool = False) -> None:
+    limit = getattr(resource, limit_name, None)
+    if limit is None:
+        return
+    resource.setrlimit(
+        limit, _soft_limit(limit, target, preserve_inherited_soft=preserve_inherited_soft)
+    )
+
+
+def _prlimit_option(limit_name: str, target: int, *, preserve_inherited_soft: bool) -> str | None:
+    limit = getattr(resource, limit_name, None)
+    if limit is None:
+        return None
+    soft, _hard = _soft_limit(limit, target, preserve_inherited_soft=preserve_inherited_soft)
+    value = "unlimited" if soft == resource.RLIM_INFINITY else str(soft)
+    # Trailing colon: set only the soft limit, leaving the hard limit inherited.
+    return f"{_PRLIMIT_FLAGS[limit_name]}={value}:"
 
 
 class SubprocessSandboxManager:
@@ -64,6 +90,7 @@ class SubprocessSandboxManager:
         allowlist = tuple(allowed_roots) if allowed_roots is not None else ()
         self._path_validator = PathValidator(workspace_root=workspace_root, allowed_roots=allowlist)
         self._limits = limits or SandboxLimits()
+        self._prlimit = shutil.which(_PRLIMIT_BINARY)
 
     @property
     def path_validator(self) -> PathValidator:
@@ -76,17 +103,40 @@ class SubprocessSandboxManager:
             return self._path_validator.workspace_root
         return self._path_validator.resolve_path(cwd)
 
+    def _limit_targets(self) -> tuple[tuple[str, int, bool], ...]:
+        limits = self._limits
+        return (
+            ("RLIMIT_NPROC", limits.max_processes, True),
+            ("RLIMIT_FSIZE", limits.max_file_size_bytes, False),
+            ("RLIMIT_CPU", limits.max_cpu_seconds, False),
+        )
+
     def preexec_fn(self) -> Callable[[], None]:
         """Return a pre-exec hook that applies RLIMIT-based restrictions."""
-        limits = self._limits
+        targets = self._limit_targets()
 
         def _apply_limits() -> None:
-            _set_limit("RLIMIT_NPROC", limits.max_processes, preserve_inherited_soft=True)
-            _set_limit("RLIMIT_FSIZE", limits.max_file_size_bytes)
-            _set_limit("RLIMIT_CPU", limits.max_cpu_seconds)
+            for limit_name, target, preserve in targets:
+                _set_limit(limit_name, target, preserve_inherited_soft=preserve)
 
         return _apply_limits
 
+    def launcher_args(self) -> list[str] | None:
+        """Return a ``prlimit`` argv prefix applying the limits, or ``None``.
+
+        ``None`` means ``prlimit`` is unavailable and callers must fall back
+        to :meth:`preexec_fn`.
+        """
+        if self._prlimit is None:
+            return None
+        args = [self._prlimit]
+        for limit_name, target, preserve in self._limit_targets():
+            option = _prlimit_option(limit_name, target, preserve_inherited_soft=preserve)
+            if option is not None:
+                args.append(option)
+        args.append("--")
+        return args
+
     def run(
         self,
         command: Sequence[str],
@@ -98,13 +148,15 @@ class SubprocessSandboxManager:
         """Execute *command* with sandbox path validation and limits."""
         safe_cwd = str(self.resolve_cwd(cwd))
         safe_command = [str(part) for part in command]
+        launcher = self.launcher_args()
+        preexec_fn = self.preexec_fn() if launcher is None else None
         return subprocess.run(  # nosec B603 — command is a validated list, shell=False (default)
-            safe_command,
+            [*(launcher or ()), *safe_command],
             cwd=safe_cwd,
             env=dict(env) if env is not None else None,
             timeout=timeout,
             capture_output=True,
             text=True,
             check=False,
-            preexec_fn=self.preexec_fn(),
+            preexec_fn=preexec_fn,
         )
@@ -12,8 +12,9 @@ additional token validation is performed here.
 SSE stream
 ----------
 ``GET /api/stream`` uses ``sse_starlette`` (EventSourceResponse) to push
-UIEvents to clients.  A lightweight polling loop broadcasts status and
-pending-approval summaries so the PWA dashboard stays live.
+UIEvents to clients.  Status is pushed as a heartbeat; the pending-approval
+list is pushed on connect and again only when it changes.  Approval decisions
+wake the stream immediately instead of waiting for the next heartbeat.
 """
 
 from __future__ import annotations
@@ -30,6 +31,7 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 from sse_starlette.sse import EventSourceResponse
 
+from autopoiesis.server.change_signal import approval_state_changed, wait_for_change
 from autopoiesis.server.mcp_server import (
     approval_decide,
     approval_list,
@@ -299,8 +301,10 @@ async def call_tool(name: str, body: dict[str, Any] | None = None) -> JSONRespon
 async def _sse_event_generator() -> AsyncGenerator[dict[str, str], None]:
     """Async generator that yields UIEvents as SSE data frames.
 
-    Sends a ``connected`` handshake immediately, then polls ``dashboard_status``
-    and ``approval_list`` every :data:`_SSE_POLL_INTERVAL_SECONDS` seconds.
+    Sends a ``connected`` handshake immediately, then pushes ``dashboard_status``
+    on every wakeup and ``approval_list`` only when its data changed.  Wakeups
+    come from :data:`approval_state_changed` or, at the latest, every
+    :data:`_SSE_POLL_INTERVAL_SECONDS` seconds as a heartbeat.
     Terminates when the client disconnects (``asyncio.CancelledError``).
     """
     # --- handshake ---
@@ -311,23 +315,28 @@ async def _sse_event_generator() -> AsyncGenerator[dict[str, str], None]:
     }
     yield {"event": "message", "data": json.dumps(handshake)}
 
+    last_approvals: Any = None
     try:
-        while True:
-            # status heartbeat
-            status_payload = _parse_envelope(dashboard_status())
-            yield {
-                "event": "message",
-                "data": json.dumps(status_payload),
-            }
-
-            # pending approvals
-            approvals_payload = _parse_envelope(approval_list())
-            yield {
-                "event": "message",
-                "data": json.dumps(approvals_payload),
-            }
-
-            await asyncio.sleep(_SSE_POLL_INTERVAL_SECONDS)
+        with approval_state_changed.subscribe() as changed:
+            while True:
+                # status heartbeat
+                status_payload = _parse_envelope(dashboard_status())
+                yield {
+                    "event": "message",
+                    "data": json.dumps(status_payload),
+                }
+
+                # pending approvals — skipped when nothing changed since last push
+                approvals_payload = _parse_envelope(approval_list())
+                approvals_data = approvals_payload.get("data")
+                if approvals_data != last_approvals:
+                    last_approvals = approvals_data
+                    yield {
+                        "event": "message",
+                        "data": json.dumps(approvals_payload),
+                    }
+
+                await wait_for_change(changed, _SSE_POLL_INTERVAL_SECONDS)
     except asyncio.CancelledError:
         _log.debug("SSE client disconnected")
         # EventSourceResponse expects the generator to simply stop
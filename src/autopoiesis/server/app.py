@@ -10,10 +10,12 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 
 from autopoiesis.server.api_routes import api_router
+from autopoiesis.server.approval_db import close_approval_connections
 from autopoiesis.server.connections import ConnectionManager
 from autopoiesis.server.mcp_server import mcp
 from autopoiesis.server.routes import configure_routes, router
-from autopoiesis.server.sessions import SessionStore
+from autopoiesis.server.sessions import SessionStore, warm_message_adapter
+from autopoiesis.store.knowledge_db import close_search_connections
 
 _log = logging.getLogger(__name__)
 
@@ -70,10 +72,13 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan — startup/shutdown hooks."""
     global _cleanup_task
     _log.info("Autopoiesis server starting")
+    warm_message_adapter()
     _cleanup_task = asyncio.create_task(_cleanup_stale_sessions())
     yield
     _log.info("Autopoiesis server shutting down")
     _cleanup_task.cancel()
+    close_approval_connections()
+    close_search_connections()
 
 
 app = FastAPI(
@@ -0,0 +1,129 @@
+"""Pooled SQLite access and SQL statements for the MCP approval tools.
+
+Dependencies: agent.runtime
+Wired in: server/mcp_tools.py, server/app.py (shutdown)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from autopoiesis.agent.runtime import Runtime
+
+# One long-lived connection per approval DB: dashboard polls are single-row
+# reads where connection setup would dominate.  The lock serialises access
+# because the connection is shared across threads.
+_connections: dict[Path, sqlite3.Connection] = {}
+_connections_lock = threading.RLock()
+_STATEMENT_CACHE_SIZE = 256
+
+# Bumped on every write through a pooled connection and whenever a connection
+# is (re)opened.  PRAGMA data_version only reflects commits made by *other*
+# connections and restarts with each new connection, so the pair together
+# identifies the current DB contents.
+_local_generation = 0
+
+# SQL lives in module constants so the pooled connection's statement cache,
+# keyed by query text, skips SQLite's parse/plan step after the first call.
+PENDING_COUNT_SQL = "SELECT count AS pending_count FROM approval_counters WHERE state = 'pending'"
+
+PENDING_COUNT_FALLBACK_SQL = """
+    SELECT COUNT(*) AS pending_count
+    FROM approval_envelopes
+    WHERE state = 'pending'
+"""
+
+# Row queries take a LIMIT parameter; -1 means unlimited in SQLite.  Column
+# order is part of the contract: mcp_tools unpacks rows positionally.  Only the
+# plan-hash prefix shown to clients is selected.
+PENDING_ROWS_SQL = """
+    SELECT envelope_id, nonce, substr(plan_hash, 1, 8) AS plan_hash_prefix,
+           issued_at, expires_at, tool_calls_json
+    FROM approval_envelopes
+    WHERE state = 'pending'
+    ORDER BY issued_at ASC
+    LIMIT ?
+"""
+
+# Count-only callers get tool_count from SQLite and never load the JSON column.
+PENDING_SUMMARY_SQL = """
+    SELECT envelope_id, nonce, substr(plan_hash, 1, 8) AS plan_hash_prefix,
+           issued_at, expires_at,
+           CASE WHEN json_valid(tool_calls_json)
+                THEN json_array_length(tool_calls_json) ELSE 0 END AS tool_count
+    FROM approval_envelopes
+    WHERE state = 'pending'
+    ORDER BY issued_at ASC
+    LIMIT ?
+"""
+
+DATA_VERSION_SQL = "PRAGMA data_version"
+
+# An id can equal one envelope's envelope_id and another's nonce, so the
+# subquery picks exactly one pending row, preferring the envelope_id match.
+DECIDE_SQL = """
+    UPDATE approval_envelopes
+    SET state = :state, consumed_at = :consumed_at, signed_object_json = :record
+    WHERE envelope_id = (
+        SELECT envelope_id FROM approval_envelopes
+        WHERE state = 'pending' AND (envelope_id = :approval_id OR nonce = :approval_id)
+        ORDER BY envelope_id = :approval_id DESC
+        LIMIT 1
+    )
+    RETURNING envelope_id, nonce, substr(plan_hash, 1, 8) AS plan_hash_prefix
+"""
+
+
+def approval_db_path(runtime: Runtime) -> Path:
+    return runtime.approval_store.db_path
+
+
+def _connect(path: Path) -> sqlite3.Connection:
+    note_local_write()
+    conn = sqlite3.connect(
+        path,
+        check_same_thread=False,
+        isolation_level=None,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    # Plain tuples: callers unpack columns positionally, avoiding the
+    # name-to-index lookup sqlite3.Row performs on every access.
+    return conn
+
+
+@contextmanager
+def approval_connection(runtime: Runtime) -> Iterator[sqlite3.Connection]:
+    """Yield the pooled autocommit connection for the runtime's approval DB."""
+    path = approval_db_path(runtime)
+    with _connections_lock:
+        conn = _connections.get(path)
+        if conn is None:
+            conn = _connect(path)
+            _connections[path] = conn
+        yield conn
+
+
+def note_local_write() -> None:
+    """Record that the pooled connection modified the approval DB."""
+    global _local_generation
+    _local_generation += 1
+
+
+def write_token(conn: sqlite3.Connection) -> tuple[int, int]:
+    """Return a token that changes whenever the approval DB may have changed."""
+    row = conn.execute(DATA_VERSION_SQL).fetchone()
+    return int(row[0]), _local_generation
+
+
+def close_approval_connections() -> None:
+    """Close every pooled approval DB connection (server shutdown)."""
+    with _connections_lock:
+        for conn in _connections.values():
+            conn.close()
+        _connections.clear()
@@ -0,0 +1,48 @@
+"""Loop-safe wakeup signal for dashboard state changes.
+
+Producers (approval mutations) call :meth:`ChangeSignal.notify`; long-lived
+consumers such as the SSE stream subscribe and wait on their own
+:class:`asyncio.Event`, so the signal never binds to a single event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+
+class ChangeSignal:
+    """Fan a change notification out to every subscribed waiter."""
+
+    def __init__(self) -> None:
+        self._waiters: set[asyncio.Event] = set()
+
+    def notify(self) -> None:
+        """Wake all current subscribers."""
+        for event in self._waiters:
+            event.set()
+
+    @contextmanager
+    def subscribe(self) -> Iterator[asyncio.Event]:
+        """Register a waiter event for the duration of the context."""
+        event = asyncio.Event()
+        self._waiters.add(event)
+        try:
+            yield event
+        finally:
+            self._waiters.discard(event)
+
+
+async def wait_for_change(event: asyncio.Event, timeout: float) -> bool:
+    """Wait until *event* fires or *timeout* elapses; return whether it fired."""
+    try:
+        await asyncio.wait_for(event.wait(), timeout=timeout)
+    except TimeoutError:
+        return False
+    event.clear()
+    return True
+
+
+approval_state_changed = ChangeSignal()
+"""Fired whenever a pending approval is decided through the MCP tools."""
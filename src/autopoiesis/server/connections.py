@@ -23,11 +23,31 @@ async def _send_one(session_id: str, ws: WebSocket, payload: str) -> WebSocket |
     return None
 
 
+async def _send_all(session_id: str, clients: list[WebSocket], payload: str) -> list[WebSocket]:
+    """Send *payload* to every client; return the sockets that failed."""
+    if len(clients) == 1:
+        # A session usually has one client; gather() would wrap the send in a
+        # task, costing far more than the send itself.
+        failed = await _send_one(session_id, clients[0], payload)
+        return [failed] if failed is not None else []
+
+    results = await asyncio.gather(
+        *[_send_one(session_id, ws, payload) for ws in clients],
+        return_exceptions=True,
+    )
+    for r in results:
+        if isinstance(r, BaseException):
+            _log.error("Unexpected error during broadcast: %s", r)
+    return [r for r in results if isinstance(r, WebSocket)]
+
+
 class ConnectionManager:
     """Track WebSocket connections per session and broadcast events."""
 
     def __init__(self) -> None:
         self._connections: dict[str, list[WebSocket]] = defaultdict(list)
+        # Kept in step with ``_connections`` so ``client_count`` never allocates.
+        self._counts: dict[str, int] = {}
         self._lock = asyncio.Lock()
 
     async def connect(self, session_id: str, websocket: WebSocket) -> None:
@@ -35,7 +55,8 @@ class ConnectionManager:
         await websocket.accept()
         async with self._lock:
             self._connections[session_id].append(websocket)
-        count = self.client_count(session_id)
+            count = self._counts.get(session_id, 0) + 1
+            self._counts[session_id] = count
         _log.info("Client connected to session %s (%d total)", session_id, count)
 
     async def disconnect(self, session_id: str, websocket: WebSocket) -> None:
@@ -44,28 +65,21 @@ class ConnectionManager:
             clients = self._connections.get(session_id, [])
             if websocket in clients:
                 clients.remove(websocket)
-            if not clients:
-                self._connections.pop(session_id, None)
+            self._sync_count(session_id, clients)
         _log.info("Client disconnected from session %s", session_id)
 
     async def broadcast(self, session_id: str, message: WSOutgoing) -> None:
         """Send a message to all connected clients in a session concurrently."""
+        await self.broadcast_json(session_id, message.to_json())
+
+    async def broadcast_json(self, session_id: str, payload: str) -> None:
+        """Send an already-serialized JSON frame to all clients in a session."""
         async with self._lock:
             clients = list(self._connections.get(session_id, []))
         if not clients:
             return
 
-        payload = message.model_dump_json()
-        results = await asyncio.gather(
-            *[_send_one(session_id, ws, payload) for ws in clients],
-            return_exceptions=True,
-        )
-
-        disconnected = [r for r in results if isinstance(r, WebSocket)]
-        for r in results:
-            if isinstance(r, BaseException):
-                _log.error("Unexpected error during broadcast: %s", r)
-
+        disconnected = await _send_all(session_id, clients, payload)
         if disconnected:
             await self._remove_dead(session_id, disconnected)
 
@@ -76,12 +90,19 @@ class ConnectionManager:
             for ws in dead:
                 if ws in session_clients:
                     session_clients.remove(ws)
-            if not session_clients:
-                self._connections.pop(session_id, None)
+            self._sync_count(session_id, session_clients)
+
+    def _sync_count(self, session_id: str, clients: list[WebSocket]) -> None:
+        """Refresh the cached count after a removal; caller must hold the lock."""
+        if clients:
+            self._counts[session_id] = len(clients)
+            return
+        self._connections.pop(session_id, None)
+        self._counts.pop(session_id, None)
 
     def client_count(self, session_id: str) -> int:
         """Return number of connected clients for a session."""
-        return len(self._connections.get(session_id, []))
+        return self._counts.get(session_id, 0)
 
     def active_sessions(self) -> list[str]:
         """Return list of session IDs with active connections."""
@@ -0,0 +1,69 @@
+"""Background tool-list-changed notifications for the MCP server.
+
+Dependencies: (stdlib only)
+Wired in: server/mcp_server.py → approval_decide()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Callable
+from typing import Any
+
+_LOG = logging.getLogger(__name__)
+
+# Strong references keep fire-and-forget notification tasks alive until done.
+_notification_tasks: set[asyncio.Task[bool]] = set()
+
+# (server, notify callable, is coroutine function) for the last server seen.
+_notifier_cache: tuple[Any, Callable[[], Any] | None, bool] | None = None
+
+
+def _resolve_notifier(server: Any) -> tuple[Callable[[], Any] | None, bool]:
+    """Return the server's tool-list notifier and whether it must be awaited.
+
+    Reflection runs once per server object; approval decisions reuse it.
+    """
+    global _notifier_cache
+    cached = _notifier_cache
+    if cached is not None and cached[0] is server:
+        return cached[1], cached[2]
+    notify = getattr(server, "notify_tool_list_changed", None)
+    is_async = notify is not None and inspect.iscoroutinefunction(notify)
+    _notifier_cache = (server, notify, is_async)
+    return notify, is_async
+
+
+async def _emit_tool_list_changed(server: Any) -> bool:
+    notify, is_async = _resolve_notifier(server)
+    if notify is None:
+        return False
+
+    try:
+        if is_async:
+            await notify()
+        else:
+            result = notify()
+            # Sync wrappers may still hand back an awaitable.
+            if inspect.isawaitable(result):
+                await result
+        return True
+    except Exception:
+        _LOG.exception("Failed to emit approval state notification")
+        return False
+
+
+def schedule_tool_list_changed(server: Any | None) -> bool:
+    """Emit the notification in the background; return whether one was scheduled.
+
+    Servers without a ``notify_tool_list_changed`` hook get no task and
+    report ``False``, since nothing would be sent.
+    """
+    if server is None or _resolve_notifier(server)[0] is None:
+        return False
+    task = asyncio.create_task(_emit_tool_list_changed(server))
+    _notification_tasks.add(task)
+    task.add_done_callback(_notification_tasks.discard)
+    return True
@@ -5,37 +5,65 @@ Phase 2 — skill servers auto-discovered from ``skills/`` directory.
 
 Skill tools are registered with lazy-loading: they start hidden and are
 enabled when the associated topic is activated (via :class:`SkillActivator`).
+
+The process-wide server is built on first access to ``mcp`` (or
+``skill_activator``) rather than at import, so importing the tool handlers
+does not pull in fastmcp and the skill-provider graph.
 """
 
 from __future__ import annotations
 
-import inspect
 import logging
 import os
+import threading
 import time
 from importlib import import_module
 from pathlib import Path
 from typing import Any, cast
 
 from autopoiesis.agent.runtime import Runtime, get_runtime
+from autopoiesis.server.change_signal import approval_state_changed
+from autopoiesis.server.mcp_notify import schedule_tool_list_changed
 from autopoiesis.server.mcp_tools import (
     agent_config_summaries,
     decide_approval,
     json_envelope,
     missing_runtime_envelope,
-    pending_approvals,
-    pending_count,
+    pending_snapshot,
     runtime_error_envelope,
     runtime_version,
 )
 
 _LOG = logging.getLogger(__name__)
 
-_SERVER_STARTED_AT = time.monotonic()
+# Set when the server is built (or on the first uptime read) rather than at
+# import, so importing the tool handlers has no clock side effect.
+_server_started_at: float | None = None
+
+#: Number of pending approvals embedded in ``dashboard.status`` as a preview.
+_DASHBOARD_PREVIEW_LIMIT = 5
+
+_UNSET: Any = object()
+_mcp: Any = _UNSET
+# Serialises first-use construction so concurrent importers (app startup,
+# topic activation threads) never build and register skills twice.
+_mcp_lock = threading.Lock()
 
 #: Global SkillActivator for the singleton MCP server instance.
-#: Set during ``create_mcp_server()`` and used by topic-activation wiring.
-skill_activator: Any | None = None
+#: Set during ``create_mcp_server()`` and read as ``skill_activator`` by
+#: topic-activation wiring.
+_skill_activator: Any | None = None
+
+
+def _mark_server_started() -> float:
+    global _server_started_at
+    if _server_started_at is None:
+        _server_started_at = time.monotonic()
+    return _server_started_at
+
+
+def _uptime_seconds() -> int:
+    return int(time.monotonic() - _mark_server_started())
 
 
 def _runtime_for_tool(tool: str) -> tuple[Runtime | None, str | None]:
@@ -45,50 +73,41 @@ def _runtime_for_tool(tool: str) -> tuple[Runtime | None, str | None]:
         return None, runtime_error_envelope(tool, exc)
 
 
-async def _emit_approval_state_notification() -> bool:
-    if mcp is None:
-        return False
-    notify = getattr(mcp, "notify_tool_list_changed", None)
-    if notify is None:
-        return False
-
-    try:
-        result = notify()
-        if inspect.isawaitable(result):
-            await result
-        return True
-    except Exception:
-        _LOG.exception("Failed to emit approval state notification")
-        return False
-
-
 def dashboard_status() -> str:
-    """Return runtime health and pending approval count."""
+    """Return runtime health, pending approval count, and a short pending preview."""
     runtime, error = _runtime_for_tool("dashboard.status")
     if error is not None:
         return error
     if runtime is None:
         return missing_runtime_envelope("dashboard.status")
 
+    count, preview = pending_snapshot(
+        runtime, limit=_DASHBOARD_PREVIEW_LIMIT, include_requests=False
+    )
     data = {
         "initialized": True,
         "agent_name": runtime.agent_name,
         "shell_tier": runtime.shell_tier,
         "approval_unlocked": runtime.approval_unlocked,
-        "pending_approvals_count": pending_count(runtime),
+        "pending_approvals_count": count,
+        "pending_approvals_preview": preview,
     }
     return json_envelope("dashboard.status", data, tool="dashboard.status")
 
 
-def approval_list() -> str:
-    """Return pending approval envelopes."""
+def approval_list(include_requests: bool = True) -> str:
+    """Return pending approval envelopes.
+
+    Pass ``include_requests=False`` when only ids and tool counts are needed;
+    the per-envelope tool-call JSON is then never parsed.
+    """
     runtime, error = _runtime_for_tool("approval.list")
     if error is not None:
         return error
     if runtime is None:
         return missing_runtime_envelope("approval.list")
 
-    pending = pending_approvals(runtime)
+    _, pending = pending_snapshot(runtime, include_requests=include_requests)
     data = {"count": len(pending), "items": pending}
     return json_envelope("approval.list", data, tool="approval.list")
 
@@ -109,12 +128,13 @@ async def approval_decide(approval_id: str, approved: bool, reason: str | None =
             tool="approval.decide",
         )
 
-    emitted = await _emit_approval_state_notification()
+    approval_state_changed.notify()
+    scheduled = schedule_tool_list_changed(get_mcp_server())
     return json_envelope(
         "approval.decision",
         decision,
         tool="approval.decide",
-        meta={"notification_emitted": emitted},
+        meta={"notification_emitted": scheduled},
     )
 
 
@@ -126,10 +146,9 @@ def system_info() -> str:
     if runtime is None:
         return missing_runtime_envelope("system.info")
 
-    uptime_seconds = int(time.monotonic() - _SERVER_STARTED_AT)
     data = {
         "version": runtime_version(),
-        "uptime_seconds": uptime_seconds,
+        "uptime_seconds": _uptime_seconds(),
         "agent_name": runtime.agent_name,
         "agent_configs": agent_config_summaries(),
     }
@@ -150,11 +169,17 @@ def _load_fastmcp_class() -> type[Any] | None:
     return cast(type[Any], fastmcp_class)
 
 
+_CORE_TOOLS: tuple[tuple[str, Any], ...] = (
+    ("dashboard.status", dashboard_status),
+    ("approval.list", approval_list),
+    ("approval.decide", approval_decide),
+    ("system.info", system_info),
+)
+
+
 def _register_tools(server: Any) -> None:
-    server.tool(name="dashboard.status")(dashboard_status)
-    server.tool(name="approval.list")(approval_list)
-    server.tool(name="approval.decide")(approval_decide)
-    server.tool(name="system.info")(system_info)
+    for name, handler in _CORE_TOOLS:
+        server.tool(name=name)(handler)
 
 
 def _resolve_skills_root() -> Path:
@@ -180,7 +205,7 @@ def _register_skill_providers(server: Any, skills_root: Path) -> list[str]:
             register_skill_providers,
         )
         from autopoiesis.skills.skill_transforms import (
-            make_skill_disable_transform,
+            make_skills_disable_transform,
         )
     except ImportError:
         _LOG.warning("Skill provider modules not available; skill tools will not be registered.")
@@ -189,9 +214,9 @@ def _register_skill_providers(server: Any, skills_root: Path) -> list[str]:
     registered = register_skill_providers(server, skills_root)
 
     # Lazy loading: disable each skill's tools until explicitly activated.
+    for transform in make_skills_disable_transform(registered):
+        server.add_transform(transform)
     for skill_name in registered:
-        for transform in make_skill_disable_transform(skill_name):
-            server.add_transform(transform)
         _LOG.info("Skill '%s' registered (tools hidden until activated)", skill_name)
 
     return registered
@@ -208,13 +233,14 @@ def create_mcp_server(
         skills_root: Optional override for the ``skills/`` root directory.
             Defaults to the repo's ``skills/`` directory.
     """
-    global skill_activator
+    global _skill_activator
 
     server_class = fastmcp_class if fastmcp_class is not None else _load_fastmcp_class()
     if server_class is None:
         return None
 
     server = server_class("autopoiesis")
+    _mark_server_started()
     _register_tools(server)
 
     # Phase 2: register skill server providers with lazy loading.
@@ -225,11 +251,28 @@ def create_mcp_server(
         try:
             from autopoiesis.skills.skill_activator import SkillActivator
 
-            skill_activator = SkillActivator(server, resolved_skills_root)
+            _skill_activator = SkillActivator(server, resolved_skills_root)
         except ImportError:
             _LOG.warning("SkillActivator not available; topic-based skill activation disabled.")
 
     return server
 
 
-mcp = create_mcp_server()
+def get_mcp_server() -> Any | None:
+    """Return the process-wide MCP server, creating it on first use."""
+    global _mcp
+    if _mcp is _UNSET:
+        with _mcp_lock:
+            if _mcp is _UNSET:
+                _mcp = create_mcp_server()
+    return _mcp
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: defer server construction until ``mcp`` is actually needed.
+    if name == "mcp":
+        return get_mcp_server()
+    if name == "skill_activator":
+        get_mcp_server()
+        return _skill_activator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
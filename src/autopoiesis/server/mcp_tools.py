@@ -4,24 +4,64 @@ from __future__ import annotations
 
 import json
 import logging
-from contextlib import closing
+import sqlite3
+import time
 from datetime import UTC, datetime
+from functools import lru_cache
 from importlib.metadata import PackageNotFoundError, version
 from pathlib import Path
-from sqlite3 import Row
 from typing import Any, cast
 
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+
 from autopoiesis.agent.runtime import Runtime
-from autopoiesis.db import open_db
 from autopoiesis.infra.approval.store_schema import utc_now_epoch
+from autopoiesis.infra.approval.types import DeferredToolCall
+from autopoiesis.server.approval_db import (
+    DECIDE_SQL,
+    PENDING_COUNT_FALLBACK_SQL,
+    PENDING_COUNT_SQL,
+    PENDING_ROWS_SQL,
+    PENDING_SUMMARY_SQL,
+    approval_connection,
+    approval_db_path,
+    note_local_write,
+    write_token,
+)
 
 _LOG = logging.getLogger(__name__)
 
 _DEFAULT_VERSION = "0.1.0"
 
+# json.dumps() builds a fresh JSONEncoder whenever a non-default option such as
+# allow_nan=False is passed; envelopes are encoded on every tool call.  The MCP
+# transport is UTF-8, so non-ASCII is emitted verbatim instead of escaped, and
+# envelopes are freshly built trees, so the circular-reference check is skipped.
+_ENCODER = json.JSONEncoder(ensure_ascii=False, check_circular=False, allow_nan=False)
+
+_timestamp_cache: tuple[int, str] = (0, "")
+
+# Strict so non-string ids fall through to the lenient parser's str() coercion.
+_TOOL_CALLS_ADAPTER = TypeAdapter(list[DeferredToolCall], config=ConfigDict(strict=True))
+
+# Dashboards poll the pending list far more often than approvals change, so
+# snapshots are reused until the approval DB's write token moves.
+_snapshot_cache: dict[
+    tuple[Path, int | None, bool], tuple[tuple[int, int], tuple[int, list[dict[str, Any]]]]
+] = {}
+
 
 def _utc_now_iso() -> str:
-    return datetime.now(UTC).isoformat()
+    # Envelope timestamps only need second granularity; bursts of tool calls
+    # within one second share a single formatted string.
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, cached_text = _timestamp_cache
+    if cached_second == now:
+        return cached_text
+    text = datetime.fromtimestamp(now, UTC).isoformat()
+    _timestamp_cache = (now, text)
+    return text
 
 
 def json_envelope(
@@ -34,8 +74,7 @@ def json_envelope(
     envelope_meta: dict[str, Any] = {"tool": tool, "timestamp": _utc_now_iso()}
     if meta:
         envelope_meta.update(meta)
-    payload = {"type": envelope_type, "data": data, "meta": envelope_meta}
-    return json.dumps(payload, ensure_ascii=True, allow_nan=False)
+    return _ENCODER.encode({"type": envelope_type, "data": data, "meta": envelope_meta})
 
 
 def runtime_error_envelope(tool: str, error: RuntimeError) -> str:
@@ -54,14 +93,7 @@ def missing_runtime_envelope(tool: str) -> str:
     )
 
 
-def approval_db_path(runtime: Runtime) -> Path:
-    path = getattr(runtime.approval_store, "_db_path", None)
-    if isinstance(path, Path):
-        return path
-    raise RuntimeError("Approval store database path is unavailable.")
-
-
-def parse_tool_calls(raw_value: str) -> list[dict[str, Any]]:
+def _parse_tool_calls_lenient(raw_value: str) -> list[dict[str, Any]]:
     try:
         parsed = json.loads(raw_value)
     except json.JSONDecodeError:
@@ -87,49 +119,81 @@ def parse_tool_calls(raw_value: str) -> list[dict[str, Any]]:
     return requests
 
 
-def _pending_rows(runtime: Runtime) -> list[Row]:
-    with closing(open_db(approval_db_path(runtime))) as conn:
-        return cast(
-            list[Row],
-            conn.execute(
-                """
-                SELECT envelope_id, nonce, plan_hash, tool_calls_json, issued_at, expires_at
-                FROM approval_envelopes
-                WHERE state = 'pending'
-                ORDER BY issued_at ASC
-                """
-            ).fetchall(),
+def parse_tool_calls(raw_value: str) -> list[dict[str, Any]]:
+    # Well-formed rows (everything ApprovalStore writes) are parsed and checked
+    # in one pass by pydantic-core; anything else takes the lenient path,
+    # which coerces or drops malformed entries.
+    try:
+        return cast(list[dict[str, Any]], _TOOL_CALLS_ADAPTER.validate_json(raw_value))
+    except ValidationError:
+        return _parse_tool_calls_lenient(raw_value)
+
+
+def _read_pending_count(conn: sqlite3.Connection) -> int:
+    row = conn.execute(PENDING_COUNT_SQL).fetchone()
+    if row is None:
+        row = conn.execute(PENDING_COUNT_FALLBACK_SQL).fetchone()
+    return int(row[0]) if row is not None else 0
+
+
+def _approval_item(row: tuple[Any, ...], *, include_requests: bool) -> dict[str, Any]:
+    envelope_id, nonce, plan_hash_prefix, issued_at, expires_at, tail = row
+    item: dict[str, Any] = {
+        "id": str(envelope_id),
+        "nonce": str(nonce),
+        "plan_hash_prefix": str(plan_hash_prefix),
+        "issued_at": int(issued_at),
+        "expires_at": int(expires_at),
+    }
+    if include_requests:
+        # ``tail`` is the raw tool_calls_json column.
+        requests = parse_tool_calls(str(tail))
+        item["tool_count"] = len(requests)
+        item["requests"] = requests
+    else:
+        # ``tail`` is the SQL-computed tool_count.
+        item["tool_count"] = int(tail)
+    return item
+
+
+def _read_snapshot(
+    conn: sqlite3.Connection, *, limit: int | None, include_requests: bool
+) -> tuple[int, list[dict[str, Any]]]:
+    query = PENDING_ROWS_SQL if include_requests else PENDING_SUMMARY_SQL
+    conn.execute("BEGIN")
+    try:
+        count = _read_pending_count(conn)
+        rows = cast(
+            list[tuple[Any, ...]],
+            conn.execute(query, (-1 if limit is None else limit,)).fetchall(),
         )
+    finally:
+        conn.execute("COMMIT")
+    return count, [_approval_item(row, include_requests=include_requests) for row in rows]
 
 
-def pending_count(runtime: Runtime) -> int:
-    with closing(open_db(approval_db_path(runtime))) as conn:
-        row = conn.execute(
-            """
-            SELECT COUNT(*) AS pending_count
-            FROM approval_envelopes
-            WHERE state = 'pending'
-            """
-        ).fetchone()
-    return int(row["pending_count"]) if row is not None else 0
-
-
-def pending_approvals(runtime: Runtime) -> list[dict[str, Any]]:
-    approvals: list[dict[str, Any]] = []
-    for row in _pending_rows(runtime):
-        requests = parse_tool_calls(str(row["tool_calls_json"]))
-        approvals.append(
-            {
-                "id": str(row["envelope_id"]),
-                "nonce": str(row["nonce"]),
-                "plan_hash_prefix": str(row["plan_hash"])[:8],
-                "issued_at": int(row["issued_at"]),
-                "expires_at": int(row["expires_at"]),
-                "tool_count": len(requests),
-                "requests": requests,
-            }
-        )
-    return approvals
+def pending_snapshot(
+    runtime: Runtime,
+    *,
+    limit: int | None = None,
+    include_requests: bool = True,
+) -> tuple[int, list[dict[str, Any]]]:
+    """Return the pending count and up to *limit* pending approvals.
+
+    Both reads share one connection and one read transaction, so the count
+    and the rows describe the same snapshot.  ``include_requests=False``
+    skips tool-call parsing.  Results are cached until the approval DB is
+    written to; callers must treat the returned items as read-only.
+    """
+    key = (approval_db_path(runtime), limit, include_requests)
+    with approval_connection(runtime) as conn:
+        token = write_token(conn)
+        cached = _snapshot_cache.get(key)
+        if cached is not None and cached[0] == token:
+            return cached[1]
+        snapshot = _read_snapshot(conn, limit=limit, include_requests=include_requests)
+        _snapshot_cache[key] = (token, snapshot)
+    return snapshot
 
 
 def decide_approval(
@@ -139,50 +203,44 @@ def decide_approval(
     approved: bool,
     reason: str | None,
 ) -> dict[str, Any] | None:
-    with closing(open_db(approval_db_path(runtime))) as conn, conn:
-        row = conn.execute(
-            """
-            SELECT envelope_id, nonce, plan_hash
-            FROM approval_envelopes
-            WHERE state = 'pending'
-              AND (envelope_id = ? OR nonce = ?)
-            """,
-            (approval_id, approval_id),
-        ).fetchone()
-        if row is None:
-            return None
-
-        now = utc_now_epoch()
-        next_state = "consumed" if approved else "expired"
-        decision_record = {
-            "source": "mcp.phase1",
-            "approved": approved,
-            "reason": reason,
-            "decided_at": now,
-        }
-        conn.execute(
-            """
-            UPDATE approval_envelopes
-            SET state = ?, consumed_at = ?, signed_object_json = ?
-            WHERE envelope_id = ? AND state = 'pending'
-            """,
-            (
-                next_state,
-                now,
-                json.dumps(decision_record, ensure_ascii=True, allow_nan=False),
-                str(row["envelope_id"]),
-            ),
-        )
+    now = utc_now_epoch()
+    next_state = "consumed" if approved else "expired"
+    decision_record = {
+        "source": "mcp.phase1",
+        "approved": approved,
+        "reason": reason,
+        "decided_at": now,
+    }
+    with approval_connection(runtime) as conn:
+        # A single UPDATE ... RETURNING is atomic on its own; fetchall() steps
+        # the statement to completion so the autocommit write is released.
+        rows = conn.execute(
+            DECIDE_SQL,
+            {
+                "state": next_state,
+                "consumed_at": now,
+                "record": _ENCODER.encode(decision_record),
+                "approval_id": approval_id,
+            },
+        ).fetchall()
+        if rows:
+            note_local_write()
+    if not rows:
+        return None
+    assert len(rows) == 1, "DECIDE_SQL must update exactly one envelope"
+    envelope_id, nonce, plan_hash_prefix = rows[0]
     return {
-        "id": str(row["envelope_id"]),
-        "nonce": str(row["nonce"]),
+        "id": str(envelope_id),
+        "nonce": str(nonce),
         "state": next_state,
         "approved": approved,
-        "plan_hash_prefix": str(row["plan_hash"])[:8],
+        "plan_hash_prefix": str(plan_hash_prefix),
     }
 
 
+@lru_cache(maxsize=1)
 def runtime_version() -> str:
+    # Package metadata cannot change while the process runs; resolve it once.
     try:
         return version("autopoiesis")
     except PackageNotFoundError:
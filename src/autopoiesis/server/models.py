@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import UTC, datetime
+from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from pydantic import BaseModel, Field
@@ -28,7 +29,7 @@ class SessionInfo(BaseModel):
     """Session metadata returned by list/create endpoints."""
 
     id: str
-    created_at: datetime = Field(default_factory=lambda: datetime.now(UTC))
+    created_at: datetime
     message_count: int = 0
 
 
@@ -48,6 +49,8 @@ class HealthResponse(BaseModel):
 
 # --- WebSocket models ---
 
+_STATIC_FRAME_CACHE_SIZE = 128
+
 
 class WSIncoming(BaseModel):
     """Incoming WebSocket message from client."""
@@ -61,3 +64,18 @@ class WSOutgoing(BaseModel):
 
     op: str
     data: dict[str, Any] = Field(default_factory=dict)
+
+    def to_json(self) -> str:
+        """Serialize for the wire, reusing cached frames for payload-free ops.
+
+        Signals such as ``done`` or ``thinking_start`` repeat on every turn
+        with an empty ``data`` dict, so their JSON is computed once per op.
+        """
+        if not self.data:
+            return _static_frame_json(self.op)
+        return self.model_dump_json()
+
+
+@lru_cache(maxsize=_STATIC_FRAME_CACHE_SIZE)
+def _static_frame_json(op: str) -> str:
+    return WSOutgoing(op=op).model_dump_json()
@@ -4,15 +4,24 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import logging
+from secrets import token_hex
 from typing import Any
-from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect, status
 from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
 
+from autopoiesis.agent import runtime as agent_runtime
+from autopoiesis.agent import worker as agent_worker
 from autopoiesis.agent.worker import DeferredApprovalLockedError
+from autopoiesis.display import streaming
+from autopoiesis.models import (
+    WorkItem,
+    WorkItemInput,
+    WorkItemOutput,
+    WorkItemPriority,
+    WorkItemType,
+)
 from autopoiesis.server.auth import verify_api_key, verify_ws_api_key
 from autopoiesis.server.connections import ConnectionManager
 from autopoiesis.server.models import (
@@ -25,6 +34,7 @@ from autopoiesis.server.models import (
     WSOutgoing,
 )
 from autopoiesis.server.sessions import SessionStore
+from autopoiesis.server.stream_handle import WebSocketStreamHandle
 
 _log = logging.getLogger(__name__)
 
@@ -34,6 +44,12 @@ _APPROVAL_UNSUPPORTED: dict[str, str] = {
     "code": "approval_unsupported",
     "message": "Deferred approvals are not supported in server mode yet.",
 }
+# Fixed error replies are serialized once; they repeat on every bad frame.
+_APPROVAL_UNSUPPORTED_FRAME = WSOutgoing(op="error", data=_APPROVAL_UNSUPPORTED).model_dump_json()
+_INVALID_FORMAT_FRAME = WSOutgoing(
+    op="error", data={"message": "Invalid message format"}
+).model_dump_json()
+_EMPTY_MESSAGE_FRAME = WSOutgoing(op="error", data={"message": "Empty message"}).model_dump_json()
 # These are set by ``configure_routes`` before the app starts serving.
 _sessions: SessionStore
 _manager: ConnectionManager
@@ -48,11 +64,36 @@ def configure_routes(sessions: SessionStore, manager: ConnectionManager) -> None
 
 def _serialize_messages_for_api(messages: list[ModelMessage]) -> list[dict[str, Any]]:
     """Convert ModelMessages to JSON-serializable dicts for the API."""
-    raw = ModelMessagesTypeAdapter.dump_json(messages)
-    result: list[dict[str, Any]] = json.loads(raw)
+    # mode="json" yields JSON-safe builtins straight from pydantic-core,
+    # skipping the encode-to-bytes and re-parse round trip.
+    result: list[dict[str, Any]] = ModelMessagesTypeAdapter.dump_python(messages, mode="json")
     return result
 
 
+async def _run_chat_turn(session_id: str, content: str) -> WorkItemOutput:
+    """Run one chat turn through the worker, streaming to the session's sockets.
+
+    Worker and runtime functions are looked up on their modules at call time
+    so tests can patch them there.
+    """
+    agent_runtime.get_runtime()  # Verify runtime is initialized
+    history_json = _sessions.get_history_json(session_id)
+    ws_handle = WebSocketStreamHandle(session_id, _manager, asyncio.get_running_loop())
+    item = WorkItem(
+        type=WorkItemType.CHAT,
+        priority=WorkItemPriority.NORMAL,
+        input=WorkItemInput(prompt=content, message_history_json=history_json),
+    )
+    streaming.register_stream(item.id, ws_handle)
+    output = await asyncio.to_thread(agent_worker.enqueue_and_wait, item)
+    # Queued token/tool frames must reach clients before the caller sends done.
+    await ws_handle.drained()
+    _sessions.set_history_json(
+        session_id, output.message_history_json, message_count=output.message_count
+    )
+    return output
+
+
 # --- Health ---
 
 
@@ -123,33 +164,12 @@ def delete_session(session_id: str) -> None:
 )
 async def chat(request: ChatRequest) -> ChatResponse:
     """Submit a message and get a non-streaming response."""
-    session_id = request.session_id or uuid4().hex
+    session_id = request.session_id or token_hex(16)
     if not _sessions.exists(session_id):
         _sessions.create(session_id)
 
     try:
-        from autopoiesis.agent.runtime import get_runtime
-        from autopoiesis.agent.worker import enqueue_and_wait
-        from autopoiesis.display.streaming import register_stream
-        from autopoiesis.models import WorkItem, WorkItemInput, WorkItemPriority, WorkItemType
-        from autopoiesis.server.stream_handle import WebSocketStreamHandle
-
-        get_runtime()  # Verify runtime is initialized
-        history_json = _sessions.get_history_json(session_id)
-
-        loop = asyncio.get_running_loop()
-        ws_handle = WebSocketStreamHandle(session_id, _manager, loop)
-        item = WorkItem(
-            type=WorkItemType.CHAT,
-            priority=WorkItemPriority.NORMAL,
-            input=WorkItemInput(
-                prompt=request.content,
-                message_history_json=history_json,
-            ),
-        )
-        register_stream(item.id, ws_handle)
-        output = await asyncio.to_thread(enqueue_and_wait, item)
-        _sessions.set_history_json(session_id, output.message_history_json)
+        output = await _run_chat_turn(session_id, request.content)
         if output.deferred_tool_requests_json:
             raise HTTPException(status_code=409, detail=_APPROVAL_UNSUPPORTED)
         return ChatResponse(
@@ -165,6 +185,22 @@ async def chat(request: ChatRequest) -> ChatResponse:
 # --- WebSocket ---
 
 
+async def _receive_frame(websocket: WebSocket) -> str | bytes:
+    """Return the next client frame as sent, text or binary.
+
+    Binary frames go straight to the JSON parser without a UTF-8 decode;
+    ``receive_text`` would reject them outright.
+    """
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", 1000), message.get("reason"))
+    text: str | None = message.get("text")
+    if text is not None:
+        return text
+    raw: bytes = message.get("bytes") or b""
+    return raw
+
+
 @router.websocket("/api/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str) -> None:
     """Bidirectional WebSocket for streaming chat."""
@@ -178,12 +214,11 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str) -> None:
     await _manager.connect(session_id, websocket)
     try:
         while True:
-            raw = await websocket.receive_text()
+            raw = await _receive_frame(websocket)
             try:
                 msg = WSIncoming.model_validate_json(raw)
             except Exception:
-                err = WSOutgoing(op="error", data={"message": "Invalid message format"})
-                await websocket.send_text(err.model_dump_json())
+                await websocket.send_text(_INVALID_FORMAT_FRAME)
                 continue
 
             if msg.op == "message":
@@ -212,40 +247,13 @@ async def _handle_message(
     """Process an incoming chat message via the agent."""
     content = data.get("content", "")
     if not content:
-        await websocket.send_text(
-            WSOutgoing(op="error", data={"message": "Empty message"}).model_dump_json()
-        )
+        await websocket.send_text(_EMPTY_MESSAGE_FRAME)
         return
 
     try:
-        from autopoiesis.agent.runtime import get_runtime
-        from autopoiesis.agent.worker import enqueue_and_wait
-        from autopoiesis.display.streaming import register_stream
-        from autopoiesis.models import WorkItem, WorkItemInput, WorkItemPriority, WorkItemType
-        from autopoiesis.server.stream_handle import WebSocketStreamHandle
-
-        get_runtime()  # Verify runtime is initialized
-        history_json = _sessions.get_history_json(session_id)
-        loop = asyncio.get_running_loop()
-        ws_handle = WebSocketStreamHandle(session_id, _manager, loop)
-
-        item = WorkItem(
-            type=WorkItemType.CHAT,
-            priority=WorkItemPriority.NORMAL,
-            input=WorkItemInput(
-                prompt=content,
-                message_history_json=history_json,
-            ),
-        )
-        register_stream(item.id, ws_handle)
-        output = await asyncio.to_thread(enqueue_and_wait, item)
-        _sessions.set_history_json(session_id, output.message_history_json)
-
+        output = await _run_chat_turn(session_id, content)
         if output.deferred_tool_requests_json:
-            await _manager.broadcast(
-                session_id,
-                WSOutgoing(op="error", data=_APPROVAL_UNSUPPORTED),
-            )
+            await _manager.broadcast_json(session_id, _APPROVAL_UNSUPPORTED_FRAME)
         elif output.text:
             # Final text already streamed via tokens; send done
             await _manager.broadcast(
@@ -253,10 +261,7 @@ async def _handle_message(
                 WSOutgoing(op="done", data={"content": output.text}),
             )
     except DeferredApprovalLockedError:
-        await _manager.broadcast(
-            session_id,
-            WSOutgoing(op="error", data=_APPROVAL_UNSUPPORTED),
-        )
+        await _manager.broadcast_json(session_id, _APPROVAL_UNSUPPORTED_FRAME)
         return
     except RuntimeError as exc:
         await _manager.broadcast(
@@ -271,7 +276,4 @@ async def _handle_approve(
 ) -> None:
     """Reject WebSocket approval calls until signed server approval exists."""
     _ = data
-    await _manager.broadcast(
-        session_id,
-        WSOutgoing(op="error", data=_APPROVAL_UNSUPPORTED),
-    )
+    await _manager.broadcast_json(session_id, _APPROVAL_UNSUPPORTED_FRAME)
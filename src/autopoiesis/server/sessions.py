@@ -2,74 +2,128 @@
 
 from __future__ import annotations
 
+import heapq
+import json
 import threading
+import time
 from datetime import UTC, datetime
-from uuid import uuid4
+from secrets import token_hex
+from typing import cast
 
 from pydantic_ai.messages import ModelMessage, ModelMessagesTypeAdapter
 
 from autopoiesis.server.models import SessionInfo
 
+# Number of write locks the store spreads sessions across.
+_LOCK_SHARDS = 16
+
+
+def warm_message_adapter() -> None:
+    """Build the message (de)serializer ahead of the first history request.
+
+    pydantic-ai declares ``ModelMessagesTypeAdapter`` with ``defer_build``,
+    so without this the first request to touch history pays the schema
+    build.  Called from the server lifespan rather than at import so the
+    CLI, which shares the adapter, keeps its startup cost unchanged.
+    """
+    ModelMessagesTypeAdapter.rebuild()
+
+
+def _count_messages(history_json: str) -> int:
+    """Count top-level history entries.
+
+    The worker produces this JSON with ``ModelMessagesTypeAdapter``, so a
+    plain decode is enough; full model validation happens only when the
+    messages themselves are requested.
+    """
+    parsed: object = json.loads(history_json)
+    return len(cast(list[object], parsed)) if isinstance(parsed, list) else 0
+
 
 class SessionStore:
     """Thread-safe in-memory session manager.
 
-    Stores session metadata and serialized message history.
+    Stores session metadata and serialized message history.  Writes take a
+    per-session shard lock so concurrent sessions rarely contend; reads are
+    single dict operations, which are atomic under the GIL, and take no lock.
     """
 
     def __init__(self) -> None:
         self._sessions: dict[str, SessionInfo] = {}
         self._history: dict[str, str | None] = {}
-        self._last_active: dict[str, datetime] = {}
-        self._lock = threading.Lock()
-
-    def _touch(self, session_id: str) -> None:
-        """Update the last-active timestamp for a session (caller holds lock)."""
-        self._last_active[session_id] = datetime.now(UTC)
+        # time.monotonic() of the last activity: immune to wall-clock jumps
+        # and compared as plain floats by the sweeper.
+        self._last_active: dict[str, float] = {}
+        self._locks = tuple(threading.Lock() for _ in range(_LOCK_SHARDS))
+        # Per-shard min-heaps of (last_active, session_id), guarded by the
+        # shard lock.  Every touch pushes a new entry instead of updating the
+        # old one; entries whose timestamp no longer matches ``_last_active``
+        # are discarded when popped.
+        self._expiry: tuple[list[tuple[float, str]], ...] = tuple([] for _ in range(_LOCK_SHARDS))
+
+    def _lock_for(self, session_id: str) -> threading.Lock:
+        """Return the shard lock guarding *session_id*'s entries."""
+        return self._locks[hash(session_id) % _LOCK_SHARDS]
+
+    def _touch(self, session_id: str, when: float) -> None:
+        """Record activity at monotonic time *when* (caller holds the session's lock)."""
+        self._last_active[session_id] = when
+        heapq.heappush(self._expiry[hash(session_id) % _LOCK_SHARDS], (when, session_id))
 
     def create(self, session_id: str | None = None) -> SessionInfo:
         """Create a new session, returning its metadata."""
-        sid = session_id or uuid4().hex
+        sid = session_id or token_hex(16)
         info = SessionInfo(id=sid, created_at=datetime.now(UTC), message_count=0)
-        with self._lock:
+        with self._lock_for(sid):
             self._sessions[sid] = info
             self._history[sid] = None
-            self._touch(sid)
+            self._touch(sid, time.monotonic())
         return info
 
     def get(self, session_id: str) -> SessionInfo | None:
         """Return session info or None if not found."""
-        with self._lock:
-            return self._sessions.get(session_id)
+        return self._sessions.get(session_id)
 
     def list_all(self) -> list[SessionInfo]:
         """Return all sessions."""
-        with self._lock:
-            return list(self._sessions.values())
+        return list(self._sessions.values())
 
     def delete(self, session_id: str) -> bool:
         """Delete a session. Returns True if it existed."""
-        with self._lock:
-            existed = session_id in self._sessions
-            self._sessions.pop(session_id, None)
-            self._history.pop(session_id, None)
-            self._last_active.pop(session_id, None)
-            return existed
+        with self._lock_for(session_id):
+            return self._drop(session_id)
+
+    def _drop(self, session_id: str) -> bool:
+        """Remove every entry for *session_id* (caller holds its lock)."""
+        existed = self._sessions.pop(session_id, None) is not None
+        self._history.pop(session_id, None)
+        self._last_active.pop(session_id, None)
+        return existed
 
     def get_history_json(self, session_id: str) -> str | None:
         """Return raw history JSON for a session."""
-        with self._lock:
-            return self._history.get(session_id)
+        return self._history.get(session_id)
 
-    def set_history_json(self, session_id: str, history_json: str | None) -> None:
-        """Update stored history JSON and message count."""
-        with self._lock:
+    def set_history_json(
+        self,
+        session_id: str,
+        history_json: str | None,
+        message_count: int | None = None,
+    ) -> None:
+        """Update stored history JSON and message count.
+
+        Pass *message_count* when the caller already knows it (the worker
+        reports it with each turn); otherwise the history is decoded to count.
+        """
+        count = message_count
+        if count is None and history_json is not None:
+            count = _count_messages(history_json)
+        with self._lock_for(session_id):
             self._history[session_id] = history_json
-            self._touch(session_id)
+            self._touch(session_id, time.monotonic())
             info = self._sessions.get(session_id)
-            if info is not None and history_json is not None:
-                messages = ModelMessagesTypeAdapter.validate_json(history_json)
-                info.message_count = len(messages)
+            if info is not None and count is not None:
+                info.message_count = count
 
     def get_messages(self, session_id: str) -> list[ModelMessage]:
         """Parse and return message history for a session."""
@@ -80,13 +134,13 @@ class SessionStore:
 
     def exists(self, session_id: str) -> bool:
         """Check if a session exists."""
-        with self._lock:
-            return session_id in self._sessions
+        return session_id in self._sessions
 
     def backdate_last_active(self, session_id: str, timestamp: datetime) -> None:
         """Set last-active to *timestamp* (for testing)."""
-        with self._lock:
-            self._last_active[session_id] = timestamp
+        age = (datetime.now(UTC) - timestamp).total_seconds()
+        with self._lock_for(session_id):
+            self._touch(session_id, time.monotonic() - age)
 
     def remove_stale(
         self,
@@ -98,16 +152,31 @@ class SessionStore:
 
         Returns the list of removed session IDs.
         """
-        now = datetime.now(UTC)
+        cutoff = time.monotonic() - ttl_seconds
+        removed: list[str] = []
+        for lock, heap in zip(self._locks, self._expiry, strict=True):
+            with lock:
+                removed.extend(self._pop_expired(heap, cutoff, active_sessions))
+        return removed
+
+    def _pop_expired(
+        self,
+        heap: list[tuple[float, str]],
+        cutoff: float,
+        active_sessions: set[str],
+    ) -> list[str]:
+        """Evict sessions idle since before *cutoff* (caller holds the shard lock)."""
         removed: list[str] = []
-        with self._lock:
-            for sid in list(self._sessions):
-                if sid in active_sessions:
-                    continue
-                last = self._last_active.get(sid, self._sessions[sid].created_at)
-                if (now - last).total_seconds() > ttl_seconds:
-                    self._sessions.pop(sid, None)
-                    self._history.pop(sid, None)
-                    self._last_active.pop(sid, None)
-                    removed.append(sid)
+        kept: list[tuple[float, str]] = []
+        while heap and heap[0][0] < cutoff:
+            entry = heapq.heappop(heap)
+            last, sid = entry
+            if self._last_active.get(sid) != last:
+                continue  # superseded by a later touch, or already deleted
+            if sid in active_sessions:
+                kept.append(entry)  # still connected; re-check next sweep
+            elif self._drop(sid):
+                removed.append(sid)
+        for entry in kept:
+            heapq.heappush(heap, entry)
         return removed
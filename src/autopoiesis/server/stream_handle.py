@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import concurrent.futures
+import contextlib
+import json
 import logging
+import threading
 from typing import TYPE_CHECKING
 
 from autopoiesis.server.models import WSOutgoing
@@ -14,6 +17,18 @@ if TYPE_CHECKING:
 
 _log = logging.getLogger(__name__)
 
+# Token and thinking chunks arrive once per model token, so their frames are
+# assembled from fixed prefixes rather than built and dumped as a WSOutgoing.
+# The frames decode to the same JSON as ``WSOutgoing(...).model_dump_json()``.
+_encode_str = json.JSONEncoder(ensure_ascii=False).encode
+_TOKEN_FRAME_PREFIX = '{"op":"token","data":{"content":'
+_THINKING_FRAME_PREFIX = '{"op":"thinking","data":{"content":'
+_CONTENT_FRAME_SUFFIX = "}}"
+
+
+def _content_frame(prefix: str, chunk: str) -> str:
+    return prefix + _encode_str(chunk) + _CONTENT_FRAME_SUFFIX
+
 
 class WebSocketStreamHandle:
     """Stream handle that sends agent output over WebSocket.
@@ -36,22 +51,68 @@ class WebSocketStreamHandle:
         self._manager = manager
         self._loop = loop
         self._closed = False
+        # Frames queued for the event loop, in emission order.  Consecutive
+        # token chunks accumulate in ``_tokens`` and are sealed into a single
+        # ``token`` frame, so a burst of tokens costs one cross-thread hop.
+        self._frames: list[str] = []
+        self._tokens: list[str] = []
+        self._pending_lock = threading.Lock()
+        self._drain_scheduled = False
+        self._drain_future: concurrent.futures.Future[None] | None = None
 
     def _send(self, message: WSOutgoing) -> None:
-        """Schedule a broadcast on the event loop (thread-safe).
+        """Serialize *message* and schedule its broadcast (thread-safe)."""
+        if self._closed:
+            return
+        self._send_json(message.to_json())
+
+    def _send_json(self, payload: str) -> None:
+        """Queue a serialized frame for broadcast (thread-safe)."""
+        if self._closed:
+            return
+        with self._pending_lock:
+            self._seal_tokens()
+            self._frames.append(payload)
+            schedule = self._claim_drain()
+        if schedule:
+            self._schedule_drain()
+
+    def _seal_tokens(self) -> None:
+        """Turn buffered token chunks into one frame; caller holds the lock."""
+        if self._tokens:
+            self._frames.append(_content_frame(_TOKEN_FRAME_PREFIX, "".join(self._tokens)))
+            self._tokens.clear()
+
+    def _claim_drain(self) -> bool:
+        """Return ``True`` if the caller must schedule a drain; caller holds the lock."""
+        if self._drain_scheduled:
+            return False
+        self._drain_scheduled = True
+        return True
+
+    def _schedule_drain(self) -> None:
+        """Run :meth:`_drain` on the event loop.
 
         Errors are logged and the handle is marked closed on failure so
         subsequent calls become no-ops.
         """
-        if self._closed:
-            return
-        future = asyncio.run_coroutine_threadsafe(
-            self._manager.broadcast(self._session_id, message),
-            self._loop,
-        )
+        future = asyncio.run_coroutine_threadsafe(self._drain(), self._loop)
+        self._drain_future = future
         # Add a callback to catch and log errors instead of swallowing them.
         future.add_done_callback(self._on_send_done)
 
+    async def _drain(self) -> None:
+        """Broadcast queued frames in order until the queue is empty."""
+        while True:
+            with self._pending_lock:
+                self._seal_tokens()
+                frames, self._frames = self._frames, []
+                if not frames:
+                    self._drain_scheduled = False
+                    return
+            for frame in frames:
+                await self._manager.broadcast_json(self._session_id, frame)
+
     def _on_send_done(self, future: concurrent.futures.Future[None]) -> None:
         """Handle completed broadcast futures — log errors, mark dead."""
         exc = future.exception()
@@ -65,15 +126,39 @@ class WebSocketStreamHandle:
             self._closed = True
 
     def write(self, chunk: str) -> None:
-        """Send a token chunk to all connected clients."""
-        self._send(WSOutgoing(op="token", data={"content": chunk}))
+        """Send a token chunk to all connected clients.
 
-    def close(self) -> None:
-        """Signal streaming complete."""
+        Chunks written while an earlier broadcast is still pending are merged
+        into one ``token`` frame.
+        """
         if self._closed:
             return
+        with self._pending_lock:
+            self._tokens.append(chunk)
+            schedule = self._claim_drain()
+        if schedule:
+            self._schedule_drain()
+
+    def close(self) -> None:
+        """Signal streaming complete; already-buffered output is still delivered.
+
+        The terminal ``done`` frame is broadcast by the route once the work
+        item returns and :meth:`drained` completes, so nothing is queued here.
+        """
         self._closed = True
-        self._send(WSOutgoing(op="done", data={}))
+
+    async def drained(self) -> None:
+        """Wait until every frame queued before :meth:`close` has been broadcast.
+
+        Call on the event loop after the streaming thread has closed the
+        handle, so a terminal frame sent next cannot overtake queued output.
+        Broadcast failures are already logged by :meth:`_on_send_done`.
+        """
+        future = self._drain_future
+        if future is None:
+            return
+        with contextlib.suppress(Exception):
+            await asyncio.wrap_future(future)
 
     def start_tool_call(
         self,
@@ -117,7 +202,7 @@ class WebSocketStreamHandle:
 
     def update_thinking(self, chunk: str) -> None:
         """Send thinking content."""
-        self._send(WSOutgoing(op="thinking", data={"content": chunk}))
+        self._send_json(_content_frame(_THINKING_FRAME_PREFIX, chunk))
 
     def finish_thinking(self) -> None:
         """Signal reasoning complete."""
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
+import threading
 from collections.abc import Callable, Mapping, Sequence
 from importlib import import_module
 from pathlib import Path
+from types import ModuleType
 from typing import Any, cast
 
 from fastmcp.server.transforms import GetToolNext, Transform, VersionSpec
 from fastmcp.tools.tool import Tool, ToolResult
 from pydantic import PrivateAttr
 
+from autopoiesis.skills.tool_wrap_cache import ToolWrapCache
+
 _TIER_ORDER: dict[str, int] = {
     "free": 0,
     "review": 1,
@@ -18,6 +22,12 @@ _TIER_ORDER: dict[str, int] = {
     "block": 3,
 }
 _APPROVAL_THRESHOLD = _TIER_ORDER["approve"]
+_POLICY_MODULE = "autopoiesis.infra.approval.policy"
+
+# Unlock hooks resolved from the policy module on first use; every gated tool
+# run consults them, so the import and attribute probing happen only once.
+_unlock_hooks: tuple[Callable[[], object], ...] | None = None
+_unlock_hooks_lock = threading.Lock()
 
 
 class _ApprovalGateTool(Tool):
@@ -26,6 +36,9 @@ class _ApprovalGateTool(Tool):
     _delegate: Tool = PrivateAttr()
     _required_tier: str = PrivateAttr()
     _unlock_check: Callable[[], bool] = PrivateAttr()
+    # Tier and message are fixed for the wrapper's lifetime, so every denied
+    # call returns the same result instead of rebuilding it.
+    _blocked: ToolResult = PrivateAttr()
 
     @classmethod
     def wrap(
@@ -41,6 +54,7 @@ class _ApprovalGateTool(Tool):
         wrapped._delegate = tool
         wrapped._required_tier = required_tier
         wrapped._unlock_check = unlock_check
+        wrapped._blocked = _blocked_result(required_tier)
         return wrapped
 
     def model_copy(self, **kwargs: Any) -> _ApprovalGateTool:
@@ -48,28 +62,27 @@ class _ApprovalGateTool(Tool):
         copied._delegate = self._delegate
         copied._required_tier = self._required_tier
         copied._unlock_check = self._unlock_check
+        copied._blocked = self._blocked
         return copied
 
     async def run(self, arguments: dict[str, Any]) -> ToolResult:
-        blocked = self._blocked_result()
-        if blocked is not None:
-            return blocked
-        return await self._delegate.run(arguments)
-
-    def _blocked_result(self) -> ToolResult | None:
         if self._unlock_check():
-            return None
-        return ToolResult(
-            content=(
-                "Approval required: this tool needs an active approval unlock "
-                f"(required tier: {self._required_tier})."
-            ),
-            meta={
-                "blocked": True,
-                "reason": "approval_required",
-                "required_tier": self._required_tier,
-            },
-        )
+            return await self._delegate.run(arguments)
+        return self._blocked
+
+
+def _blocked_result(required_tier: str) -> ToolResult:
+    return ToolResult(
+        content=(
+            "Approval required: this tool needs an active approval unlock "
+            f"(required tier: {required_tier})."
+        ),
+        meta={
+            "blocked": True,
+            "reason": "approval_required",
+            "required_tier": required_tier,
+        },
+    )
 
 
 class ApprovalGateTransform(Transform):
@@ -86,9 +99,12 @@ class ApprovalGateTransform(Transform):
             name: _normalize_tier(value) for name, value in normalized_tiers.items()
         }
         self._unlock_check = unlock_check or _default_unlock_check
+        # Providers return the same Tool objects on every listing, so each
+        # source tool is inspected and wrapped once.
+        self._wrapped = ToolWrapCache(self._gate)
 
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
-        return [self._wrap_tool(tool) for tool in tools]
+        return [self._wrapped.get(tool) for tool in tools]
 
     async def get_tool(
         self,
@@ -100,9 +116,9 @@ class ApprovalGateTransform(Transform):
         tool = await call_next(name, version=version)
         if tool is None:
             return None
-        return self._wrap_tool(tool)
+        return self._wrapped.get(tool)
 
-    def _wrap_tool(self, tool: Tool) -> Tool:
+    def _gate(self, tool: Tool) -> Tool:
         tier = _resolve_required_tier(tool, self._tool_tiers)
         if tier is None:
             return tool
@@ -203,19 +219,41 @@ def _normalize_tier(value: str) -> str:
 
 def _default_unlock_check() -> bool:
     """Read approval unlock state via approval policy integration hooks."""
+    hooks = _unlock_hooks if _unlock_hooks is not None else _load_unlock_hooks()
+    for hook in hooks:
+        try:
+            return bool(hook())
+        except (TypeError, ValueError):
+            continue
+    return False
+
+
+def _load_unlock_hooks() -> tuple[Callable[[], object], ...]:
+    global _unlock_hooks
+    with _unlock_hooks_lock:
+        if _unlock_hooks is None:
+            _unlock_hooks = _resolve_unlock_hooks()
+        return _unlock_hooks
+
+
+def _resolve_unlock_hooks() -> tuple[Callable[[], object], ...]:
     try:
-        policy_module = import_module("autopoiesis.infra.approval.policy")
+        policy_module = import_module(_POLICY_MODULE)
     except ModuleNotFoundError:
-        return False
+        return ()
+    hooks: list[Callable[[], object]] = []
     for attr_name in ("approval_unlock_active", "is_approval_unlocked"):
         checker: object = getattr(policy_module, attr_name, None)
         if callable(checker):
-            try:
-                return bool(checker())
-            except (TypeError, ValueError):
-                continue
+            hooks.append(cast(Callable[[], object], checker))
+    # The flag may be reassigned at runtime, so it is read on each call.
+    hooks.append(lambda: _module_unlock_flag(policy_module))
+    return tuple(hooks)
+
+
+def _module_unlock_flag(policy_module: ModuleType) -> bool:
     fallback_value: object = getattr(policy_module, "approval_unlocked", None)
-    return bool(fallback_value) if isinstance(fallback_value, bool) else False
+    return fallback_value if isinstance(fallback_value, bool) else False
 
 
 def _copy_tool_kwargs(tool: Tool) -> dict[str, Any]:
@@ -224,12 +262,12 @@ def _copy_tool_kwargs(tool: Tool) -> dict[str, Any]:
         "version": tool.version,
         "title": tool.title,
         "description": tool.description,
-        "icons": list(tool.icons) if tool.icons is not None else None,
-        "tags": set(tool.tags),
-        "meta": dict(tool.meta) if tool.meta is not None else None,
+        "icons": tool.icons,
+        "tags": tool.tags,
+        "meta": tool.meta,
         "task_config": tool.task_config,
-        "parameters": dict(tool.parameters),
-        "output_schema": dict(tool.output_schema) if tool.output_schema is not None else None,
+        "parameters": tool.parameters,
+        "output_schema": tool.output_schema,
         "annotations": tool.annotations,
         "execution": tool.execution,
         "serializer": tool.serializer,
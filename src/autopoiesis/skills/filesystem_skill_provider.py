@@ -27,6 +27,8 @@ Example skill server.py::
 from __future__ import annotations
 
 import logging
+import os
+import stat
 from pathlib import Path
 from typing import Any
 
@@ -39,6 +41,12 @@ from autopoiesis.skills.skill_transforms import PathValidationTransform
 logger = logging.getLogger(__name__)
 
 
+# Providers from the last scan of each skills root, keyed by skill name along
+# with the manifest they were built from.  Building a provider imports the
+# skill's Python files, so unchanged skills reuse the previous instance.
+_provider_cache: dict[Path, dict[str, tuple[tuple[object, ...], FileSystemProvider]]] = {}
+
+
 def discover_skill_providers(
     skills_root: Path,
 ) -> list[tuple[str, FileSystemProvider]]:
@@ -46,6 +54,8 @@ def discover_skill_providers(
 
     Returns a list of ``(skill_name, provider)`` pairs.  Each provider wraps
     the skill's directory so only files in that directory are imported.
+    Skills whose manifest is unchanged since the previous scan of the same
+    root reuse the provider built then.
 
     Args:
         skills_root: Root directory to scan for skill subdirectories.
@@ -57,35 +67,116 @@ def discover_skill_providers(
             "Skills root %s does not exist; no skill providers loaded",
             skills_root,
         )
+        _provider_cache.pop(skills_root, None)
         return providers
 
-    for skill_dir in sorted(skills_root.iterdir()):
-        if not skill_dir.is_dir():
-            continue
-        server_py = skill_dir / "server.py"
-        if not server_py.exists():
-            continue
-
+    # Providers are built serially on purpose: FileSystemProvider imports each
+    # skill's files under their bare stem (every skill has a ``server`` module)
+    # and prepends the skill directory to ``sys.path``, so concurrent builds
+    # could bind one skill's imports to another's files.
+    previous = _provider_cache.get(skills_root, {})
+    current: dict[str, tuple[tuple[object, ...], FileSystemProvider]] = {}
+    for skill_dir, manifest in _skill_server_dirs(skills_root):
         skill_name = skill_dir.name
-        try:
-            provider = FileSystemProvider(root=skill_dir)
-            _apply_security_transforms(provider, skill_dir)
-            providers.append((skill_name, provider))
-            logger.info(
-                "Loaded skill server provider: %s from %s",
-                skill_name,
-                server_py,
-            )
-        except Exception:
-            logger.warning(
-                "Failed to load skill server from %s",
-                server_py,
-                exc_info=True,
-            )
-
+        cached = previous.get(skill_name)
+        if cached is not None and cached[0] == manifest:
+            provider = cached[1]
+        else:
+            loaded = _load_skill_provider(skill_dir)
+            if loaded is None:
+                continue
+            provider = loaded
+        current[skill_name] = (manifest, provider)
+        providers.append((skill_name, provider))
+
+    _provider_cache[skills_root] = current
     return providers
 
 
+def _load_skill_provider(skill_dir: Path) -> FileSystemProvider | None:
+    """Build the secured provider for *skill_dir*, or ``None`` on failure."""
+    server_py = skill_dir / "server.py"
+    try:
+        provider = FileSystemProvider(root=skill_dir)
+        _apply_security_transforms(provider, skill_dir)
+    except Exception:
+        logger.warning(
+            "Failed to load skill server from %s",
+            server_py,
+            exc_info=True,
+        )
+        return None
+    logger.info(
+        "Loaded skill server provider: %s from %s",
+        skill_dir.name,
+        server_py,
+    )
+    return provider
+
+
+def _skill_server_dirs(skills_root: Path) -> list[tuple[Path, tuple[object, ...]]]:
+    """Return skill directories with a ``server.py`` and their manifests, by name.
+
+    The manifest holds ``(path, mtime_ns, size)`` for every ``*.py`` file
+    ``FileSystemProvider`` would import (it walks the skill directory
+    recursively) plus the ``skill.yaml`` stat that sets approval tiers, so
+    editing, adding or removing any module invalidates the cached provider.
+
+    Symlinked skill directories and ``server.py`` files are skipped: their
+    code would be imported from outside the skills root.
+    """
+    found: list[tuple[Path, tuple[object, ...]]] = []
+    with os.scandir(skills_root) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                if entry.is_dir():
+                    logger.warning("Skipping symlinked skill directory %s", entry.path)
+                continue
+            if not entry.is_dir(follow_symlinks=False):
+                continue
+            skill_dir = Path(entry.path)
+            if _stat_key(skill_dir / "server.py") is None:
+                continue
+            manifest = (_python_files_key(skill_dir), _stat_key(skill_dir / "skill.yaml"))
+            found.append((skill_dir, manifest))
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+def _python_files_key(skill_dir: Path) -> tuple[tuple[str, int, int], ...]:
+    """Return ``(relative path, mtime_ns, size)`` for each ``*.py`` under *skill_dir*.
+
+    Mirrors FastMCP's discovery walk: directory symlinks and ``__pycache__``
+    are not descended into.
+    """
+    files: list[tuple[str, int, int]] = []
+    for dirpath, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = [name for name in dirnames if name != "__pycache__"]
+        for name in filenames:
+            if not name.endswith(".py"):
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            files.append((os.path.relpath(path, skill_dir), st.st_mtime_ns, st.st_size))
+    files.sort()
+    return tuple(files)
+
+
+def _stat_key(path: Path) -> tuple[int, int] | None:
+    """Return ``(mtime_ns, size)`` for a regular file, or ``None`` if absent.
+
+    Uses ``lstat``, so a symlink counts as absent.
+    """
+    try:
+        st = path.lstat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size) if stat.S_ISREG(st.st_mode) else None
+
+
 def register_skill_providers(
     mcp_server: Any,
     skills_root: Path,
@@ -105,6 +196,9 @@ def register_skill_providers(
     """
     registered: list[str] = []
 
+    # Registered one by one in name order: add_provider only records the
+    # provider, and FastMCP resolves name clashes by registration order, so
+    # concurrent registration would gain nothing and lose determinism.
     for skill_name, provider in discover_skill_providers(skills_root):
         try:
             mcp_server.add_provider(provider, namespace=skill_name)
@@ -6,7 +6,7 @@ import argparse
 import asyncio
 import os
 import sys
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -18,83 +18,181 @@ from fastmcp.server.providers import Provider
 from fastmcp.server.providers.filesystem import FileSystemProvider
 from fastmcp.server.providers.proxy import ProxyProvider
 
+from autopoiesis.security.path_validator import PathValidator
 from autopoiesis.security.subprocess_sandbox import SandboxLimits, SubprocessSandboxManager
 
 _SANDBOX_SERVE_FLAG = "--sandbox-serve"
+# Variables the sandboxed child inherits: enough to start the interpreter and
+# import autopoiesis.  Everything else, notably API keys and tokens, stays
+# out of skill code.
+_LAUNCHER_ENV_KEYS: frozenset[str] = frozenset(
+    {"PATH", "HOME", "LANG", "LC_ALL", "TMPDIR", "PYTHONPATH"}
+)
 
 
 @dataclass(frozen=True)
 class SandboxedSkillProvider:
-    """Create a FastMCP provider backed by a sandboxed stdio subprocess."""
+    """Create a FastMCP provider backed by a sandboxed stdio subprocess.
+
+    With ``sandboxed=False`` the skill is trusted and imported in-process
+    instead; the module path is still validated against the workspace.
+    """
 
     skill_server_module: Path
     limits: SandboxLimits = field(default_factory=SandboxLimits)
     workspace_root: Path | None = None
     allowed_roots: tuple[Path, ...] = ()
+    sandboxed: bool = True
     _resolved_module: Path = field(init=False, repr=False)
-    _sandbox: SubprocessSandboxManager = field(init=False, repr=False)
+    _sandbox: SubprocessSandboxManager | None = field(init=False, repr=False)
+    # Launch spec for the child, fixed at construction: paths are resolved
+    # and stringified once rather than on every (re)connect.
+    _env: dict[str, str] = field(init=False, repr=False, default_factory=dict[str, str])
+    _args: tuple[str, ...] = field(init=False, repr=False, default=())
+    _cwd: str = field(init=False, repr=False, default="")
+    # One client per provider: the child interpreter and its MCP session are
+    # started once and shared by every proxied request.
+    _client: Client[Any] | None = field(init=False, repr=False, default=None)
+    _held: bool = field(init=False, repr=False, default=False)
+    _client_lock: asyncio.Lock = field(init=False, repr=False, default_factory=asyncio.Lock)
 
     def __post_init__(self) -> None:
-        module_path = self.skill_server_module.expanduser().resolve()
+        # ensure_file() resolves the module itself; resolving it here too
+        # would walk the same path twice.  absolute() keeps a relative module
+        # anchored at the cwd rather than at the workspace root.
+        module_path = self.skill_server_module.expanduser().absolute()
         root = self._resolve_workspace_root(module_path)
-        sandbox = SubprocessSandboxManager(
-            workspace_root=root,
-            allowed_roots=self.allowed_roots,
-            limits=self.limits,
-        )
-        resolved_module = sandbox.path_validator.ensure_file(module_path)
+        sandbox: SubprocessSandboxManager | None = None
+        if self.sandboxed:
+            sandbox = SubprocessSandboxManager(
+                workspace_root=root,
+                allowed_roots=self.allowed_roots,
+                limits=self.limits,
+            )
+            validator = sandbox.path_validator
+        else:
+            validator = PathValidator(workspace_root=root, allowed_roots=self.allowed_roots)
+        resolved_module = validator.ensure_file(module_path)
         object.__setattr__(self, "_resolved_module", resolved_module)
         object.__setattr__(self, "_sandbox", sandbox)
+        if sandbox is not None:
+            self._init_launch(sandbox, resolved_module)
+
+    def _init_launch(self, sandbox: SubprocessSandboxManager, module: Path) -> None:
+        args = _launcher_args(module, sandbox.path_validator.workspace_root, self.limits)
+        object.__setattr__(self, "_env", _launcher_env())
+        object.__setattr__(self, "_args", args)
+        object.__setattr__(self, "_cwd", str(sandbox.resolve_cwd(module.parent)))
 
     @property
     def sandbox(self) -> SubprocessSandboxManager:
         """Public accessor for the sandbox manager."""
+        if self._sandbox is None:
+            raise RuntimeError("Skill provider is not sandboxed.")
         return self._sandbox
 
     def get_provider(self) -> Provider:
-        """Return a proxy provider that talks to the sandboxed child over stdio."""
+        """Return the provider serving the skill's tools.
+
+        Sandboxed skills get a proxy that talks to the child over stdio;
+        trusted skills are loaded directly, with no subprocess or IPC.
+        """
+        if not self.sandboxed:
+            return FileSystemProvider(root=self._resolved_module.parent)
+        return ProxyProvider(self._shared_client)
 
-        def _client_factory() -> Client[Any]:
+    async def connect(self) -> None:
+        """Start the sandboxed child and keep its MCP session open.
+
+        While connected, proxied requests reuse the session instead of
+        opening and closing one around each call.
+        """
+        if not self.sandboxed:
+            return
+        async with self._client_lock:
+            if self._held:
+                return
+            await self._shared_client().__aenter__()
+            object.__setattr__(self, "_held", True)
+
+    async def disconnect(self) -> None:
+        """Close the shared session and stop the sandboxed child."""
+        async with self._client_lock:
+            client = self._client
+            object.__setattr__(self, "_client", None)
+            object.__setattr__(self, "_held", False)
+            if client is not None:
+                await client.close()
+
+    def _shared_client(self) -> Client[Any]:
+        client = self._client
+        if client is None:
             transport = StdioTransport(
                 command=sys.executable,
-                args=self._launcher_args(),
-                cwd=str(self._sandbox.resolve_cwd(self._resolved_module.parent)),
-                env=self._launcher_env(),
-                keep_alive=False,
+                args=list(self._args),
+                cwd=self._cwd,
+                env=self._env,
+                keep_alive=True,
             )
-            return Client(transport)
-
-        return ProxyProvider(_client_factory)
-
-    def _launcher_args(self) -> list[str]:
-        limits = self.limits
-        return [
-            "-m",
-            "autopoiesis.skills.sandboxed_provider",
-            _SANDBOX_SERVE_FLAG,
-            "--module",
-            str(self._resolved_module),
-            "--workspace-root",
-            str(self._sandbox.path_validator.workspace_root),
-            "--max-processes",
-            str(limits.max_processes),
-            "--max-file-size-bytes",
-            str(limits.max_file_size_bytes),
-            "--max-cpu-seconds",
-            str(limits.max_cpu_seconds),
-        ]
-
-    def _launcher_env(self) -> dict[str, str]:
-        env = dict(os.environ)
-        env["PYTHONUNBUFFERED"] = "1"
-        return env
+            client = Client(transport)
+            object.__setattr__(self, "_client", client)
+        return client
 
     def _resolve_workspace_root(self, module_path: Path) -> Path:
         if self.workspace_root is None:
-            return module_path.parent
+            return module_path.resolve().parent
         return self.workspace_root.expanduser().resolve()
 
 
+async def connect_sandboxed_providers(providers: Iterable[SandboxedSkillProvider]) -> None:
+    """Connect several providers concurrently.
+
+    Most of a connect is spent waiting for the child interpreter to start and
+    answer the MCP handshake, so overlapping them costs about as much as the
+    slowest child rather than the sum.  If any connect fails, the providers
+    that did connect are disconnected (stopping their children) and the first
+    failure is raised.
+    """
+    pending = list(providers)
+    results = await asyncio.gather(
+        *(provider.connect() for provider in pending), return_exceptions=True
+    )
+    failures = [result for result in results if isinstance(result, BaseException)]
+    if not failures:
+        return
+    connected = [
+        provider
+        for provider, result in zip(pending, results, strict=True)
+        if not isinstance(result, BaseException)
+    ]
+    await asyncio.gather(*(provider.disconnect() for provider in connected), return_exceptions=True)
+    raise failures[0]
+
+
+def _launcher_args(module: Path, workspace_root: Path, limits: SandboxLimits) -> tuple[str, ...]:
+    return (
+        "-m",
+        "autopoiesis.skills.sandboxed_provider",
+        _SANDBOX_SERVE_FLAG,
+        "--module",
+        str(module),
+        "--workspace-root",
+        str(workspace_root),
+        "--max-processes",
+        str(limits.max_processes),
+        "--max-file-size-bytes",
+        str(limits.max_file_size_bytes),
+        "--max-cpu-seconds",
+        str(limits.max_cpu_seconds),
+    )
+
+
+def _launcher_env() -> dict[str, str]:
+    env = {key: os.environ[key] for key in _LAUNCHER_ENV_KEYS if key in os.environ}
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+
 async def serve_sandboxed_skill(
     *,
     module_path: Path,
@@ -110,7 +208,9 @@ async def serve_sandboxed_skill(
 
     mcp = FastMCP(f"sandboxed-{resolved_module.parent.name}")
     mcp.add_provider(FileSystemProvider(root=resolved_module.parent))
-    await mcp.run_stdio_async()
+    # The banner is for humans at a terminal; the parent only reads MCP
+    # frames, so rendering it would just delay every child start.
+    await mcp.run_stdio_async(show_banner=False)
 
 
 def _build_parser() -> argparse.ArgumentParser:
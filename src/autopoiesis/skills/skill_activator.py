@@ -19,11 +19,17 @@ activated:
 .. code-block:: python
 
     activator.activate_skill_for_topic("github")  # enables skillmaker for "github" topic
+
+Topic activation enables one skill per work item (its ``topic_ref``).
+Callers that toggle several skills together should use
+:meth:`SkillActivator.activate_many` / :meth:`SkillActivator.deactivate_many`,
+which add one Visibility transform for the whole set.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Any
 
@@ -47,6 +53,10 @@ class SkillActivator:
         self._mcp = mcp_server
         self._skills_root = skills_root
         self._active: set[str] = set()
+        # Skills are installed at startup and rarely change mid-process, so
+        # the server.py probe is done once per name; see
+        # :meth:`invalidate_server_cache` for hot reloads.
+        self._server_cache: dict[str, bool] = {}
 
     # ------------------------------------------------------------------
     # Public API
@@ -91,6 +101,41 @@ class SkillActivator:
         logger.info("Disabled MCP tools for skill '%s'", skill_name)
         return True
 
+    def activate_many(self, skill_names: Iterable[str]) -> set[str]:
+        """Enable the MCP tools of every skill in *skill_names* at once.
+
+        Equivalent to calling :meth:`activate` per skill, but issues a single
+        ``enable`` call: each call appends a Visibility transform that every
+        later tool listing evaluates.  Returns the skills that were enabled;
+        names without a ``server.py`` are skipped.
+
+        Args:
+            skill_names: Skill names to activate.
+        """
+        enabled = {name for name in skill_names if self._has_server(name)}
+        if not enabled:
+            return enabled
+        self._mcp.enable(tags=enabled)
+        self._active.update(enabled)
+        logger.info("Enabled MCP tools for skills %s", sorted(enabled))
+        return enabled
+
+    def deactivate_many(self, skill_names: Iterable[str]) -> set[str]:
+        """Disable the MCP tools of every active skill in *skill_names* at once.
+
+        Returns the skills that were deactivated; inactive names are skipped.
+
+        Args:
+            skill_names: Skill names to deactivate.
+        """
+        disabled = set(skill_names) & self._active
+        if not disabled:
+            return disabled
+        self._mcp.disable(tags=disabled)
+        self._active.difference_update(disabled)
+        logger.info("Disabled MCP tools for skills %s", sorted(disabled))
+        return disabled
+
     def activate_skill_for_topic(self, topic_name: str, skill_name: str | None = None) -> bool:
         """Activate a skill's MCP tools when a topic is activated.
 
@@ -120,10 +165,25 @@ class SkillActivator:
         """Snapshot of currently active skill names."""
         return frozenset(self._active)
 
+    def invalidate_server_cache(self, skill_name: str | None = None) -> None:
+        """Forget cached ``server.py`` probes for *skill_name*, or for all skills.
+
+        Args:
+            skill_name: Skill to re-probe on next use; ``None`` clears every entry.
+        """
+        if skill_name is None:
+            self._server_cache.clear()
+        else:
+            self._server_cache.pop(skill_name, None)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
     def _has_server(self, skill_name: str) -> bool:
         """Return True if the skill directory contains a server.py."""
-        return (self._skills_root / skill_name / "server.py").exists()
+        cached = self._server_cache.get(skill_name)
+        if cached is None:
+            cached = (self._skills_root / skill_name / "server.py").is_file()
+            self._server_cache[skill_name] = cached
+        return cached
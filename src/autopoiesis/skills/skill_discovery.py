@@ -0,0 +1,241 @@
+"""SKILL.md parsing and metadata-only skill discovery."""
+
+from __future__ import annotations
+
+import logging
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any, cast
+
+import yaml
+from pydantic import BaseModel, PrivateAttr, ValidationError
+
+from autopoiesis.security.path_validator import PathValidator
+from autopoiesis.skills.skillmaker_tools import extract_skill_metadata
+
+logger = logging.getLogger(__name__)
+
+_SKILL_FILE = "SKILL.md"
+
+# Parsed skill metadata keyed by SKILL.md path, shared across
+# create_skills_toolset calls so unchanged skills cost two stat() calls
+# instead of a read and a YAML parse.  Bounded; oldest entries go first.
+_SKILL_CACHE_SIZE = 1024
+_skill_cache: dict[Path, tuple[tuple[int, int, int], Skill]] = {}
+
+# libyaml's C loader parses frontmatter several times faster and enforces the
+# same safe tag set; fall back to the pure-Python loader when PyYAML was built
+# without libyaml.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class SkillDirectory(BaseModel):
+    """A directory to scan for skills."""
+
+    path: Path
+    recursive: bool = True
+
+
+class Skill(BaseModel):
+    """Skill metadata with lazy-loaded instructions."""
+
+    name: str
+    description: str
+    path: Path
+    tags: list[str] = []
+    version: str = "1.0.0"
+    author: str = ""
+    resources: list[str] = []
+    frontmatter: dict[str, Any] | None = None
+    instructions: str | None = None
+    instructions_mtime: float | None = None
+    instructions_checked_at: float = 0.0
+    formatted_instructions: str | None = None
+    # Set view of ``resources`` for membership checks on every resource read;
+    # the list keeps discovery order for display.
+    _resource_set: frozenset[str] = PrivateAttr(default_factory=frozenset[str])
+    # Built on first resource read: construction resolves the skill folder,
+    # which need not be repeated for every read.
+    _validator: PathValidator | None = PrivateAttr(default=None)
+
+    def model_post_init(self, context: Any, /) -> None:
+        self._resource_set = frozenset(self.resources)
+
+    def has_resource(self, resource_name: str) -> bool:
+        """Return whether *resource_name* is one of the skill's listed resources."""
+        return resource_name in self._resource_set
+
+    def path_validator(self) -> PathValidator:
+        """Return the validator confining resource reads to the skill folder."""
+        if self._validator is None:
+            self._validator = PathValidator(workspace_root=self.path)
+        return self._validator
+
+
+def parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
+    """Parse a SKILL.md file into (frontmatter dict, instructions string)."""
+    # Scan line boundaries with str.find and slice the original string: only
+    # the frontmatter lines are visited and the body is never split or rejoined.
+    line_end = _line_end(content, 0)
+    if content[:line_end].strip() != "---":
+        return {}, content.strip()
+
+    start = pos = line_end + 1
+    while pos < len(content):
+        line_end = _line_end(content, pos)
+        if content[pos:line_end].strip() == "---":
+            frontmatter = _load_frontmatter(content[start:pos])
+            return frontmatter, content[line_end + 1 :].strip()
+        pos = line_end + 1
+    return {}, content.strip()
+
+
+def _line_end(content: str, start: int) -> int:
+    end = content.find("\n", start)
+    return len(content) if end < 0 else end
+
+
+def _load_frontmatter(frontmatter_yaml: str) -> dict[str, Any]:
+    frontmatter_yaml = frontmatter_yaml.strip()
+    loaded: object = yaml.load(frontmatter_yaml, Loader=_YAML_LOADER) if frontmatter_yaml else {}
+    if not isinstance(loaded, dict):
+        raise ValueError("SKILL.md frontmatter must be a mapping.")
+    return cast(dict[str, Any], loaded)
+
+
+def _read_frontmatter_only(skill_file: Path) -> dict[str, Any]:
+    """Read just the frontmatter of a SKILL.md, stopping at the closing ``---``.
+
+    Discovery never needs the instructions, so the body is not read.  Mirrors
+    :func:`parse_skill_md`: a missing or unterminated block yields ``{}``.
+    """
+    with skill_file.open() as handle:
+        if handle.readline().strip() != "---":
+            return {}
+        header: list[str] = []
+        for line in handle:
+            if line.strip() == "---":
+                return _load_frontmatter("".join(header))
+            header.append(line)
+    return {}
+
+
+def discover_skills(directories: list[SkillDirectory]) -> list[Skill]:
+    """Discover skills from directories, returning metadata (no instructions)."""
+    skills: list[Skill] = []
+
+    for skill_dir in directories:
+        dir_path = skill_dir.path.expanduser()
+        if not dir_path.exists():
+            logger.debug("Skills directory %s does not exist, skipping", dir_path)
+            continue
+
+        for skill_file in _iter_skill_files(dir_path, recursive=skill_dir.recursive):
+            try:
+                skill = _cached_skill(skill_file)
+            except (
+                OSError,
+                UnicodeDecodeError,
+                ValueError,
+                TypeError,
+                yaml.YAMLError,
+                ValidationError,
+            ):
+                logger.warning("Failed to parse skill at %s", skill_file, exc_info=True)
+                continue
+            if skill is not None:
+                skills.append(skill)
+
+    return skills
+
+
+def _iter_skill_files(root: Path, *, recursive: bool) -> Iterator[Path]:
+    """Yield SKILL.md files as ``root.glob("**/SKILL.md")`` or ``"*/SKILL.md"`` would.
+
+    A manual ``os.scandir`` walk: DirEntry caches the file type, so the only
+    ``Path`` objects built are the SKILL.md paths that are yielded.  Like
+    pathlib's ``**``, recursion does not follow directory symlinks.
+    """
+    if not recursive:
+        subdirs, _ = _scan_dir(os.fspath(root), follow_symlinks=True)
+        for subdir in subdirs:
+            candidate = os.path.join(subdir, _SKILL_FILE)
+            if os.path.isfile(candidate):
+                yield Path(candidate)
+        return
+
+    pending = [os.fspath(root)]
+    while pending:
+        subdirs, skill_files = _scan_dir(pending.pop(), follow_symlinks=False)
+        for skill_file in skill_files:
+            yield Path(skill_file)
+        pending.extend(reversed(subdirs))
+
+
+def _scan_dir(directory: str, *, follow_symlinks: bool) -> tuple[list[str], list[str]]:
+    """Return (subdirectory paths, SKILL.md paths) directly inside *directory*."""
+    subdirs: list[str] = []
+    skill_files: list[str] = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    subdirs.append(entry.path)
+                elif entry.name == _SKILL_FILE and entry.is_file():
+                    skill_files.append(entry.path)
+    except OSError:
+        # pathlib's glob silently skips unreadable directories; so does this.
+        logger.debug("Cannot scan %s for skills, skipping", directory, exc_info=True)
+    return subdirs, skill_files
+
+
+def _cached_skill(skill_file: Path) -> Skill | None:
+    """Return metadata for *skill_file*, re-parsing only when it changed.
+
+    The key pairs the SKILL.md stat with the skill folder's mtime, which moves
+    whenever a resource file is added, removed or renamed.  Callers get a copy
+    so per-toolset instruction caching never leaks between toolsets.
+    """
+    file_stat = skill_file.stat()
+    key = (
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        skill_file.parent.stat().st_mtime_ns,
+    )
+    cached = _skill_cache.get(skill_file)
+    if cached is not None and cached[0] == key:
+        return cached[1].model_copy(deep=True)
+    skill = _load_skill(skill_file)
+    if skill is None:
+        _skill_cache.pop(skill_file, None)
+        return None
+    if skill_file not in _skill_cache and len(_skill_cache) >= _SKILL_CACHE_SIZE:
+        _skill_cache.pop(next(iter(_skill_cache)), None)
+    _skill_cache[skill_file] = (key, skill)
+    return skill.model_copy(deep=True)
+
+
+def _load_skill(skill_file: Path) -> Skill | None:
+    frontmatter = _read_frontmatter_only(skill_file)
+    name_raw = frontmatter.get("name")
+    if not isinstance(name_raw, str) or not name_raw.strip():
+        return None
+    description, tags, version, author = extract_skill_metadata(frontmatter)
+
+    skill_folder = skill_file.parent
+    # Entries are direct children, so the name is already the relative path;
+    # is_file() reuses the type scandir read and only stats symlinks.
+    with os.scandir(skill_folder) as entries:
+        resources = [
+            entry.name for entry in entries if entry.name != _SKILL_FILE and entry.is_file()
+        ]
+    return Skill(
+        name=name_raw,
+        description=description,
+        path=skill_folder,
+        tags=tags,
+        version=version,
+        author=author,
+        resources=resources,
+    )
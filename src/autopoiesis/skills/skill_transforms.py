@@ -30,7 +30,8 @@ Usage example::
 
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
+from functools import lru_cache
 from typing import Any, cast
 
 from fastmcp.server.transforms import GetToolNext, Transform, VersionSpec, Visibility
@@ -38,11 +39,20 @@ from fastmcp.tools.tool import Tool, ToolResult
 from pydantic import PrivateAttr
 
 from autopoiesis.security.path_validator import PathValidator
+from autopoiesis.skills.tool_wrap_cache import ToolWrapCache
 
 _DEFAULT_PATH_ARGUMENT_NAMES = ("path", "file_path", "directory")
+# Callers ask for the same few skills and allowlists repeatedly, so the
+# factories below are memoized and return immutable tuples of shared transforms.
+_TRANSFORM_CACHE_SIZE = 256
+# Visibility only reads its configuration, so one hide-all instance serves
+# every allowlist.
+_HIDE_ALL_TOOLS = Visibility(False, match_all=True, components={"tool"})
+_HIDE_ALL_ONLY: tuple[Visibility, ...] = (_HIDE_ALL_TOOLS,)
 
 
-def make_skill_disable_transform(skill_name: str) -> list[Visibility]:
+@lru_cache(maxsize=_TRANSFORM_CACHE_SIZE)
+def make_skill_disable_transform(skill_name: str) -> tuple[Visibility, ...]:
     """Return transforms that disable all tools tagged with *skill_name*.
 
     Designed for lazy loading: call at startup to hide a skill's tools until
@@ -52,10 +62,28 @@ def make_skill_disable_transform(skill_name: str) -> list[Visibility]:
         skill_name: Tag name matching the skill's tools (same as the skills/
             subdirectory name, e.g. ``"skillmaker"``).
     """
-    return [Visibility(False, tags={skill_name}, components={"tool"})]
+    return (Visibility(False, tags={skill_name}, components={"tool"}),)
 
 
-def make_skill_enable_transform(skill_name: str) -> list[Visibility]:
+def make_skills_disable_transform(skill_names: Iterable[str]) -> tuple[Visibility, ...]:
+    """Return transforms that disable the tools of every skill in *skill_names*.
+
+    Equivalent to chaining :func:`make_skill_disable_transform` per skill, but
+    yields a single transform: visibility transforms run on every tool listing,
+    so one tag-set match beats one pass per skill.  Returns an empty tuple when
+    *skill_names* is empty.
+
+    Args:
+        skill_names: Tag names of the skills to hide.
+    """
+    tags = set(skill_names)
+    if not tags:
+        return ()
+    return (Visibility(False, tags=tags, components={"tool"}),)
+
+
+@lru_cache(maxsize=_TRANSFORM_CACHE_SIZE)
+def make_skill_enable_transform(skill_name: str) -> tuple[Visibility, ...]:
     """Return transforms that enable all tools tagged with *skill_name*.
 
     Call after :func:`make_skill_disable_transform` to make the skill's tools
@@ -65,10 +93,11 @@ def make_skill_enable_transform(skill_name: str) -> list[Visibility]:
     Args:
         skill_name: Tag name matching the skill's tools.
     """
-    return [Visibility(True, tags={skill_name}, components={"tool"})]
+    return (Visibility(True, tags={skill_name}, components={"tool"}),)
 
 
-def make_allowlist_transform(allowed_tool_names: frozenset[str]) -> list[Visibility]:
+@lru_cache(maxsize=_TRANSFORM_CACHE_SIZE)
+def make_allowlist_transform(allowed_tool_names: frozenset[str]) -> tuple[Visibility, ...]:
     """Return transforms that implement a tool-name allowlist.
 
     First disables **all** tools, then re-enables only the named ones.
@@ -78,27 +107,24 @@ def make_allowlist_transform(allowed_tool_names: frozenset[str]) -> list[Visibil
         allowed_tool_names: Exact tool names (as exposed by the MCP server,
             including any namespace prefix, e.g. ``"skillmaker_validate"``).
     """
-    transforms: list[Visibility] = [
-        Visibility(False, match_all=True, components={"tool"}),
-    ]
-    if allowed_tool_names:
-        transforms.append(Visibility(True, names=set(allowed_tool_names), components={"tool"}))
-    return transforms
+    if not allowed_tool_names:
+        return _HIDE_ALL_ONLY
+    # Visibility is annotated to take a mutable set, so the frozenset is
+    # copied; memoization limits that to once per distinct allowlist.
+    return (_HIDE_ALL_TOOLS, Visibility(True, names=set(allowed_tool_names), components={"tool"}))
 
 
-def make_tag_allowlist_transform(allowed_tags: frozenset[str]) -> list[Visibility]:
+@lru_cache(maxsize=_TRANSFORM_CACHE_SIZE)
+def make_tag_allowlist_transform(allowed_tags: frozenset[str]) -> tuple[Visibility, ...]:
     """Return transforms that allow only tools bearing at least one of *allowed_tags*.
 
     Args:
         allowed_tags: A set of tag strings.  A tool is visible if it has at
             least one of these tags.
     """
-    transforms: list[Visibility] = [
-        Visibility(False, match_all=True, components={"tool"}),
-    ]
-    if allowed_tags:
-        transforms.append(Visibility(True, tags=set(allowed_tags), components={"tool"}))
-    return transforms
+    if not allowed_tags:
+        return _HIDE_ALL_ONLY
+    return (_HIDE_ALL_TOOLS, Visibility(True, tags=set(allowed_tags), components={"tool"}))
 
 
 # ---------------------------------------------------------------------------
@@ -107,18 +133,22 @@ def make_tag_allowlist_transform(allowed_tags: frozenset[str]) -> list[Visibilit
 
 
 def _copy_tool_kwargs(tool: Tool) -> dict[str, Any]:
-    """Build constructor kwargs for a Tool-preserving wrapper."""
+    """Build constructor kwargs for a Tool-preserving wrapper.
+
+    Containers are passed by reference: pydantic validation already gives the
+    wrapper its own copies, so copying here would copy them twice.
+    """
     return {
         "name": tool.name,
         "version": tool.version,
         "title": tool.title,
         "description": tool.description,
-        "icons": list(tool.icons) if tool.icons is not None else None,
-        "tags": set(tool.tags),
-        "meta": dict(tool.meta) if tool.meta is not None else None,
+        "icons": tool.icons,
+        "tags": tool.tags,
+        "meta": tool.meta,
         "task_config": tool.task_config,
-        "parameters": dict(tool.parameters),
-        "output_schema": dict(tool.output_schema) if tool.output_schema is not None else None,
+        "parameters": tool.parameters,
+        "output_schema": tool.output_schema,
         "annotations": tool.annotations,
         "execution": tool.execution,
         "serializer": tool.serializer,
@@ -127,18 +157,22 @@ def _copy_tool_kwargs(tool: Tool) -> dict[str, Any]:
     }
 
 
-def _path_argument_names(tool: Tool, candidates: tuple[str, ...]) -> tuple[str, ...]:
+def _path_argument_names(
+    tool: Tool, candidates: tuple[str, ...], candidate_set: frozenset[str]
+) -> tuple[str, ...]:
     """Return tool argument names that are path-like string properties."""
     raw_properties: object = tool.parameters.get("properties")
     if not isinstance(raw_properties, dict):
         return ()
     properties: dict[str, object] = cast(dict[str, object], raw_properties)
-    matches: list[str] = []
-    for name in candidates:
-        schema: object = properties.get(name)
-        if isinstance(schema, dict) and cast(dict[str, object], schema).get("type") == "string":
-            matches.append(name)
-    return tuple(matches)
+    # Most tools declare none of the candidates; one set check settles that.
+    if properties.keys().isdisjoint(candidate_set):
+        return ()
+    return tuple(name for name in candidates if _is_string_schema(properties.get(name)))
+
+
+def _is_string_schema(schema: object) -> bool:
+    return isinstance(schema, dict) and cast(dict[str, object], schema).get("type") == "string"
 
 
 class _PathValidatedTool(Tool):
@@ -178,19 +212,24 @@ class _PathValidatedTool(Tool):
         return await self._delegate.run(validated)
 
     def _validate_arguments(self, arguments: dict[str, Any]) -> dict[str, Any] | ToolResult:
-        normalized: dict[str, Any] = dict(arguments)
+        # The caller's dict is only copied once a path is actually rewritten.
+        normalized = arguments
         for arg_name in self._path_arguments:
-            value = normalized.get(arg_name)
+            value = arguments.get(arg_name)
             if not isinstance(value, str):
                 continue
             try:
-                resolved = self._path_validator.resolve_path(value)
+                resolved = str(self._path_validator.resolve_path(value))
             except ValueError as exc:
                 return ToolResult(
                     content=f"Path validation failed for '{arg_name}': {exc}",
                     meta={"blocked": True, "reason": "path_validation", "argument": arg_name},
                 )
-            normalized[arg_name] = str(resolved)
+            if resolved == value:
+                continue
+            if normalized is arguments:
+                normalized = dict(arguments)
+            normalized[arg_name] = resolved
         return normalized
 
 
@@ -205,9 +244,13 @@ class PathValidationTransform(Transform):
     ) -> None:
         self._path_validator = path_validator
         self._argument_names = argument_names
+        self._argument_name_set = frozenset(argument_names)
+        # Providers return the same Tool objects on every listing, so each
+        # source tool is inspected and wrapped once.
+        self._wrapped = ToolWrapCache(self._validate)
 
     async def list_tools(self, tools: Sequence[Tool]) -> Sequence[Tool]:
-        return [self._wrap_tool(tool) for tool in tools]
+        return [self._wrapped.get(tool) for tool in tools]
 
     async def get_tool(
         self,
@@ -219,10 +262,10 @@ class PathValidationTransform(Transform):
         tool = await call_next(name, version=version)
         if tool is None:
             return None
-        return self._wrap_tool(tool)
+        return self._wrapped.get(tool)
 
-    def _wrap_tool(self, tool: Tool) -> Tool:
-        path_arguments = _path_argument_names(tool, self._argument_names)
+    def _validate(self, tool: Tool) -> Tool:
+        path_arguments = _path_argument_names(tool, self._argument_names, self._argument_name_set)
         if not path_arguments:
             return tool
         return _PathValidatedTool.wrap(
@@ -1,122 +1,33 @@
-"""Filesystem-based skill system with progressive disclosure."""
+"""Filesystem-based skill system with progressive disclosure.
+
+Discovery and SKILL.md parsing live in :mod:`autopoiesis.skills.skill_discovery`.
+"""
 
 from __future__ import annotations
 
 import logging
+import time
 from pathlib import Path
-from typing import Any, cast
+from typing import Any
 
 import yaml
-from pydantic import BaseModel, ValidationError
 from pydantic_ai import RunContext
 from pydantic_ai.toolsets import FunctionToolset
 
 from autopoiesis.models import AgentDeps
-from autopoiesis.security.path_validator import PathValidator
-from autopoiesis.skills.skillmaker_tools import (
-    extract_skill_metadata,
-    lint_skill_definition,
-    validate_skill_definition,
+from autopoiesis.skills.skill_discovery import (
+    Skill,
+    SkillDirectory,
+    discover_skills,
+    parse_skill_md,
 )
+from autopoiesis.skills.skillmaker_tools import lint_skill_definition, validate_skill_definition
 
 logger = logging.getLogger(__name__)
 
-
-class SkillDirectory(BaseModel):
-    """A directory to scan for skills."""
-
-    path: Path
-    recursive: bool = True
-
-
-class Skill(BaseModel):
-    """Skill metadata with lazy-loaded instructions."""
-
-    name: str
-    description: str
-    path: Path
-    tags: list[str] = []
-    version: str = "1.0.0"
-    author: str = ""
-    resources: list[str] = []
-    instructions: str | None = None
-    instructions_mtime: float | None = None
-
-
-def parse_skill_md(content: str) -> tuple[dict[str, Any], str]:
-    """Parse a SKILL.md file into (frontmatter dict, instructions string)."""
-    lines = content.splitlines(keepends=True)
-    if not lines or lines[0].strip() != "---":
-        return {}, content.strip()
-
-    closing_idx: int | None = None
-    for idx, line in enumerate(lines[1:], start=1):
-        if line.strip() == "---":
-            closing_idx = idx
-            break
-    if closing_idx is None:
-        return {}, content.strip()
-
-    frontmatter_yaml = "".join(lines[1:closing_idx]).strip()
-    instructions = "".join(lines[closing_idx + 1 :]).strip()
-
-    loaded_frontmatter: object = yaml.safe_load(frontmatter_yaml) if frontmatter_yaml else {}
-    if not isinstance(loaded_frontmatter, dict):
-        raise ValueError("SKILL.md frontmatter must be a mapping.")
-    frontmatter = cast(dict[str, Any], loaded_frontmatter)
-    return frontmatter, instructions
-
-
-def discover_skills(directories: list[SkillDirectory]) -> list[Skill]:
-    """Discover skills from directories, returning metadata (no instructions)."""
-    skills: list[Skill] = []
-
-    for skill_dir in directories:
-        dir_path = skill_dir.path.expanduser()
-        if not dir_path.exists():
-            logger.debug("Skills directory %s does not exist, skipping", dir_path)
-            continue
-
-        pattern = "**/SKILL.md" if skill_dir.recursive else "*/SKILL.md"
-        for skill_file in dir_path.glob(pattern):
-            try:
-                content = skill_file.read_text()
-                frontmatter, _ = parse_skill_md(content)
-                name_raw = frontmatter.get("name")
-                if not isinstance(name_raw, str) or not name_raw.strip():
-                    continue
-                description, tags, version, author = extract_skill_metadata(frontmatter)
-
-                skill_folder = skill_file.parent
-                resources = [
-                    str(f.relative_to(skill_folder))
-                    for f in skill_folder.iterdir()
-                    if f.is_file() and f.name != "SKILL.md"
-                ]
-
-                skills.append(
-                    Skill(
-                        name=name_raw,
-                        description=description,
-                        path=skill_folder,
-                        tags=tags,
-                        version=version,
-                        author=author,
-                        resources=resources,
-                    )
-                )
-            except (
-                OSError,
-                UnicodeDecodeError,
-                ValueError,
-                TypeError,
-                yaml.YAMLError,
-                ValidationError,
-            ):
-                logger.warning("Failed to parse skill at %s", skill_file, exc_info=True)
-                continue
-
-    return skills
+# A skill is often loaded several times within one turn; re-checking the
+# SKILL.md mtime at most this often avoids a stat() per load.
+_INSTRUCTIONS_TTL_SECONDS = 2.0
 
 
 def _format_skill_list(cache: dict[str, Skill]) -> str:
@@ -131,35 +42,51 @@ def _format_skill_list(cache: dict[str, Skill]) -> str:
 
 
 def load_skill_instructions(cache: dict[str, Skill], skill_name: str) -> str:
-    """Load full instructions for a skill, with mtime-based cache invalidation."""
+    """Load full instructions for a skill, with mtime-based cache invalidation.
+
+    Within ``_INSTRUCTIONS_TTL_SECONDS`` of the last check, cached
+    instructions are returned without touching the filesystem.
+    """
     if skill_name not in cache:
         available = ", ".join(sorted(cache.keys())) if cache else "none"
         return f"Skill '{skill_name}' not found. Available: {available}"
 
     skill = cache[skill_name]
-    skill_file = skill.path / "SKILL.md"
+    fresh = time.monotonic() - skill.instructions_checked_at < _INSTRUCTIONS_TTL_SECONDS
+    if skill.formatted_instructions is not None and fresh:
+        return skill.formatted_instructions
 
-    # Check if cached instructions are stale via file mtime.
-    if skill.instructions is not None and skill.instructions_mtime is not None:
-        try:
-            current_mtime = skill_file.stat().st_mtime
-        except OSError:
-            current_mtime = None
-        if current_mtime is not None and current_mtime != skill.instructions_mtime:
-            skill.instructions = None
-            skill.instructions_mtime = None
-
-    if skill.instructions is None:
-        if not skill_file.exists():
-            return f"SKILL.md not found at {skill.path}"
-        content = skill_file.read_text()
-        _, skill.instructions = parse_skill_md(content)
-        try:
-            skill.instructions_mtime = skill_file.stat().st_mtime
-        except OSError:
-            skill.instructions_mtime = None
-
-    return f"# Skill: {skill.name}\n\n{skill.instructions}"
+    try:
+        _, instructions = _ensure_parsed(skill)
+    except FileNotFoundError:
+        return f"SKILL.md not found at {skill.path}"
+    if skill.formatted_instructions is None:
+        # Composed once per load so repeat calls return the same string
+        # instead of re-concatenating a multi-KB body.
+        skill.formatted_instructions = f"# Skill: {skill.name}\n\n{instructions}"
+    return skill.formatted_instructions
+
+
+def _ensure_parsed(skill: Skill) -> tuple[dict[str, Any], str]:
+    """Return SKILL.md's (frontmatter, instructions), re-reading only if its mtime moved.
+
+    Shared by load, validate and lint so the file is parsed once per edit.
+    The mtime is taken before reading: a concurrent edit leaves a stale
+    mtime behind, which only forces another read next time.
+    """
+    skill_file = skill.path / "SKILL.md"
+    mtime = skill_file.stat().st_mtime
+    skill.instructions_checked_at = time.monotonic()
+    frontmatter, instructions = skill.frontmatter, skill.instructions
+    if frontmatter is not None and instructions is not None and mtime == skill.instructions_mtime:
+        return frontmatter, instructions
+
+    frontmatter, instructions = parse_skill_md(skill_file.read_text())
+    skill.frontmatter = frontmatter
+    skill.instructions = instructions
+    skill.instructions_mtime = mtime
+    skill.formatted_instructions = None
+    return frontmatter, instructions
 
 
 def _read_resource(cache: dict[str, Skill], skill_name: str, resource_name: str) -> str:
@@ -167,33 +94,31 @@ def _read_resource(cache: dict[str, Skill], skill_name: str, resource_name: str)
     skill = cache.get(skill_name)
     if skill is None:
         return f"Skill '{skill_name}' not found."
-    avail = ", ".join(sorted(skill.resources)) if skill.resources else "none"
-    error = _validate_resource_path(skill, resource_name, avail)
-    if error is not None:
-        return error
-    validator = PathValidator(workspace_root=skill.path)
-    resolved = validator.resolve_path(resource_name)
+    if not skill.has_resource(resource_name):
+        return f"Resource '{resource_name}' not listed. Available: {_available_resources(skill)}"
+    try:
+        resolved = skill.path_validator().resolve_path(resource_name)
+    except ValueError:
+        return "Error: resource path escapes skill directory."
+    return _read_resolved(skill, resource_name, resolved)
+
+
+def _read_resolved(skill: Skill, resource_name: str, resolved: Path) -> str:
+    # Resolve once and let the read report missing files or directories,
+    # rather than stat-ing the path before opening it.
     try:
         return resolved.read_text()
+    except FileNotFoundError:
+        return f"Resource '{resource_name}' not found. Available: {_available_resources(skill)}"
+    except IsADirectoryError:
+        return f"Resource '{resource_name}' is not a file."
     except (OSError, UnicodeDecodeError):
-        logger.warning("Failed to read resource %s for skill %s", resource_name, skill_name)
+        logger.warning("Failed to read resource %s for skill %s", resource_name, skill.name)
         return f"Error reading resource '{resource_name}'."
 
 
-def _validate_resource_path(skill: Skill, resource_name: str, avail: str) -> str | None:
-    """Return an error message if the resource path is invalid, else None."""
-    if resource_name not in skill.resources:
-        return f"Resource '{resource_name}' not listed. Available: {avail}"
-    validator = PathValidator(workspace_root=skill.path)
-    try:
-        resolved = validator.resolve_path(resource_name)
-    except ValueError:
-        return "Error: resource path escapes skill directory."
-    if not resolved.exists():
-        return f"Resource '{resource_name}' not found. Available: {avail}"
-    if not resolved.is_file():
-        return f"Resource '{resource_name}' is not a file."
-    return None
+def _available_resources(skill: Skill) -> str:
+    return ", ".join(sorted(skill.resources)) if skill.resources else "none"
 
 
 def _validate_skill(cache: dict[str, Skill], skill_name: str) -> str:
@@ -201,8 +126,7 @@ def _validate_skill(cache: dict[str, Skill], skill_name: str) -> str:
     if skill is None:
         return f"Skill '{skill_name}' not found."
     try:
-        content = (skill.path / "SKILL.md").read_text()
-        frontmatter, instructions = parse_skill_md(content)
+        frontmatter, instructions = _ensure_parsed(skill)
     except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError):
         logger.warning("Failed to validate skill %s", skill_name, exc_info=True)
         return f"Error validating skill '{skill_name}'."
@@ -214,8 +138,7 @@ def _lint_skill(cache: dict[str, Skill], skill_name: str) -> str:
     if skill is None:
         return f"Skill '{skill_name}' not found."
     try:
-        content = (skill.path / "SKILL.md").read_text()
-        _, instructions = parse_skill_md(content)
+        _, instructions = _ensure_parsed(skill)
     except (OSError, UnicodeDecodeError, ValueError, yaml.YAMLError):
         logger.warning("Failed to lint skill %s", skill_name, exc_info=True)
         return f"Error linting skill '{skill_name}'."
@@ -245,11 +168,14 @@ def create_skills_toolset(
 
     discovered = discover_skills(directories)
     cache: dict[str, Skill] = {s.name: s for s in discovered}
+    # The cache is never re-scanned and the listed fields never change after
+    # discovery, so the sorted listing is built once per toolset.
+    skill_list = _format_skill_list(cache)
 
     @toolset.tool(metadata=skill_meta)
     async def list_skills(ctx: RunContext[AgentDeps]) -> str:
         """Show available skills with names, descriptions, and tags."""
-        return _format_skill_list(cache)
+        return skill_list
 
     @toolset.tool(metadata=skill_meta)
     async def load_skill(ctx: RunContext[AgentDeps], skill_name: str) -> str:
@@ -0,0 +1,41 @@
+"""Per-transform cache of wrapped tools, keyed by source tool identity."""
+
+from __future__ import annotations
+
+import weakref
+from collections.abc import Callable
+
+from fastmcp.tools.tool import Tool
+
+_DEFAULT_MAX_SIZE = 512
+
+
+class ToolWrapCache:
+    """Remember the wrapper a transform built for each source tool.
+
+    Providers return the same Tool objects on every listing, so a transform's
+    wrapping work runs once per source tool.  Entries are keyed by ``id()``
+    because Tool is unhashable; a weakref detects a recycled id.  Each entry
+    pins its wrapper (which usually references the source tool), so the cache
+    is bounded and evicts its oldest entry first.
+    """
+
+    def __init__(self, wrap: Callable[[Tool], Tool], max_size: int = _DEFAULT_MAX_SIZE) -> None:
+        self._wrap = wrap
+        self._max_size = max_size
+        self._entries: dict[int, tuple[weakref.ref[Tool], Tool]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tool: Tool) -> Tool:
+        """Return the cached wrapper for *tool*, building it on first use."""
+        key = id(tool)
+        cached = self._entries.get(key)
+        if cached is not None and cached[0]() is tool:
+            return cached[1]
+        result = self._wrap(tool)
+        if len(self._entries) >= self._max_size:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (weakref.ref(tool), result)
+        return result
@@ -0,0 +1,109 @@
+"""Render conversation turns as markdown blocks for the daily log.
+
+Pure string work over pydantic-ai messages; the log files themselves are
+owned by :mod:`autopoiesis.store.conversation_log`.
+
+Dependencies: pydantic_ai.messages
+Wired in: store/conversation_log.py → append_turn()
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelRequest,
+    SystemPromptPart,
+    TextPart,
+    ToolCallPart,
+    UserPromptPart,
+)
+
+_SUMMARY_MAX_CHARS = 200
+"""Maximum characters kept for content summaries in log entries."""
+
+
+def _summarize(text: str, max_chars: int = _SUMMARY_MAX_CHARS) -> str:
+    """Truncate *text* to *max_chars* with an ellipsis if needed."""
+    text = text.strip()
+    if len(text) <= max_chars:
+        return text
+    return text[:max_chars] + "..."
+
+
+def _join_truncated(parts: Sequence[str], max_chars: int = _SUMMARY_MAX_CHARS) -> str:
+    """Return ``_summarize(" ".join(parts))`` without joining every part.
+
+    Tool-heavy replies can carry many multi-KB text parts; joining stops as
+    soon as the stripped prefix already exceeds *max_chars*.
+    """
+    size = 0
+    for idx, part in enumerate(parts):
+        size += len(part) + 1
+        if size > max_chars + 1:
+            head = " ".join(parts[: idx + 1]).strip()
+            if len(head) > max_chars:
+                return head[:max_chars] + "..."
+    return _summarize(" ".join(parts), max_chars)
+
+
+def _prompt_text(part: UserPromptPart) -> str:
+    """Return a user prompt's text, stringifying non-text content (e.g. a list of parts)."""
+    content = part.content
+    return content if isinstance(content, str) else str(content)
+
+
+def parse_messages(
+    messages: Sequence[ModelMessage],
+) -> list[tuple[str, str, list[str]]]:
+    """Convert *messages* into (role, summary, tool_names) triples.
+
+    Roles are ``"user"``, ``"system"``, or ``"assistant"``.
+    Tool names are collected from :class:`~pydantic_ai.messages.ToolCallPart`
+    objects only — results are deliberately excluded (too large).  Each part
+    is dispatched once; the branches read ``content`` directly instead of
+    re-checking the part type in a helper.
+    """
+    entries: list[tuple[str, str, list[str]]] = []
+
+    for msg in messages:
+        if isinstance(msg, ModelRequest):
+            for part in msg.parts:
+                if isinstance(part, UserPromptPart):
+                    entries.append(("user", _summarize(_prompt_text(part)), []))
+                elif isinstance(part, SystemPromptPart):
+                    entries.append(("system", _summarize(part.content), []))
+                # ToolReturnPart is a request part but we skip it (it's a result)
+
+        else:  # ModelResponse
+            tool_names: list[str] = []
+            text_parts: list[str] = []
+            for part in msg.parts:
+                if isinstance(part, TextPart):
+                    text_parts.append(part.content)
+                elif isinstance(part, ToolCallPart):
+                    tool_names.append(part.tool_name)
+            summary = _join_truncated(text_parts)
+            entries.append(("assistant", summary, tool_names))
+
+    return entries
+
+
+def format_entry(
+    timestamp: datetime | str,
+    entries: list[tuple[str, str, list[str]]],
+) -> str:
+    """Render a single turn block as a markdown string.
+
+    *timestamp* may be an already-rendered ISO 8601 string so callers that
+    need it elsewhere format the datetime only once.
+    """
+    iso = timestamp if isinstance(timestamp, str) else timestamp.isoformat()
+    lines: list[str] = [f"## {iso}", ""]
+    for role, summary, tools in entries:
+        tool_str = f" *(tools: {', '.join(tools)})*" if tools else ""
+        lines.append(f"- **{role}**: {summary}{tool_str}")
+    lines.append("")
+    return "\n".join(lines)
@@ -15,27 +15,24 @@ Entry format (one per ModelRequest / ModelResponse in the turn):
 Log rotation removes files whose date is older than the configured
 *retention_days* ceiling.
 
-Dependencies: pydantic_ai.messages, store.knowledge
+Dependencies: pydantic_ai.messages, store.conversation_format, store.log_indexer
 Wired in: agent/worker.py → run_agent_step()
 """
 
 from __future__ import annotations
 
 import logging
+import os
+import re
+import threading
 from collections.abc import Sequence
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
-from pydantic_ai.messages import (
-    ModelMessage,
-    ModelRequest,
-    SystemPromptPart,
-    TextPart,
-    ToolCallPart,
-    UserPromptPart,
-)
+from pydantic_ai.messages import ModelMessage
 
-from autopoiesis.store.knowledge import index_file, init_knowledge_index
+from autopoiesis.store.conversation_format import format_entry, parse_messages
+from autopoiesis.store.log_indexer import schedule_log_index
 
 logger = logging.getLogger(__name__)
 
@@ -43,83 +40,24 @@ logger = logging.getLogger(__name__)
 # Constants
 # ---------------------------------------------------------------------------
 
-_SUMMARY_MAX_CHARS = 200
-"""Maximum characters kept for content summaries in log entries."""
-
 _LOG_SUBDIR = "logs"
 """Sub-directory under knowledge_root where agent log dirs live."""
 
+_MAX_OPEN_LOGS = 64
+"""Cap on cached append fds; the oldest is closed when exceeded."""
 
-# ---------------------------------------------------------------------------
-# Internal helpers
-# ---------------------------------------------------------------------------
-
-
-def _summarize(text: str, max_chars: int = _SUMMARY_MAX_CHARS) -> str:
-    """Truncate *text* to *max_chars* with an ellipsis if needed."""
-    text = text.strip()
-    if len(text) <= max_chars:
-        return text
-    return text[:max_chars] + "..."
-
-
-def _extract_content(part: object) -> str:
-    """Return the text content of a message part, or empty string."""
-    if isinstance(part, (UserPromptPart, SystemPromptPart, TextPart)):
-        content = part.content
-        if isinstance(content, str):
-            return content
-        # UserPromptPart can hold arbitrary content (e.g. list of parts)
-        return str(content)
-    return ""
-
+_LOG_DATE_RE = re.compile(r"([0-9]{4})-([0-9]{2})-([0-9]{2})")
+"""Daily log file stem, ``YYYY-MM-DD``."""
 
-def parse_messages(
-    messages: Sequence[ModelMessage],
-) -> list[tuple[str, str, list[str]]]:
-    """Convert *messages* into (role, summary, tool_names) triples.
-
-    Roles are ``"user"``, ``"system"``, or ``"assistant"``.
-    Tool names are collected from :class:`~pydantic_ai.messages.ToolCallPart`
-    objects only — results are deliberately excluded (too large).
-    """
-    entries: list[tuple[str, str, list[str]]] = []
-
-    for msg in messages:
-        if isinstance(msg, ModelRequest):
-            for part in msg.parts:
-                if isinstance(part, UserPromptPart):
-                    entries.append(("user", _summarize(_extract_content(part)), []))
-                elif isinstance(part, SystemPromptPart):
-                    entries.append(("system", _summarize(_extract_content(part)), []))
-                # ToolReturnPart is a request part but we skip it (it's a result)
-
-        else:  # ModelResponse
-            tool_names: list[str] = []
-            text_parts: list[str] = []
-            for part in msg.parts:
-                if isinstance(part, TextPart):
-                    text_parts.append(_extract_content(part))
-                elif isinstance(part, ToolCallPart):
-                    tool_names.append(part.tool_name)
-            summary = _summarize(" ".join(text_parts))
-            entries.append(("assistant", summary, tool_names))
-
-    return entries
-
-
-def format_entry(
-    timestamp: datetime,
-    entries: list[tuple[str, str, list[str]]],
-) -> str:
-    """Render a single turn block as a markdown string."""
-    lines: list[str] = [f"## {timestamp.isoformat()}", ""]
-    for role, summary, tools in entries:
-        tool_str = f" *(tools: {', '.join(tools)})*" if tools else ""
-        lines.append(f"- **{role}**: {summary}{tool_str}")
-    lines.append("")
-    return "\n".join(lines)
+_LOG_FILE_MODE = 0o644
+"""Permissions for newly created log files (before umask)."""
 
+# One raw O_APPEND fd per (knowledge_root, agent_id), reused across turns and
+# swapped when the date rolls over: a turn costs one pre-encoded os.write
+# instead of an open/close pair and a text-layer round trip, and each block
+# lands as a single append.  The lock serialises workers appending from threads.
+_open_logs: dict[tuple[Path, str], tuple[Path, int]] = {}
+_open_logs_lock = threading.Lock()
 
 # ---------------------------------------------------------------------------
 # Log directory helpers
@@ -153,7 +91,8 @@ def append_turn(
 
     Parses *messages* to extract role, content summary, and tool call names,
     then appends a formatted markdown block to the daily file.  The file is
-    subsequently re-indexed in the FTS5 knowledge database.
+    then queued for re-indexing in the FTS5 knowledge database; see
+    :mod:`autopoiesis.store.log_indexer`.
 
     Parameters
     ----------
@@ -176,36 +115,64 @@ def append_turn(
     if not messages:
         return None
 
-    ts = timestamp or datetime.now(UTC)
-    date_str = ts.strftime("%Y-%m-%d")
+    # Format the timestamp once: the ISO form heads the entry and its date
+    # prefix (``YYYY-MM-DD``) names the daily file.
+    iso_ts = (timestamp or datetime.now(UTC)).isoformat()
+    date_str = iso_ts[:10]
 
     log_path = _log_file(knowledge_root, agent_id, date_str)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
 
     entries = parse_messages(messages)
     if not entries:
         return None
 
-    block = format_entry(ts, entries)
+    data = format_entry(iso_ts, entries).encode("utf-8")
+    with _open_logs_lock:
+        fd, is_empty = _log_fd(knowledge_root, agent_id, log_path)
+        if is_empty:
+            header = f"# Conversation log — {agent_id} — {date_str}\n\n"
+            data = header.encode("utf-8") + data
+        _write_all(fd, data)
 
-    # Append to daily file (create with header if new)
-    if not log_path.exists():
-        header = f"# Conversation log — {agent_id} — {date_str}\n\n"
-        log_path.write_text(header + block, encoding="utf-8")
-    else:
-        with log_path.open("a", encoding="utf-8") as fh:
-            fh.write(block)
-
-    # Index (or re-index) the updated file in the FTS5 knowledge database.
-    try:
-        init_knowledge_index(knowledge_db_path)
-        index_file(knowledge_db_path, knowledge_root, log_path)
-    except Exception:
-        logger.warning("Failed to index conversation log %s", log_path, exc_info=True)
+    # Re-index the updated file in the FTS5 knowledge database off-thread.
+    schedule_log_index(knowledge_db_path, knowledge_root, log_path)
 
     return log_path
 
 
+def _log_fd(knowledge_root: Path, agent_id: str, log_path: Path) -> tuple[int, bool]:
+    """Return the cached ``O_APPEND`` fd for *log_path* and whether the file is empty.
+
+    An fd whose file was deleted underneath it (``st_nlink == 0``) is
+    reopened so writes never land in an orphaned inode.  Callers hold
+    ``_open_logs_lock``.
+    """
+    key = (knowledge_root, agent_id)
+    cached = _open_logs.pop(key, None)
+    if cached is not None:
+        cached_path, fd = cached
+        st = os.fstat(fd)
+        if cached_path == log_path and st.st_nlink > 0:
+            _open_logs[key] = cached
+            return fd, st.st_size == 0
+        os.close(fd)
+    elif len(_open_logs) >= _MAX_OPEN_LOGS:
+        _, oldest = _open_logs.pop(next(iter(_open_logs)))
+        os.close(oldest)
+
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, _LOG_FILE_MODE)
+    _open_logs[key] = (log_path, fd)
+    return fd, os.fstat(fd).st_size == 0
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write *data* to *fd*, retrying short writes."""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
 def rotate_logs(
     knowledge_root: Path,
     agent_id: str,
@@ -231,25 +198,45 @@ def rotate_logs(
     if retention_days <= 0:
         return []
 
-    cutoff = datetime.now(UTC).date() - timedelta(days=retention_days)
+    cutoff = (datetime.now(UTC).date() - timedelta(days=retention_days)).toordinal()
     log_dir = _log_dir(knowledge_root, agent_id)
 
-    if not log_dir.is_dir():
-        return []
-
+    # scandir hands back names and cached file types, so only the files
+    # actually deleted become Path objects.  A missing directory surfaces as
+    # the scandir error instead of costing a separate stat up front.
     deleted: list[Path] = []
-    for log_file in log_dir.glob("*.md"):
-        stem = log_file.stem  # "YYYY-MM-DD"
-        try:
-            file_date = datetime.strptime(stem, "%Y-%m-%d").date()
-        except ValueError:
-            continue  # skip files with unexpected names
-        if file_date < cutoff:
-            try:
-                log_file.unlink()
-                deleted.append(log_file)
-                logger.debug("Rotated old conversation log: %s", log_file)
-            except OSError:
-                logger.warning("Failed to delete old log file: %s", log_file, exc_info=True)
+    try:
+        entries = os.scandir(log_dir)
+    except (FileNotFoundError, NotADirectoryError):
+        return []
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".md"):
+                continue
+            file_day = _log_day_ordinal(entry.name[:-3])  # "YYYY-MM-DD"
+            if file_day is None or not entry.is_file(follow_symlinks=False):
+                continue  # unexpected names, directories and symlinks
+            if file_day < cutoff:
+                try:
+                    os.unlink(entry.path)
+                    deleted.append(Path(entry.path))
+                    logger.debug("Rotated old conversation log: %s", entry.path)
+                except OSError:
+                    logger.warning("Failed to delete old log file: %s", entry.path, exc_info=True)
 
     return deleted
+
+
+def _log_day_ordinal(stem: str) -> int | None:
+    """Return the proleptic ordinal of a ``YYYY-MM-DD`` stem, or ``None``.
+
+    A fixed-width regex plus ``date()`` is much cheaper than ``strptime``,
+    and comparing ordinals avoids building ``date`` objects for the cutoff.
+    """
+    match = _LOG_DATE_RE.fullmatch(stem)
+    if match is None:
+        return None
+    try:
+        return date(int(match[1]), int(match[2]), int(match[3])).toordinal()
+    except ValueError:
+        return None  # e.g. 2026-02-30
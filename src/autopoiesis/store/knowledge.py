@@ -6,8 +6,8 @@ provides a search index that is rebuilt from files — never the other way aroun
 
 from __future__ import annotations
 
+import json
 import logging
-import os
 import re
 from contextlib import closing
 from dataclasses import dataclass, field
@@ -17,7 +17,23 @@ from typing import Any, cast
 
 import yaml
 
-from autopoiesis.db import open_db
+from autopoiesis.store.knowledge_db import search_connection
+from autopoiesis.store.knowledge_index import (
+    CREATE_CHUNKS_SQL,
+    CREATE_FILE_META_SQL,
+    CREATE_FTS_SQL,
+    CREATE_TRIGGERS_SQL,
+    FileColumns,
+    ParsedFile,
+    iter_md,
+    map_batched,
+    migrate_file_meta,
+    open_index_db,
+    parse_file,
+    parse_file_batch,
+    scan_links,
+    write_file_rows,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +93,11 @@ def parse_frontmatter(content: str, file_path: Path | None = None) -> FileMeta:
     Falls back to file mtime when fields are missing or frontmatter is absent.
     Unknown types are treated as ``note``.
     """
+    return _read_frontmatter(content, file_path)[0]
+
+
+def _read_frontmatter(content: str, file_path: Path | None) -> tuple[FileMeta, str | None]:
+    """Return the parsed metadata plus the raw frontmatter ``type`` string."""
     meta = FileMeta()
 
     # Derive defaults from file mtime if available
@@ -87,20 +108,22 @@ def parse_frontmatter(content: str, file_path: Path | None = None) -> FileMeta:
 
     m = _FRONTMATTER_RE.match(content)
     if m is None:
-        return meta
+        return meta, None
 
     try:
         data = yaml.safe_load(m.group(1))
     except yaml.YAMLError:
-        return meta
+        return meta, None
 
     if not isinstance(data, dict):
-        return meta
+        return meta, None
 
     fm = cast(dict[str, Any], data)
 
     raw_type = fm.get("type")
-    if isinstance(raw_type, str) and raw_type in known_types():
+    if not isinstance(raw_type, str):
+        raw_type = None
+    elif raw_type in known_types():
         meta.type = raw_type
 
     for key in ("created", "modified"):
@@ -108,7 +131,7 @@ def parse_frontmatter(content: str, file_path: Path | None = None) -> FileMeta:
         if dt is not None:
             setattr(meta, key, dt)
 
-    return meta
+    return meta, raw_type
 
 
 def strip_frontmatter(content: str) -> str:
@@ -120,8 +143,6 @@ def strip_frontmatter(content: str) -> str:
 # Wikilink backlink index
 # ---------------------------------------------------------------------------
 
-_WIKILINK_RE = re.compile(r"\[\[([^\]|]+?)(?:\|[^\]]+)?\]\]")
-
 
 def build_backlink_index(knowledge_root: Path) -> dict[str, set[str]]:
     """Scan all markdown files for ``[[target]]`` wikilinks.
@@ -133,91 +154,24 @@ def build_backlink_index(knowledge_root: Path) -> dict[str, set[str]]:
     if not knowledge_root.is_dir():
         return index
 
-    root_str = str(knowledge_root)
-    finditer = _WIKILINK_RE.finditer
-
-    for dirpath, _dirnames, filenames in os.walk(root_str):
-        for filename in filenames:
-            if not filename.endswith(".md"):
-                continue
-            md = os.path.join(dirpath, filename)
-            rel = os.path.relpath(md, root_str)
-            try:
-                with open(md, encoding="utf-8") as handle:
-                    text = handle.read()
-            except (OSError, UnicodeDecodeError):
-                continue
-            if "[[" not in text:
-                continue
-
-            for match in finditer(text):
-                target = match.group(1).strip().lower()
-                if not target:
-                    continue
-                sources = index.get(target)
-                if sources is None:
-                    index[target] = {rel}
-                else:
-                    sources.add(rel)
+    files = [(rel, entry.path) for rel, entry in iter_md(knowledge_root)]
+    for links in map_batched(scan_links, files):
+        for target, rel in links:
+            sources = index.get(target)
+            if sources is None:
+                index[target] = {rel}
+            else:
+                sources.add(rel)
 
     return index
 
 
-# ---------------------------------------------------------------------------
-# Schema
-# ---------------------------------------------------------------------------
-
-_CREATE_CHUNKS_SQL = """
-CREATE TABLE IF NOT EXISTS knowledge_chunks (
-    id INTEGER PRIMARY KEY AUTOINCREMENT,
-    file_path TEXT NOT NULL,
-    chunk_index INTEGER NOT NULL,
-    content TEXT NOT NULL,
-    line_start INTEGER NOT NULL,
-    line_end INTEGER NOT NULL,
-    modified_at TEXT NOT NULL,
-    UNIQUE(file_path, chunk_index)
-);
-"""
-
-_CREATE_FTS_SQL = """
-CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts
-USING fts5(content, file_path, content='knowledge_chunks', content_rowid='id');
-"""
-
-_CREATE_TRIGGERS_SQL = """
-CREATE TRIGGER IF NOT EXISTS kc_ai AFTER INSERT ON knowledge_chunks BEGIN
-    INSERT INTO knowledge_fts(rowid, content, file_path)
-    VALUES (new.id, new.content, new.file_path);
-END;
-
-CREATE TRIGGER IF NOT EXISTS kc_ad AFTER DELETE ON knowledge_chunks BEGIN
-    INSERT INTO knowledge_fts(knowledge_fts, rowid, content, file_path)
-    VALUES ('delete', old.id, old.content, old.file_path);
-END;
-
-CREATE TRIGGER IF NOT EXISTS kc_au AFTER UPDATE ON knowledge_chunks BEGIN
-    INSERT INTO knowledge_fts(knowledge_fts, rowid, content, file_path)
-    VALUES ('delete', old.id, old.content, old.file_path);
-    INSERT INTO knowledge_fts(rowid, content, file_path)
-    VALUES (new.id, new.content, new.file_path);
-END;
-"""
-
-_CREATE_FILE_META_SQL = """
-CREATE TABLE IF NOT EXISTS knowledge_file_meta (
-    file_path TEXT PRIMARY KEY,
-    modified_at TEXT NOT NULL,
-    indexed_at TEXT NOT NULL
-);
-"""
-
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-CHUNK_SIZE_LINES = 30
-"""Number of lines per chunk when splitting files for indexing."""
+_REINDEX_COMMIT_EVERY = 500
+"""Files re-indexed per transaction during a full ``reindex_knowledge`` pass."""
 
 CONTEXT_BUDGET_CHARS = 25_000
 """Maximum characters of auto-loaded context (~25 KB for ASCII)."""
@@ -254,52 +208,45 @@ class SearchResult:
 def init_knowledge_index(db_path: str) -> None:
     """Create the knowledge index tables and triggers."""
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-    with closing(open_db(Path(db_path))) as conn, conn:
-        conn.execute(_CREATE_CHUNKS_SQL)
-        conn.execute(_CREATE_FTS_SQL)
-        conn.executescript(_CREATE_TRIGGERS_SQL)
-        conn.execute(_CREATE_FILE_META_SQL)
+    with closing(open_index_db(db_path)) as conn, conn:
+        conn.execute(CREATE_CHUNKS_SQL)
+        conn.execute(CREATE_FTS_SQL)
+        conn.executescript(CREATE_TRIGGERS_SQL)
+        conn.execute(CREATE_FILE_META_SQL)
+        migrate_file_meta(conn)
         conn.commit()
 
 
-def _chunk_file(lines: list[str], chunk_size: int = CHUNK_SIZE_LINES) -> list[tuple[int, int, str]]:
-    """Split lines into chunks, returning (line_start, line_end, content)."""
-    chunks: list[tuple[int, int, str]] = []
-    for i in range(0, len(lines), chunk_size):
-        batch = lines[i : i + chunk_size]
-        chunks.append((i + 1, i + len(batch), "\n".join(batch)))
-    return chunks
-
-
 def index_file(db_path: str, knowledge_root: Path, file_path: Path) -> None:
     """Index or re-index a single markdown file."""
     rel = str(file_path.relative_to(knowledge_root))
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except (OSError, UnicodeDecodeError):
+        st_mtime = file_path.stat().st_mtime
+    except OSError:
         logger.warning("Cannot read %s for indexing", file_path)
         return
+    mtime = _mtime_iso(st_mtime)
+    parsed = parse_file(rel, file_path, mtime)
+    if parsed is None:
+        return
+    columns = _file_columns(parsed, file_path)
+    with closing(open_index_db(db_path)) as conn, conn:
+        row = conn.execute(
+            "SELECT content_sha256 FROM knowledge_file_meta WHERE file_path = ?", (rel,)
+        ).fetchone()
+        write_file_rows(conn, rel, mtime, parsed, columns, row[0] if row else None)
+
+
+def _mtime_iso(st_mtime: float) -> str:
+    return datetime.fromtimestamp(st_mtime, tz=UTC).isoformat()
 
-    mtime = datetime.fromtimestamp(file_path.stat().st_mtime, tz=UTC).isoformat()
-    now = datetime.now(UTC).isoformat()
-    lines = content.splitlines()
-    chunks = _chunk_file(lines)
-
-    with closing(open_db(Path(db_path))) as conn, conn:
-        conn.execute("DELETE FROM knowledge_chunks WHERE file_path = ?", (rel,))
-        for idx, (line_start, line_end, chunk_content) in enumerate(chunks):
-            conn.execute(
-                """INSERT INTO knowledge_chunks
-                   (file_path, chunk_index, content, line_start, line_end, modified_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (rel, idx, chunk_content, line_start, line_end, mtime),
-            )
-        conn.execute(
-            """INSERT OR REPLACE INTO knowledge_file_meta (file_path, modified_at, indexed_at)
-               VALUES (?, ?, ?)""",
-            (rel, mtime, now),
-        )
-        conn.commit()
+
+def _file_columns(parsed: ParsedFile, file_path: Path) -> FileColumns:
+    # The raw type is stored, not meta.type: whether it is known depends on
+    # register_types() calls that may happen after indexing, so search maps
+    # unknown types to "note" at query time.
+    meta, raw_type = _read_frontmatter(parsed.content, file_path)
+    return raw_type or meta.type, meta.created.timestamp(), meta.modified.timestamp()
 
 
 def reindex_knowledge(db_path: str, knowledge_root: Path) -> int:
@@ -312,34 +259,51 @@ def reindex_knowledge(db_path: str, knowledge_root: Path) -> int:
     if not knowledge_root.is_dir():
         return 0
 
-    current_files: dict[str, Path] = {}
-    for md_file in knowledge_root.rglob("*.md"):
-        rel = str(md_file.relative_to(knowledge_root))
-        current_files[rel] = md_file
-
-    # Load existing file metadata
-    indexed_meta: dict[str, str] = {}
-    with closing(open_db(Path(db_path))) as conn:
-        for row in conn.execute("SELECT file_path, modified_at FROM knowledge_file_meta"):
-            indexed_meta[row["file_path"]] = row["modified_at"]
-
-    # Remove deleted files from the index
-    deleted = set(indexed_meta) - set(current_files)
-    if deleted:
-        with closing(open_db(Path(db_path))) as conn, conn:
-            for rel in deleted:
-                conn.execute("DELETE FROM knowledge_chunks WHERE file_path = ?", (rel,))
-                conn.execute("DELETE FROM knowledge_file_meta WHERE file_path = ?", (rel,))
-            conn.commit()
-
-    # Index new or modified files
-    reindexed = 0
-    for rel, filepath in current_files.items():
-        mtime = datetime.fromtimestamp(filepath.stat().st_mtime, tz=UTC).isoformat()
-        if rel in indexed_meta and indexed_meta[rel] == mtime:
+    # rel -> (path, mtime); the mtime comes from the walker's entry so each
+    # file is stat'ed once.
+    current_files: dict[str, tuple[Path, str]] = {}
+    for rel, entry in iter_md(knowledge_root):
+        try:
+            st_mtime = entry.stat().st_mtime
+        except OSError:
             continue
-        index_file(db_path, knowledge_root, filepath)
-        reindexed += 1
+        current_files[rel] = (Path(entry.path), _mtime_iso(st_mtime))
+
+    reindexed = 0
+    # One connection for the whole pass; writes are grouped into transactions
+    # of _REINDEX_COMMIT_EVERY files so a cold start does not fsync per file
+    # nor grow the WAL without bound.
+    with closing(open_index_db(db_path)) as conn, conn:
+        # file_path -> (modified_at, content_sha256)
+        indexed_meta: dict[str, tuple[str, str | None]] = {
+            row[0]: (row[1], row[2])
+            for row in conn.execute(
+                "SELECT file_path, modified_at, content_sha256 FROM knowledge_file_meta"
+            )
+        }
+
+        # Remove deleted files from the index
+        for rel in indexed_meta.keys() - current_files.keys():
+            conn.execute("DELETE FROM knowledge_chunks WHERE file_path = ?", (rel,))
+            conn.execute("DELETE FROM knowledge_file_meta WHERE file_path = ?", (rel,))
+
+        # Read and chunk new or modified files on worker threads; this thread
+        # parses frontmatter (CPU-bound, so no gain from the pool) and stays
+        # the only SQLite writer.
+        stale = [
+            (rel, path, mtime)
+            for rel, (path, mtime) in current_files.items()
+            if rel not in indexed_meta or indexed_meta[rel][0] != mtime
+        ]
+        for results in map_batched(parse_file_batch, stale):
+            for rel, path, mtime, parsed in results:
+                if parsed is not None:
+                    indexed_sha256 = indexed_meta[rel][1] if rel in indexed_meta else None
+                    columns = _file_columns(parsed, path)
+                    write_file_rows(conn, rel, mtime, parsed, columns, indexed_sha256)
+                reindexed += 1
+                if reindexed % _REINDEX_COMMIT_EVERY == 0:
+                    conn.commit()
 
     return reindexed
 
@@ -350,6 +314,36 @@ def reindex_knowledge(db_path: str, knowledge_root: Path) -> int:
 
 _FTS5_KEYWORDS = frozenset({"AND", "OR", "NOT", "NEAR"})
 
+_SNIPPET_TOKENS = 32
+"""Maximum tokens in the FTS5 ``snippet()`` excerpt returned per hit."""
+
+_EFFECTIVE_TYPE_SQL = (
+    "CASE WHEN m.file_type IN (SELECT value FROM json_each(:known_types))"
+    " THEN m.file_type ELSE 'note' END"
+)
+
+# Kept as a constant so the pooled connection's statement cache, keyed by
+# query text, reuses the prepared FTS5 statement across searches.
+# Type and date filters run against the frontmatter captured at index time.
+# The stored type is the raw frontmatter value; it resolves against the
+# current known types (passed as a JSON array) so later register_types()
+# calls apply to files indexed earlier.
+# snippet() excerpts the matching region inside SQLite, so the full chunk
+# text never reaches Python.
+_SEARCH_SQL = f"""
+SELECT c.file_path, c.line_start, c.line_end,
+       snippet(knowledge_fts, 0, '', '', '…', {_SNIPPET_TOKENS}) AS snippet,
+       rank AS score, {_EFFECTIVE_TYPE_SQL} AS file_type
+FROM knowledge_fts f
+JOIN knowledge_chunks c ON f.rowid = c.id
+JOIN knowledge_file_meta m ON m.file_path = c.file_path
+WHERE knowledge_fts MATCH :query
+  AND (:file_type IS NULL OR {_EFFECTIVE_TYPE_SQL} = :file_type)
+  AND (:since IS NULL OR m.created_ts >= :since OR m.modified_ts >= :since)
+ORDER BY rank
+LIMIT :limit
+"""
+
 
 def sanitize_fts_query(query: str) -> str:
     """Turn user input into a safe FTS5 query string."""
@@ -374,61 +368,37 @@ def search_knowledge(
     Optional filters:
 
     * *type_filter* - only return results from files whose frontmatter
-      ``type`` matches (requires *knowledge_root*).
+      ``type`` matches.
     * *since* - only return results from files created or modified on/after
-      this datetime (requires *knowledge_root*).
+      this datetime.
+
+    Both filters use the frontmatter recorded when the file was last indexed.
+    *knowledge_root* is accepted for backwards compatibility and unused.
     """
     fts_query = sanitize_fts_query(query)
     if not fts_query:
         return []
-    with closing(open_db(Path(db_path))) as conn:
-        rows = conn.execute(
-            """
-            SELECT c.file_path, c.line_start, c.line_end, c.content,
-                   rank AS score
-            FROM knowledge_fts f
-            JOIN knowledge_chunks c ON f.rowid = c.id
-            WHERE knowledge_fts MATCH ?
-            ORDER BY rank
-            LIMIT ?
-            """,
-            (fts_query, limit * 5 if (type_filter or since) else limit),
-        ).fetchall()
-
-    results: list[SearchResult] = []
-    _meta_cache: dict[str, FileMeta] = {}
-
-    for row in rows:
-        fp = row["file_path"]
-
-        if (type_filter or since) and knowledge_root is not None:
-            if fp not in _meta_cache:
-                abs_path = knowledge_root / fp
-                try:
-                    content = abs_path.read_text(encoding="utf-8")
-                except (OSError, UnicodeDecodeError):
-                    content = ""
-                _meta_cache[fp] = parse_frontmatter(content, abs_path)
-
-            meta = _meta_cache[fp]
-
-            if type_filter and meta.type != type_filter:
-                continue
-            if since and meta.created < since and meta.modified < since:
-                continue
-
-        results.append(
-            SearchResult(
-                file_path=fp,
-                line_start=row["line_start"],
-                line_end=row["line_end"],
-                snippet=row["content"][:500],
-                score=float(row["score"]),
-            )
+    params = {
+        "query": fts_query,
+        "file_type": type_filter or None,
+        "known_types": json.dumps(sorted(known_types())),
+        "since": since.timestamp() if since else None,
+        "limit": limit,
+    }
+    with search_connection(db_path) as conn:
+        rows = conn.execute(_SEARCH_SQL, params).fetchall()
+
+    results = [
+        SearchResult(
+            file_path=row["file_path"],
+            line_start=row["line_start"],
+            line_end=row["line_end"],
+            snippet=row["snippet"],
+            score=float(row["score"]),
+            file_type=row["file_type"],
         )
-        if len(results) >= limit:
-            break
-
+        for row in rows
+    ]
     return results
 
 
@@ -0,0 +1,96 @@
+"""Pooled SQLite read connections for knowledge search.
+
+Dependencies: (stdlib only)
+Wired in: store/knowledge.py → search_knowledge(), server/app.py (shutdown)
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# One long-lived connection per knowledge DB so repeated searches reuse the
+# statement cache (FTS5 MATCH queries are costly to prepare) and a warm page
+# cache.  Each connection has its own lock, so searches against different DBs
+# run concurrently; _pool_lock only guards the map itself and is never held
+# while a query runs.  In WAL mode each autocommit SELECT reads the latest
+# committed snapshot, so writes from the indexer connections are still seen.
+_STATEMENT_CACHE_SIZE = 256
+_MAX_CONNECTIONS = 8
+"""Pooled DBs kept open at once; the oldest is closed beyond this."""
+
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA cache_size=-20000",  # ~20 MB of page cache
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA temp_store=MEMORY",
+)
+
+
+@dataclass
+class _PooledConnection:
+    conn: sqlite3.Connection
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    closed: bool = False
+
+    def close(self) -> None:
+        """Close once the current user (if any) releases the connection."""
+        with self.lock:
+            self.closed = True
+            self.conn.close()
+
+
+_pool: dict[str, _PooledConnection] = {}
+_pool_lock = threading.Lock()
+
+
+def _connect(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(
+        Path(db_path),
+        check_same_thread=False,
+        cached_statements=_STATEMENT_CACHE_SIZE,
+    )
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+def _checkout(db_path: str) -> _PooledConnection:
+    evicted: _PooledConnection | None = None
+    with _pool_lock:
+        entry = _pool.get(db_path)
+        if entry is None:
+            if len(_pool) >= _MAX_CONNECTIONS:
+                evicted = _pool.pop(next(iter(_pool)))
+            entry = _PooledConnection(_connect(db_path))
+            _pool[db_path] = entry
+    if evicted is not None:
+        evicted.close()
+    return entry
+
+
+@contextmanager
+def search_connection(db_path: str) -> Iterator[sqlite3.Connection]:
+    """Yield the pooled read connection for *db_path*, held exclusively."""
+    while True:
+        entry = _checkout(db_path)
+        with entry.lock:
+            # Evicted or shut down between checkout and locking: fetch again.
+            if entry.closed:
+                continue
+            yield entry.conn
+            return
+
+
+def close_search_connections() -> None:
+    """Close every pooled knowledge search connection (server shutdown)."""
+    with _pool_lock:
+        entries = list(_pool.values())
+        _pool.clear()
+    for entry in entries:
+        entry.close()
@@ -0,0 +1,287 @@
+"""Knowledge index schema, file scanning and index-writing helpers.
+
+Walks the knowledge tree, reads and chunks files on a small thread pool, and
+writes chunk and metadata rows.  Frontmatter interpretation and the public
+indexing API stay in ``store/knowledge.py``.
+
+Dependencies: db
+Wired in: store/knowledge.py → init_knowledge_index(), index_file(),
+    reindex_knowledge(), build_backlink_index()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from autopoiesis.db import open_db
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Schema
+# ---------------------------------------------------------------------------
+
+CREATE_CHUNKS_SQL = """
+CREATE TABLE IF NOT EXISTS knowledge_chunks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    file_path TEXT NOT NULL,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    line_start INTEGER NOT NULL,
+    line_end INTEGER NOT NULL,
+    modified_at TEXT NOT NULL,
+    UNIQUE(file_path, chunk_index)
+);
+"""
+
+CREATE_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS knowledge_fts
+USING fts5(content, file_path, content='knowledge_chunks', content_rowid='id');
+"""
+
+CREATE_TRIGGERS_SQL = """
+CREATE TRIGGER IF NOT EXISTS kc_ai AFTER INSERT ON knowledge_chunks BEGIN
+    INSERT INTO knowledge_fts(rowid, content, file_path)
+    VALUES (new.id, new.content, new.file_path);
+END;
+
+CREATE TRIGGER IF NOT EXISTS kc_ad AFTER DELETE ON knowledge_chunks BEGIN
+    INSERT INTO knowledge_fts(knowledge_fts, rowid, content, file_path)
+    VALUES ('delete', old.id, old.content, old.file_path);
+END;
+
+CREATE TRIGGER IF NOT EXISTS kc_au AFTER UPDATE ON knowledge_chunks BEGIN
+    INSERT INTO knowledge_fts(knowledge_fts, rowid, content, file_path)
+    VALUES ('delete', old.id, old.content, old.file_path);
+    INSERT INTO knowledge_fts(rowid, content, file_path)
+    VALUES (new.id, new.content, new.file_path);
+END;
+"""
+
+# file_type, created_ts and modified_ts capture the parsed frontmatter
+# (epoch seconds) at index time so search filters run in SQL.  content_sha256
+# lets a re-index skip rewriting chunks when only the mtime changed.
+CREATE_FILE_META_SQL = """
+CREATE TABLE IF NOT EXISTS knowledge_file_meta (
+    file_path TEXT PRIMARY KEY,
+    modified_at TEXT NOT NULL,
+    indexed_at TEXT NOT NULL,
+    file_type TEXT NOT NULL DEFAULT 'note',
+    created_ts REAL,
+    modified_ts REAL,
+    content_sha256 TEXT
+);
+"""
+
+FILE_META_COLUMNS = {
+    "file_type": "TEXT NOT NULL DEFAULT 'note'",
+    "created_ts": "REAL",
+    "modified_ts": "REAL",
+    "content_sha256": "TEXT",
+}
+"""Columns added to ``knowledge_file_meta`` after its first release."""
+
+UPSERT_FILE_META_SQL = """
+INSERT OR REPLACE INTO knowledge_file_meta
+    (file_path, modified_at, indexed_at, file_type, created_ts, modified_ts, content_sha256)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+INSERT_CHUNK_SQL = """
+INSERT INTO knowledge_chunks
+    (file_path, chunk_index, content, line_start, line_end, modified_at)
+VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+CHUNK_SIZE_LINES = 30
+"""Number of lines per chunk when splitting files for indexing."""
+
+
+def open_index_db(db_path: str) -> sqlite3.Connection:
+    """Open the knowledge index for writing.
+
+    The index is rebuilt from files, so a commit lost to power failure is
+    re-indexed on the next pass; NORMAL sync under WAL keeps the database
+    consistent while skipping the per-commit fsync.
+    """
+    conn = open_db(Path(db_path))
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+def migrate_file_meta(conn: sqlite3.Connection) -> None:
+    """Add frontmatter columns to a ``knowledge_file_meta`` from older releases."""
+    existing = {row["name"] for row in conn.execute("PRAGMA table_info(knowledge_file_meta)")}
+    missing = [name for name in FILE_META_COLUMNS if name not in existing]
+    for name in missing:
+        conn.execute(f"ALTER TABLE knowledge_file_meta ADD COLUMN {name} {FILE_META_COLUMNS[name]}")
+    if missing:
+        # Existing rows have no frontmatter yet; clearing the recorded mtime
+        # makes the next reindex_knowledge pass re-index every file.
+        conn.execute("UPDATE knowledge_file_meta SET modified_at = ''")
+
+
+# ---------------------------------------------------------------------------
+# Tree scanning
+# ---------------------------------------------------------------------------
+
+WIKILINK_BYTES_RE = re.compile(rb"\[\[([^\]|]+?)(?:\|[^\]]+)?\]\]")
+
+SCAN_BATCH_FILES = 128
+"""Files read per worker task when scanning the knowledge tree."""
+
+SCAN_MAX_WORKERS = 8
+"""Upper bound on reader threads for knowledge tree scans."""
+
+
+def iter_md(root: Path) -> Iterator[tuple[str, os.DirEntry[str]]]:
+    """Yield ``(relative_path, entry)`` for every markdown file under *root*.
+
+    Walks with an explicit stack of ``os.scandir`` calls so type checks come
+    from the directory entry instead of extra ``stat`` calls.  Directory
+    symlinks are not followed (matching ``Path.rglob``); file symlinks are.
+    Unreadable directories are skipped.
+    """
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                rel = prefix + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append((entry.path, rel + os.sep))
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield rel, entry
+
+
+def map_batched[T, R](fn: Callable[[list[T]], R], items: list[T]) -> Iterator[R]:
+    """Apply *fn* to consecutive batches of *items*, yielding results in order.
+
+    Batches fan out to a thread pool so file reads overlap on a cold cache;
+    a lone batch runs inline because pool start-up would dominate.  Per-batch
+    (not per-file) tasks keep executor overhead negligible on a warm cache.
+    """
+    step = SCAN_BATCH_FILES
+    batches = [items[i : i + step] for i in range(0, len(items), step)]
+    if len(batches) <= 1:
+        yield from map(fn, batches)
+        return
+    with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(batches))) as pool:
+        yield from pool.map(fn, batches)
+
+
+def scan_links(batch: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Return ``(target, rel)`` for every wikilink in the ``(rel, path)`` batch."""
+    finditer = WIKILINK_BYTES_RE.finditer
+    links: list[tuple[str, str]] = []
+    for rel, path in batch:
+        # Scan raw bytes and decode only the link targets: most notes have no
+        # links and never pay for a full UTF-8 decode.  ASCII bytes never
+        # occur inside multi-byte UTF-8 sequences, so the byte pattern matches
+        # exactly where the text pattern would.
+        try:
+            with open(path, "rb") as handle:
+                data = handle.read()
+        except OSError:
+            continue
+        if b"[[" not in data:
+            continue
+
+        for match in finditer(data):
+            target = match.group(1).decode("utf-8", "replace").strip().lower()
+            if target:
+                links.append((target, rel))
+    return links
+
+
+# ---------------------------------------------------------------------------
+# Reading and writing indexed files
+# ---------------------------------------------------------------------------
+
+ChunkRow = tuple[str, int, str, int, int, str]
+"""A ``knowledge_chunks`` row: path, index, content, line range, mtime."""
+
+FileColumns = tuple[str, float, float]
+"""Frontmatter ``knowledge_file_meta`` columns: type, created and modified."""
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedFile:
+    """A knowledge file read and split for indexing."""
+
+    rows: list[ChunkRow]
+    content: str
+    sha256: str
+
+
+def chunk_file(lines: list[str], chunk_size: int = CHUNK_SIZE_LINES) -> list[tuple[int, int, str]]:
+    """Split lines into chunks, returning (line_start, line_end, content)."""
+    chunks: list[tuple[int, int, str]] = []
+    for i in range(0, len(lines), chunk_size):
+        batch = lines[i : i + chunk_size]
+        chunks.append((i + 1, i + len(batch), "\n".join(batch)))
+    return chunks
+
+
+def parse_file(rel: str, file_path: Path, mtime: str) -> ParsedFile | None:
+    """Read *file_path* and return its chunk rows and content hash, or None."""
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        logger.warning("Cannot read %s for indexing", file_path)
+        return None
+
+    chunks = chunk_file(content.splitlines())
+    rows = [
+        (rel, idx, chunk_content, line_start, line_end, mtime)
+        for idx, (line_start, line_end, chunk_content) in enumerate(chunks)
+    ]
+    digest = hashlib.sha256(content.encode()).hexdigest()
+    return ParsedFile(rows, content, digest)
+
+
+def parse_file_batch(
+    batch: list[tuple[str, Path, str]],
+) -> list[tuple[str, Path, str, ParsedFile | None]]:
+    """Run :func:`parse_file` over a ``(rel, path, mtime)`` batch."""
+    return [(rel, path, mtime, parse_file(rel, path, mtime)) for rel, path, mtime in batch]
+
+
+def write_file_rows(
+    conn: sqlite3.Connection,
+    rel: str,
+    mtime: str,
+    parsed: ParsedFile,
+    columns: FileColumns,
+    indexed_sha256: str | None,
+) -> None:
+    """Replace *rel*'s chunks and metadata using *conn*; the caller owns the transaction.
+
+    When *indexed_sha256* matches the file's content (e.g. after ``touch`` or
+    a checkout), only the metadata row is rewritten: the chunk DELETE/INSERT
+    and the FTS trigger work it fires are skipped.
+    """
+    if parsed.sha256 != indexed_sha256:
+        conn.execute("DELETE FROM knowledge_chunks WHERE file_path = ?", (rel,))
+        # One prepared statement stepped over every chunk instead of a
+        # Python-level round-trip per row.
+        conn.executemany(INSERT_CHUNK_SQL, parsed.rows)
+    file_type, created_ts, modified_ts = columns
+    now = datetime.now(UTC).isoformat()
+    conn.execute(
+        UPSERT_FILE_META_SQL,
+        (rel, mtime, now, file_type, created_ts, modified_ts, parsed.sha256),
+    )
@@ -0,0 +1,96 @@
+"""Background FTS indexing for conversation log files.
+
+:func:`schedule_log_index` queues a written log file and returns at once; a
+daemon thread indexes it after a short debounce, so SQLite writes stay off the
+turn's critical path.  Appends to the same daily file within the window
+collapse into a single re-index.  Files still queued when the process exits
+are picked up by the startup ``reindex_knowledge`` pass, which compares file
+mtimes against the index.
+
+Dependencies: store.knowledge
+Wired in: store/conversation_log.py → append_turn()
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from pathlib import Path
+
+from autopoiesis.store.knowledge import index_file, init_knowledge_index
+
+logger = logging.getLogger(__name__)
+
+_DEBOUNCE_SECONDS = 0.2
+"""How long the worker waits for more appends before indexing a batch."""
+
+# Queued log files mapped to (knowledge_db_path, knowledge_root).  Keyed by
+# file so repeated appends between batches are indexed once.
+_pending: dict[Path, tuple[str, Path]] = {}
+_cond = threading.Condition()
+_worker: threading.Thread | None = None
+_busy = False
+_flush_waiters = 0
+
+# Knowledge DBs whose schema has been created by this process.
+_initialized_dbs: set[str] = set()
+
+
+def schedule_log_index(knowledge_db_path: str, knowledge_root: Path, log_path: Path) -> None:
+    """Queue *log_path* for (re-)indexing on the background worker."""
+    global _worker
+    with _cond:
+        _pending[log_path] = (knowledge_db_path, knowledge_root)
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(
+                target=_run_worker, name="conversation-log-indexer", daemon=True
+            )
+            _worker.start()
+        _cond.notify_all()
+
+
+def flush_log_index(timeout: float | None = None) -> bool:
+    """Index every queued log file now and wait for it to finish.
+
+    Returns ``False`` if *timeout* elapsed first.
+    """
+    global _flush_waiters
+    with _cond:
+        _flush_waiters += 1
+        _cond.notify_all()
+        try:
+            return _cond.wait_for(lambda: not _pending and not _busy, timeout)
+        finally:
+            _flush_waiters -= 1
+
+
+def _run_worker() -> None:
+    global _busy
+    while True:
+        with _cond:
+            _cond.wait_for(lambda: bool(_pending))
+            # Debounce: let further appends to the same file coalesce unless
+            # someone is waiting on a flush.
+            _cond.wait_for(lambda: _flush_waiters > 0, _DEBOUNCE_SECONDS)
+            batch = dict(_pending)
+            _pending.clear()
+            _busy = True
+        try:
+            for log_path, (db_path, knowledge_root) in batch.items():
+                _index_log(db_path, knowledge_root, log_path)
+        finally:
+            with _cond:
+                _busy = False
+                _cond.notify_all()
+
+
+def _index_log(knowledge_db_path: str, knowledge_root: Path, log_path: Path) -> None:
+    try:
+        if knowledge_db_path not in _initialized_dbs:
+            init_knowledge_index(knowledge_db_path)
+            _initialized_dbs.add(knowledge_db_path)
+        index_file(knowledge_db_path, knowledge_root, log_path)
+    except Exception:
+        # Re-create the schema next time in case the DB was replaced.
+        _initialized_dbs.discard(knowledge_db_path)
+        logger.warning("Failed to index conversation log %s", log_path, exc_info=True)
@@ -14,6 +14,7 @@ from pydantic_ai.messages import ModelRequest, ModelResponse, TextPart, UserProm
 
 from autopoiesis.store.conversation_log import append_turn
 from autopoiesis.store.knowledge import init_knowledge_index, search_knowledge
+from autopoiesis.store.log_indexer import flush_log_index
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -56,7 +57,7 @@ class TestFts5Integration:
     def test_log_content_searchable_after_append(
         self, knowledge_root: Path, knowledge_db: str
     ) -> None:
-        """Content written by append_turn is immediately searchable via FTS5."""
+        """Content written by append_turn is searchable via FTS5 once indexed."""
         unique_phrase = "zymurgy_fermentation_quantum_2026"
         messages = [
             _user_request(f"Tell me about {unique_phrase}."),
@@ -66,6 +67,7 @@ class TestFts5Integration:
         ts = datetime(2026, 2, 20, 14, 0, 0, tzinfo=UTC)
         append_turn(knowledge_root, knowledge_db, "fts-agent", messages, timestamp=ts)
 
+        assert flush_log_index()
         results = search_knowledge(knowledge_db, unique_phrase)
         assert len(results) >= 1
         assert any("fts-agent" in r.file_path for r in results)
@@ -78,6 +80,7 @@ class TestFts5Integration:
         ts = datetime(2026, 2, 20, 9, 0, 0, tzinfo=UTC)
         append_turn(knowledge_root, knowledge_db, "path-agent", messages, timestamp=ts)
 
+        assert flush_log_index()
         results = search_knowledge(knowledge_db, "tachyon_propulsion_system_xyz")
         assert len(results) >= 1
         assert any("logs/path-agent/2026-02-20.md" in r.file_path for r in results)
@@ -103,6 +106,7 @@ class TestFts5Integration:
             timestamp=ts,
         )
 
+        assert flush_log_index()
         zeta_results = search_knowledge(knowledge_db, "zeta_mechanism_42")
         delta_results = search_knowledge(knowledge_db, "delta_protocol_99")
 
@@ -131,6 +135,7 @@ class TestFts5Integration:
             timestamp=ts2,
         )
 
+        assert flush_log_index()
         results_first = search_knowledge(knowledge_db, unique_first)
         results_second = search_knowledge(knowledge_db, unique_second)
 
@@ -146,6 +151,7 @@ class TestFts5Integration:
 
         append_turn(knowledge_root, knowledge_db, "subdir-agent", messages, timestamp=ts)
 
+        assert flush_log_index()
         results = search_knowledge(knowledge_db, "subdir_indexing_verification_xyz")
         file_paths = [r.file_path for r in results]
         assert any(p.startswith("logs/") for p in file_paths)
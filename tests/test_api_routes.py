@@ -6,6 +6,7 @@ to isolate the API layer from the real runtime and MCP server.
 
 from __future__ import annotations
 
+import asyncio
 import json
 from typing import Any
 from unittest.mock import MagicMock
@@ -16,6 +17,7 @@ from fastapi.testclient import TestClient
 
 import autopoiesis.server.api_routes as api_routes_module
 from autopoiesis.server.api_routes import api_router
+from autopoiesis.server.change_signal import approval_state_changed
 
 # ---------------------------------------------------------------------------
 # Fixtures & helpers
@@ -364,6 +366,38 @@ def test_sse_stream_handshake(monkeypatch: Any, client: TestClient) -> None:
     assert "stream.connected" in raw_text
 
 
+async def test_sse_generator_skips_unchanged_approvals(monkeypatch: Any) -> None:
+    status_raw = _raw("dashboard.status", {"initialized": True})
+    approvals_raw = _raw("approval.list", {"count": 0, "items": []})
+    monkeypatch.setattr(api_routes_module, "dashboard_status", lambda: status_raw)
+    monkeypatch.setattr(api_routes_module, "approval_list", lambda: approvals_raw)
+    monkeypatch.setattr(api_routes_module, "_SSE_POLL_INTERVAL_SECONDS", 0.01)
+
+    gen = api_routes_module._sse_event_generator()  # pyright: ignore[reportPrivateUsage]
+    types = [json.loads((await anext(gen))["data"])["type"] for _ in range(4)]
+    await gen.aclose()
+
+    assert types == ["stream.connected", "dashboard.status", "approval.list", "dashboard.status"]
+
+
+async def test_sse_generator_wakes_on_approval_change(monkeypatch: Any) -> None:
+    status_raw = _raw("dashboard.status", {"initialized": True})
+    monkeypatch.setattr(api_routes_module, "dashboard_status", lambda: status_raw)
+    monkeypatch.setattr(api_routes_module, "approval_list", lambda: status_raw)
+    monkeypatch.setattr(api_routes_module, "_SSE_POLL_INTERVAL_SECONDS", 60.0)
+
+    gen = api_routes_module._sse_event_generator()  # pyright: ignore[reportPrivateUsage]
+    for _ in range(3):
+        await anext(gen)
+    pending = asyncio.ensure_future(anext(gen))
+    await asyncio.sleep(0)
+    approval_state_changed.notify()
+    frame = await asyncio.wait_for(pending, timeout=1.0)
+    await gen.aclose()
+
+    assert json.loads(frame["data"])["type"] == "dashboard.status"
+
+
 # ---------------------------------------------------------------------------
 # _parse_envelope helper edge cases
 # ---------------------------------------------------------------------------
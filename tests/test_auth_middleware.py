@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+from importlib import import_module
+from types import ModuleType
 
+import pytest
 from fastmcp import FastMCP
 
+from autopoiesis.skills import auth_middleware
 from autopoiesis.skills.auth_middleware import ApprovalGateTransform
 
 
@@ -62,3 +66,46 @@ def test_approval_gate_allows_when_unlocked() -> None:
     dangerous_result = asyncio.run(server.call_tool("dangerous", {}))
 
     assert _tool_text(dangerous_result) == "executed"
+
+
+def test_approval_gate_reuses_wrapper_for_same_tool() -> None:
+    server = _build_server(unlocked=False)
+
+    first = asyncio.run(server.get_tool("dangerous"))
+    second = asyncio.run(server.get_tool("dangerous"))
+
+    assert first is not None
+    assert first is second
+
+
+def test_approval_gate_reuses_blocked_result() -> None:
+    server = _build_server(unlocked=False)
+    tool = asyncio.run(server.get_tool("dangerous"))
+    assert tool is not None
+
+    first = asyncio.run(tool.run({}))
+    second = asyncio.run(tool.run({}))
+
+    assert first is second
+    assert first.meta == {
+        "blocked": True,
+        "reason": "approval_required",
+        "required_tier": "approve",
+    }
+
+
+def test_default_unlock_check_resolves_policy_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    imports: list[str] = []
+
+    def _counting_import(name: str) -> ModuleType:
+        imports.append(name)
+        return import_module(name)
+
+    monkeypatch.setattr(auth_middleware, "import_module", _counting_import)
+    monkeypatch.setattr(auth_middleware, "_unlock_hooks", None)
+    policy = import_module("autopoiesis.infra.approval.policy")
+
+    assert auth_middleware._default_unlock_check() is False  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(policy, "approval_unlocked", True, raising=False)
+    assert auth_middleware._default_unlock_check() is True  # pyright: ignore[reportPrivateUsage]
+    assert len(imports) == 1
@@ -16,6 +16,7 @@ from pydantic_ai.messages import (
     UserPromptPart,
 )
 
+from autopoiesis.store import conversation_log
 from autopoiesis.store.conversation_log import (
     append_turn,
     format_entry,
@@ -159,6 +160,40 @@ class TestLogFileFormat:
         assert "First question" in content
         assert "Second question" in content
 
+    def test_append_fd_reused_and_reopened(self, knowledge_root: Path, knowledge_db: str) -> None:
+        """Same-day turns share one fd; deletion or a new day reopens it."""
+        open_logs = conversation_log._open_logs  # pyright: ignore[reportPrivateUsage]
+        day = datetime(2026, 2, 20, 10, 0, 0, tzinfo=UTC)
+        log_path = append_turn(
+            knowledge_root, knowledge_db, "agent5", [_make_user_message("one")], timestamp=day
+        )
+        assert log_path is not None
+        first = open_logs[(knowledge_root, "agent5")]
+        append_turn(
+            knowledge_root, knowledge_db, "agent5", [_make_user_message("two")], timestamp=day
+        )
+        assert open_logs[(knowledge_root, "agent5")] is first
+        assert log_path.read_text().count("# Conversation log") == 1
+
+        log_path.unlink()
+        append_turn(
+            knowledge_root, knowledge_db, "agent5", [_make_user_message("three")], timestamp=day
+        )
+        content = log_path.read_text()
+        assert content.startswith("# Conversation log — agent5 — 2026-02-20")
+        assert "three" in content
+        assert open_logs[(knowledge_root, "agent5")] is not first
+
+        append_turn(
+            knowledge_root,
+            knowledge_db,
+            "agent5",
+            [_make_user_message("four")],
+            timestamp=day + timedelta(days=1),
+        )
+        path, _ = open_logs[(knowledge_root, "agent5")]
+        assert path.name == "2026-02-21.md"
+
     def test_empty_messages_returns_none(self, knowledge_root: Path, knowledge_db: str) -> None:
         """No log file is written when messages list is empty."""
         result = append_turn(knowledge_root, knowledge_db, "agent5", [])
@@ -216,6 +251,14 @@ class TestToolCallCapture:
             assert large_result not in content
             assert "LARGE_RESULT_DATA" not in content
 
+    def test_parse_messages_truncates_across_text_parts(self) -> None:
+        """Multi-part assistant replies are summarised as one joined string."""
+        reply = ModelResponse(
+            parts=[TextPart(content="  " + "a" * 150), TextPart(content="b" * 150)]
+        )
+        ((_, summary, _),) = parse_messages([reply])
+        assert summary == "a" * 150 + " " + "b" * 49 + "..."
+
     def test_parse_messages_extracts_tool_names_only(self) -> None:
         """parse_messages returns tool call names, not return values."""
         tool_return = _make_tool_return_message("my_tool", "SECRET_RESULT_CONTENT")
@@ -377,6 +420,18 @@ class TestRotation:
         assert weird_file not in deleted
         assert weird_file.exists()
 
+    def test_impossible_dates_ignored(self, knowledge_root: Path) -> None:
+        """Date-shaped names that are not real dates are left untouched."""
+        files = [
+            self._create_log_file(knowledge_root, "odd-agent", stem)
+            for stem in ("2001-02-30", "2001-13-01", "2001-2-01", "2001-01-01-extra")
+        ]
+
+        deleted = rotate_logs(knowledge_root, "odd-agent", retention_days=1)
+
+        assert deleted == []
+        assert all(f.exists() for f in files)
+
     def test_boundary_day_kept(self, knowledge_root: Path) -> None:
         """A file exactly retention_days old is kept (cutoff is strictly older)."""
         today = datetime.now(UTC).date()
@@ -407,6 +462,11 @@ class TestFormatEntry:
         assert "**user**: hello" in block
         assert "**assistant**: hi there" in block
 
+    def test_preformatted_timestamp(self) -> None:
+        ts = datetime(2026, 2, 20, 14, 0, 0, tzinfo=UTC)
+        entries: list[tuple[str, str, list[str]]] = [("user", "hello", [])]
+        assert format_entry(ts.isoformat(), entries) == format_entry(ts, entries)
+
     def test_tool_parenthetical_included(self) -> None:
         ts = datetime(2026, 2, 20, 14, 0, 0, tzinfo=UTC)
         entries = [("assistant", "working", ["tool_x"])]
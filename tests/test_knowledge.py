@@ -3,17 +3,24 @@
 from __future__ import annotations
 
 import os
+import sqlite3
+import threading
+from contextlib import closing
 from datetime import UTC, datetime
 from pathlib import Path
 
 import pytest
 
+from autopoiesis.db import open_db
+from autopoiesis.store import knowledge, knowledge_index
+from autopoiesis.store import knowledge_db as knowledge_db_pool
 from autopoiesis.store.knowledge import (
     CONTEXT_BUDGET_CHARS,
     SearchResult,
     build_backlink_index,
     ensure_journal_entry,
     format_search_results,
+    index_file,
     init_knowledge_index,
     known_types,
     load_knowledge_context,
@@ -97,6 +104,30 @@ class TestIndexing:
         results = search_knowledge(knowledge_db, "SQLite simplicity")
         assert len(results) >= 1
 
+    def test_touched_file_keeps_chunks(self, knowledge_db: str, knowledge_root: Path) -> None:
+        reindex_knowledge(knowledge_db, knowledge_root)
+        mem = knowledge_root / "memory" / "MEMORY.md"
+
+        def chunk_ids() -> list[int]:
+            with closing(sqlite3.connect(knowledge_db)) as conn:
+                rows = conn.execute(
+                    "SELECT id FROM knowledge_chunks WHERE file_path = ?",
+                    (os.path.join("memory", "MEMORY.md"),),
+                ).fetchall()
+            return [row[0] for row in rows]
+
+        before = chunk_ids()
+        os.utime(mem, (mem.stat().st_atime + 1, mem.stat().st_mtime + 1))
+        assert reindex_knowledge(knowledge_db, knowledge_root) == 1
+        assert chunk_ids() == before
+        assert reindex_knowledge(knowledge_db, knowledge_root) == 0
+
+        mem.write_text("# Memory\n\n- Switched to SQLite\n")
+        os.utime(mem, (mem.stat().st_atime + 2, mem.stat().st_mtime + 2))
+        index_file(knowledge_db, knowledge_root, mem)
+        assert chunk_ids() != before
+        assert search_knowledge(knowledge_db, "Switched")[0].file_path.endswith("MEMORY.md")
+
     def test_deleted_files_removed_from_index(
         self, knowledge_db: str, knowledge_root: Path
     ) -> None:
@@ -109,6 +140,38 @@ class TestIndexing:
         results = search_knowledge(knowledge_db, "autopoiesis PydanticAI")
         assert len(results) == 0
 
+    def test_index_file_writes_every_chunk(self, knowledge_db: str, knowledge_root: Path) -> None:
+        notes = knowledge_root / "notes.md"
+        notes.write_text("\n".join(f"line {i}" for i in range(1, 71)))
+
+        index_file(knowledge_db, knowledge_root, notes)
+        index_file(knowledge_db, knowledge_root, notes)
+
+        with closing(sqlite3.connect(knowledge_db)) as conn:
+            rows = conn.execute(
+                "SELECT chunk_index, line_start, line_end FROM knowledge_chunks"
+                " WHERE file_path = 'notes.md' ORDER BY chunk_index"
+            ).fetchall()
+        assert rows == [(0, 1, 30), (1, 31, 60), (2, 61, 70)]
+        assert search_knowledge(knowledge_db, "70")[0].line_start == 61
+
+    def test_only_index_connections_relax_sync(self, knowledge_db: str) -> None:
+        with closing(knowledge_index.open_index_db(knowledge_db)) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1  # NORMAL
+        with closing(open_db(Path(knowledge_db))) as conn:
+            assert conn.execute("PRAGMA synchronous").fetchone()[0] == 2  # FULL
+
+    def test_reindex_across_worker_batches(
+        self, knowledge_db: str, knowledge_root: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(knowledge_index, "SCAN_BATCH_FILES", 2)
+
+        assert reindex_knowledge(knowledge_db, knowledge_root) == 6
+        assert search_knowledge(knowledge_db, "PydanticAI")[0].file_path == os.path.join(
+            "projects", "autopoiesis.md"
+        )
+        assert reindex_knowledge(knowledge_db, knowledge_root) == 0
+
     def test_index_nonexistent_root(self, knowledge_db: str, tmp_path: Path) -> None:
         count = reindex_knowledge(knowledge_db, tmp_path / "nonexistent")
         assert count == 0
@@ -157,6 +220,73 @@ class TestSearch:
         results = search_knowledge(knowledge_db, "the", limit=1)
         assert len(results) <= 1
 
+    def test_search_connections_lock_per_db(self, tmp_path: Path) -> None:
+        first_db = str(tmp_path / "first.sqlite")
+        second_db = str(tmp_path / "second.sqlite")
+        opened = threading.Event()
+
+        def use_second() -> None:
+            with knowledge_db_pool.search_connection(second_db):
+                opened.set()
+
+        with knowledge_db_pool.search_connection(first_db):
+            worker = threading.Thread(target=use_second)
+            worker.start()
+            assert opened.wait(timeout=5)
+        worker.join()
+        knowledge_db_pool.close_search_connections()
+
+    def test_evicted_connection_closed_after_release(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(knowledge_db_pool, "_MAX_CONNECTIONS", 1)
+        first_db = str(tmp_path / "first.sqlite")
+        second_db = str(tmp_path / "second.sqlite")
+
+        def use_second() -> None:
+            with knowledge_db_pool.search_connection(second_db):
+                pass
+
+        worker = threading.Thread(target=use_second)
+
+        with knowledge_db_pool.search_connection(first_db) as held:
+            worker.start()
+            worker.join(timeout=0.2)
+            # The eviction waits for this search to finish with the connection.
+            assert held.execute("SELECT 1").fetchone()[0] == 1
+        worker.join(timeout=5)
+        assert not worker.is_alive()
+        with knowledge_db_pool.search_connection(first_db) as reopened:
+            assert reopened is not held
+        knowledge_db_pool.close_search_connections()
+
+    def test_snippet_excerpts_match(self, knowledge_db: str, knowledge_root: Path) -> None:
+        filler = " ".join(f"word{i}" for i in range(200))
+        (knowledge_root / "long.md").write_text(f"{filler} needle {filler}\n")
+        reindex_knowledge(knowledge_db, knowledge_root)
+
+        [result] = search_knowledge(knowledge_db, "needle")
+        assert "needle" in result.snippet
+        assert result.snippet.startswith("…")
+        assert result.snippet.endswith("…")
+        assert len(result.snippet.split()) <= 32
+
+    def test_search_connection_pooled_and_sees_new_writes(
+        self, knowledge_db: str, knowledge_root: Path
+    ) -> None:
+        knowledge_db_pool.close_search_connections()
+        assert search_knowledge(knowledge_db, "zebra") == []
+        with knowledge_db_pool.search_connection(knowledge_db) as first:
+            pass
+
+        (knowledge_root / "zoo.md").write_text("A zebra lives here.\n")
+        reindex_knowledge(knowledge_db, knowledge_root)
+
+        assert [r.file_path for r in search_knowledge(knowledge_db, "zebra")] == ["zoo.md"]
+        with knowledge_db_pool.search_connection(knowledge_db) as second:
+            assert second is first
+        knowledge_db_pool.close_search_connections()
+
 
 # ---------------------------------------------------------------------------
 # Context injection tests
@@ -398,6 +528,58 @@ class TestFilteredSearch:
         assert len(results) == 1
         assert results[0].file_path == "new.md"
 
+    def test_type_registered_after_indexing(
+        self, knowledge_db: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(knowledge, "_registered_types", set[str]())
+        root = tmp_path / "kroot"
+        root.mkdir()
+        (root / "soup.md").write_text("---\ntype: recipe\n---\nTomato soup\n")
+        reindex_knowledge(knowledge_db, root)
+
+        [before] = search_knowledge(knowledge_db, "soup")
+        assert before.file_type == "note"
+        assert search_knowledge(knowledge_db, "soup", type_filter="note") == [before]
+        assert search_knowledge(knowledge_db, "soup", type_filter="recipe") == []
+
+        register_types({"recipe"})
+        [after] = search_knowledge(knowledge_db, "soup", type_filter="recipe")
+        assert (after.file_path, after.file_type) == ("soup.md", "recipe")
+        assert search_knowledge(knowledge_db, "soup", type_filter="note") == []
+
+    def test_filters_fill_limit_in_sql(self, knowledge_db: str, tmp_path: Path) -> None:
+        root = tmp_path / "kroot"
+        root.mkdir()
+        for i in range(8):
+            (root / f"note{i}.md").write_text("Python Python Python\n")
+        (root / "fact.md").write_text("---\ntype: fact\n---\nPython\n")
+        reindex_knowledge(knowledge_db, root)
+
+        facts = search_knowledge(knowledge_db, "Python", limit=1, type_filter="fact")
+        assert [(r.file_path, r.file_type) for r in facts] == [("fact.md", "fact")]
+
+    def test_old_schema_migrated_and_reindexed(self, tmp_path: Path) -> None:
+        root = tmp_path / "kroot"
+        root.mkdir()
+        note = root / "a.md"
+        note.write_text("---\ntype: decision\n---\nUse SQLite\n")
+        mtime = datetime.fromtimestamp(note.stat().st_mtime, tz=UTC).isoformat()
+        db_path = str(tmp_path / "old.sqlite")
+        with closing(sqlite3.connect(db_path)) as conn, conn:
+            conn.execute(
+                "CREATE TABLE knowledge_file_meta"
+                " (file_path TEXT PRIMARY KEY, modified_at TEXT NOT NULL, indexed_at TEXT NOT NULL)"
+            )
+            conn.execute("INSERT INTO knowledge_file_meta VALUES ('a.md', ?, ?)", (mtime, mtime))
+
+        init_knowledge_index(db_path)
+        assert reindex_knowledge(db_path, root) == 1
+
+        init_knowledge_index(db_path)
+        assert reindex_knowledge(db_path, root) == 0
+        results = search_knowledge(db_path, "SQLite", type_filter="decision")
+        assert [r.file_path for r in results] == ["a.md"]
+
 
 # ---------------------------------------------------------------------------
 # Wikilink backlink index tests
@@ -427,6 +609,39 @@ class TestBacklinkIndex:
         index = build_backlink_index(root)
         assert "target" in index
 
+    def test_nested_files_and_symlinked_dirs(self, tmp_path: Path) -> None:
+        root = tmp_path / "k"
+        (root / "deep" / "er").mkdir(parents=True)
+        (root / "deep" / "er" / "a.md").write_text("See [[b]].\n")
+        (root / "deep" / "skip.txt").write_text("See [[b]].\n")
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "c.md").write_text("See [[b]].\n")
+        (root / "linked").symlink_to(outside, target_is_directory=True)
+
+        index = build_backlink_index(root)
+        assert index == {"b": {os.path.join("deep", "er", "a.md")}}
+
+    def test_non_ascii_targets(self, tmp_path: Path) -> None:
+        root = tmp_path / "k"
+        root.mkdir()
+        (root / "a.md").write_text("Siehe [[ Über Café ]] und [[Straße|hier]].\n", encoding="utf-8")
+        index = build_backlink_index(root)
+        assert index == {"über café": {"a.md"}, "straße": {"a.md"}}
+
+    def test_matches_across_worker_batches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(knowledge_index, "SCAN_BATCH_FILES", 2)
+        root = tmp_path / "k"
+        root.mkdir()
+        for i in range(7):
+            (root / f"n{i}.md").write_text(f"[[hub]] [[n{(i + 1) % 7}]]\n")
+
+        index = build_backlink_index(root)
+        assert index["hub"] == {f"n{i}.md" for i in range(7)}
+        assert index["n0"] == {"n6.md"}
+
     def test_empty_root(self, tmp_path: Path) -> None:
         index = build_backlink_index(tmp_path / "nonexistent")
         assert index == {}
@@ -0,0 +1,70 @@
+"""Unit tests for store.log_indexer — background conversation log indexing."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from autopoiesis.store import log_indexer
+from autopoiesis.store.log_indexer import flush_log_index, schedule_log_index
+
+
+@pytest.fixture()
+def index_calls(monkeypatch: pytest.MonkeyPatch) -> Iterator[list[tuple[str, Path]]]:
+    calls: list[tuple[str, Path]] = []
+
+    def record_init(db_path: str) -> None:
+        calls.append(("init", Path(db_path)))
+
+    def record_index(db_path: str, knowledge_root: Path, file_path: Path) -> None:
+        calls.append(("index", file_path))
+
+    monkeypatch.setattr(log_indexer, "init_knowledge_index", record_init)
+    monkeypatch.setattr(log_indexer, "index_file", record_index)
+    yield calls
+    assert flush_log_index(timeout=5)
+
+
+def test_appends_to_same_file_coalesce(
+    tmp_path: Path, index_calls: list[tuple[str, Path]], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Files queued within the debounce window are indexed once each."""
+    monkeypatch.setattr(log_indexer, "_DEBOUNCE_SECONDS", 5.0)
+    db = str(tmp_path / "coalesce.sqlite")
+    log_a = tmp_path / "a.md"
+    log_b = tmp_path / "b.md"
+    for log_path in (log_a, log_a, log_b, log_a):
+        schedule_log_index(db, tmp_path, log_path)
+
+    assert flush_log_index(timeout=5)
+    assert index_calls == [("init", Path(db)), ("index", log_a), ("index", log_b)]
+
+
+def test_schema_created_once_per_db(tmp_path: Path, index_calls: list[tuple[str, Path]]) -> None:
+    """The FTS schema is initialised on the first index per DB only."""
+    db = str(tmp_path / "once.sqlite")
+    for _ in range(2):
+        schedule_log_index(db, tmp_path, tmp_path / "log.md")
+        assert flush_log_index(timeout=5)
+
+    assert [kind for kind, _ in index_calls] == ["init", "index", "index"]
+
+
+def test_failed_index_retries_schema(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, index_calls: list[tuple[str, Path]]
+) -> None:
+    """A failing index forgets the schema so the next batch re-creates it."""
+    db = str(tmp_path / "flaky.sqlite")
+
+    def fail_index(db_path: str, knowledge_root: Path, file_path: Path) -> None:
+        raise RuntimeError("db replaced")
+
+    monkeypatch.setattr(log_indexer, "index_file", fail_index)
+    schedule_log_index(db, tmp_path, tmp_path / "log.md")
+    assert flush_log_index(timeout=5)
+    schedule_log_index(db, tmp_path, tmp_path / "log.md")
+    assert flush_log_index(timeout=5)
+
+    assert index_calls == [("init", Path(db)), ("init", Path(db))]
@@ -5,15 +5,18 @@ from __future__ import annotations
 import asyncio
 import json
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
 from unittest.mock import MagicMock
 
+import pytest
+
 from autopoiesis.db import open_db
 from autopoiesis.infra.approval.store_schema import init_schema, utc_now_epoch
-from autopoiesis.server import mcp_server
+from autopoiesis.server import approval_db, mcp_server, mcp_tools
 
 
 class _FakeFastMCP:
@@ -73,7 +76,7 @@ def _insert_pending_approval(
 
 def _runtime_with_store(db_path: Path) -> Any:
     approval_store = MagicMock()
-    approval_store._db_path = db_path
+    approval_store.db_path = db_path
     return SimpleNamespace(
         agent_name="chat",
         approval_unlocked=False,
@@ -119,6 +122,8 @@ def test_dashboard_status_returns_envelope(
     assert payload["data"]["initialized"] is True
     assert payload["data"]["agent_name"] == "chat"
     assert payload["data"]["pending_approvals_count"] == 1
+    assert [item["id"] for item in payload["data"]["pending_approvals_preview"]] == ["env-1"]
+    assert "requests" not in payload["data"]["pending_approvals_preview"][0]
 
 
 def test_approval_list_returns_pending_items(monkeypatch: Any, tmp_path: Path) -> None:
@@ -136,7 +141,7 @@ def test_approval_list_returns_pending_items(monkeypatch: Any, tmp_path: Path) -
     assert payload["data"]["items"][0]["tool_count"] == 1
 
 
-def test_approval_decide_updates_state_and_emits_notification(
+async def test_approval_decide_updates_state_and_emits_notification(
     monkeypatch: Any,
     tmp_path: Path,
 ) -> None:
@@ -145,13 +150,223 @@ def test_approval_decide_updates_state_and_emits_notification(
     runtime = _runtime_with_store(db_path)
     notifier = _Notifier()
     monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
-    monkeypatch.setattr(mcp_server, "mcp", notifier)
+    monkeypatch.setattr(mcp_server, "_mcp", notifier)
 
-    payload = json.loads(asyncio.run(mcp_server.approval_decide("env-1", True)))
+    payload = json.loads(await mcp_server.approval_decide("env-1", True))
 
     assert payload["type"] == "approval.decision"
     assert payload["data"]["id"] == "env-1"
     assert payload["data"]["state"] == "consumed"
     assert payload["meta"]["notification_emitted"] is True
+    assert _approval_state(db_path, "env-1") == "consumed"
+    # The notification runs as a background task after the decision returns.
+    await asyncio.sleep(0)
     assert notifier.called == 1
+
+
+async def test_approval_decide_without_server_skips_notification(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    runtime = _runtime_with_store(db_path)
+    monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
+    monkeypatch.setattr(mcp_server, "_mcp", None)
+
+    payload = json.loads(await mcp_server.approval_decide("env-1", False))
+
+    assert payload["meta"]["notification_emitted"] is False
+
+
+async def test_approval_decide_updates_only_one_envelope(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    # "shared" is one envelope's nonce and another envelope's id.
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="shared")
+    _insert_pending_approval(db_path, envelope_id="shared", nonce="nonce-2")
+    runtime = _runtime_with_store(db_path)
+    monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
+    monkeypatch.setattr(mcp_server, "_mcp", None)
+
+    payload = json.loads(await mcp_server.approval_decide("shared", True))
+
+    assert payload["data"]["id"] == "shared"
+    assert _approval_state(db_path, "shared") == "consumed"
+    assert _approval_state(db_path, "env-1") == "pending"
+
+
+async def test_approval_decide_reports_no_notification_without_notifier(
+    monkeypatch: Any,
+    tmp_path: Path,
+) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    runtime = _runtime_with_store(db_path)
+    monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
+    # A server without notify_tool_list_changed (as in FastMCP 3.0.1).
+    monkeypatch.setattr(mcp_server, "_mcp", _FakeFastMCP("autopoiesis"))
+
+    payload = json.loads(await mcp_server.approval_decide("env-1", True))
+
+    assert payload["meta"]["notification_emitted"] is False
     assert _approval_state(db_path, "env-1") == "consumed"
+
+
+def test_pending_count_follows_trigger_counter(monkeypatch: Any, tmp_path: Path) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    _insert_pending_approval(db_path, envelope_id="env-2", nonce="nonce-2")
+    runtime = _runtime_with_store(db_path)
+    monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
+    monkeypatch.setattr(mcp_server, "_mcp", None)
+
+    assert mcp_tools.pending_snapshot(runtime, limit=0)[0] == 2
+    asyncio.run(mcp_server.approval_decide("env-1", False))
+    assert mcp_tools.pending_snapshot(runtime, limit=0)[0] == 1
+    with closing(open_db(db_path)) as conn, conn:
+        conn.execute("DELETE FROM approval_envelopes WHERE envelope_id = 'env-2'")
+    assert mcp_tools.pending_snapshot(runtime, limit=0)[0] == 0
+
+
+def test_pending_count_falls_back_without_counter_row(tmp_path: Path) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    with closing(open_db(db_path)) as conn, conn:
+        conn.execute("DELETE FROM approval_counters")
+
+    assert mcp_tools.pending_snapshot(_runtime_with_store(db_path), limit=0)[0] == 1
+
+
+def test_approval_connection_is_reused_until_closed(tmp_path: Path) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    runtime = _runtime_with_store(db_path)
+
+    with approval_db.approval_connection(runtime) as first:
+        pass
+    with approval_db.approval_connection(runtime) as second:
+        assert second is first
+    approval_db.close_approval_connections()
+    with approval_db.approval_connection(runtime) as third:
+        assert third is not first
+    approval_db.close_approval_connections()
+
+
+def test_approval_list_without_requests_counts_in_sql(monkeypatch: Any, tmp_path: Path) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    runtime = _runtime_with_store(db_path)
+    monkeypatch.setattr(mcp_server, "get_runtime", cast(Any, lambda: runtime))
+
+    payload = json.loads(mcp_server.approval_list(include_requests=False))
+
+    item = payload["data"]["items"][0]
+    assert item["id"] == "env-1"
+    assert item["tool_count"] == 1
+    assert "requests" not in item
+
+
+def test_mcp_server_is_created_lazily_once(monkeypatch: Any) -> None:
+    created: list[_FakeFastMCP] = []
+
+    def _fake_create() -> _FakeFastMCP:
+        server = _FakeFastMCP("autopoiesis")
+        created.append(server)
+        return server
+
+    monkeypatch.setattr(mcp_server, "_mcp", mcp_server._UNSET)  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(mcp_server, "create_mcp_server", _fake_create)
+
+    assert created == []
+    first = mcp_server.mcp
+    assert mcp_server.get_mcp_server() is first
+    assert created == [first]
+
+
+def test_runtime_version_is_resolved_once(monkeypatch: Any) -> None:
+    calls: list[str] = []
+
+    def _fake_version(name: str) -> str:
+        calls.append(name)
+        return "9.9.9"
+
+    mcp_tools.runtime_version.cache_clear()
+    monkeypatch.setattr(mcp_tools, "version", _fake_version)
+
+    assert mcp_tools.runtime_version() == "9.9.9"
+    assert mcp_tools.runtime_version() == "9.9.9"
+    assert calls == ["autopoiesis"]
+    mcp_tools.runtime_version.cache_clear()
+
+
+def test_json_envelope_rejects_nan_and_keeps_non_ascii() -> None:
+    raw = mcp_tools.json_envelope("t", {"name": "café"}, tool="t", meta={"x": 1})
+    assert '"café"' in raw
+    assert json.loads(raw)["meta"]["x"] == 1
+    with pytest.raises(ValueError, match="JSON compliant"):
+        mcp_tools.json_envelope("t", {"value": float("nan")}, tool="t")
+
+
+def test_envelope_timestamp_is_cached_per_second(monkeypatch: Any) -> None:
+    clock = [1_700_000_000.2]
+    monkeypatch.setattr(mcp_tools.time, "time", lambda: clock[0])
+
+    first = json.loads(mcp_tools.json_envelope("t", {}, tool="t"))["meta"]["timestamp"]
+    clock[0] = 1_700_000_000.9
+    second = json.loads(mcp_tools.json_envelope("t", {}, tool="t"))["meta"]["timestamp"]
+    clock[0] = 1_700_000_001.0
+    third = json.loads(mcp_tools.json_envelope("t", {}, tool="t"))["meta"]["timestamp"]
+
+    assert first == second == "2023-11-14T22:13:20+00:00"
+    assert third == "2023-11-14T22:13:21+00:00"
+
+
+def test_pending_snapshot_is_cached_until_the_db_changes(tmp_path: Path) -> None:
+    db_path = tmp_path / "approvals.sqlite"
+    _insert_pending_approval(db_path, envelope_id="env-1", nonce="nonce-1")
+    runtime = _runtime_with_store(db_path)
+
+    first = mcp_tools.pending_snapshot(runtime)
+    assert mcp_tools.pending_snapshot(runtime) is first
+
+    _insert_pending_approval(db_path, envelope_id="env-2", nonce="nonce-2")
+    second = mcp_tools.pending_snapshot(runtime)
+    assert second is not first
+    assert second[0] == 2
+
+    mcp_tools.decide_approval(runtime, approval_id="env-1", approved=True, reason=None)
+    assert mcp_tools.pending_snapshot(runtime)[0] == 1
+    approval_db.close_approval_connections()
+
+
+def test_get_mcp_server_builds_the_server_once(monkeypatch: Any) -> None:
+    built: list[object] = []
+
+    def _create() -> object:
+        server = object()
+        built.append(server)
+        return server
+
+    monkeypatch.setattr(mcp_server, "_mcp", mcp_server._UNSET)  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(mcp_server, "create_mcp_server", _create)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(mcp_server.get_mcp_server) for _ in range(8)]
+        servers = [future.result() for future in futures]
+
+    assert len(built) == 1
+    assert all(server is built[0] for server in servers)
+
+
+def test_parse_tool_calls_fast_and_lenient_paths_agree() -> None:
+    well_formed = '[{"tool_call_id": "c1", "tool_name": "shell", "args": {"cmd": "ls"}, "x": 1}]'
+    assert mcp_tools.parse_tool_calls(well_formed) == [
+        {"tool_call_id": "c1", "tool_name": "shell", "args": {"cmd": "ls"}}
+    ]
+    assert mcp_tools.parse_tool_calls('[1, {"tool_call_id": 7, "tool_name": "shell"}]') == [
+        {"tool_call_id": "7", "tool_name": "shell", "args": {}}
+    ]
+    assert mcp_tools.parse_tool_calls("not json") == []
@@ -8,7 +8,10 @@ from pathlib import Path
 import pytest
 
 from autopoiesis.security.subprocess_sandbox import SandboxLimits
-from autopoiesis.skills.sandboxed_provider import SandboxedSkillProvider
+from autopoiesis.skills.sandboxed_provider import (
+    SandboxedSkillProvider,
+    connect_sandboxed_providers,
+)
 
 
 def _write_skill_server(skill_dir: Path) -> Path:
@@ -50,6 +53,14 @@ class TestSandboxedSkillConfig:
                 workspace_root=tmp_path,
             )
 
+    def test_relative_module_resolves_from_cwd(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sp = _write_skill_server(tmp_path / "skill")
+        monkeypatch.chdir(tmp_path)
+        provider = SandboxedSkillProvider(skill_server_module=Path("skill/server.py"))
+        assert provider.sandbox.path_validator.workspace_root == sp.parent.resolve()
+
 
 class TestSandboxedSkillProviderExec:
     def test_sandbox_runs_command(self, tmp_path: Path) -> None:
@@ -95,6 +106,100 @@ class TestSandboxedSkillProviderExec:
         proxy = provider.get_provider()
         assert proxy is not None
 
+    async def test_proxied_calls_share_one_child(self, tmp_path: Path) -> None:
+        from fastmcp import FastMCP
+
+        sp = _write_skill_server(tmp_path / "skill")
+        provider = SandboxedSkillProvider(skill_server_module=sp, workspace_root=sp.parent)
+        server = FastMCP("host")
+        server.add_provider(provider.get_provider())
+        await provider.connect()
+        try:
+            client = provider._client  # pyright: ignore[reportPrivateUsage]
+            first = await server.call_tool("ping", {"message": "a"})
+            second = await server.call_tool("ping", {"message": "b"})
+            assert provider._client is client  # pyright: ignore[reportPrivateUsage]
+            assert client is not None
+            assert client.is_connected()
+        finally:
+            await provider.disconnect()
+
+        assert "pong: a" in str(first.content)
+        assert "pong: b" in str(second.content)
+        assert provider._client is None  # pyright: ignore[reportPrivateUsage]
+
+    def test_launcher_env_keeps_only_startup_variables(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setenv("OPENAI_API_KEY", "secret")
+        monkeypatch.setenv("PATH", "/usr/bin")
+        sp = _write_skill_server(tmp_path / "skill")
+        provider = SandboxedSkillProvider(skill_server_module=sp, workspace_root=sp.parent)
+        env = provider._env  # pyright: ignore[reportPrivateUsage]
+        assert "OPENAI_API_KEY" not in env
+        assert env["PATH"] == "/usr/bin"
+        assert env["PYTHONUNBUFFERED"] == "1"
+
+    async def test_connect_sandboxed_providers_starts_all(self, tmp_path: Path) -> None:
+        providers = [
+            SandboxedSkillProvider(skill_server_module=sp, workspace_root=sp.parent)
+            for sp in (_write_skill_server(tmp_path / name) for name in ("one", "two"))
+        ]
+        try:
+            await connect_sandboxed_providers(providers)
+            clients = [p._client for p in providers]  # pyright: ignore[reportPrivateUsage]
+            assert all(c is not None and c.is_connected() for c in clients)
+        finally:
+            for provider in providers:
+                await provider.disconnect()
+
+    async def test_connect_sandboxed_providers_failure_disconnects_others(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        good, bad = [
+            SandboxedSkillProvider(skill_server_module=sp, workspace_root=sp.parent)
+            for sp in (_write_skill_server(tmp_path / name) for name in ("good", "bad"))
+        ]
+        original_connect = SandboxedSkillProvider.connect
+
+        async def _connect(provider: SandboxedSkillProvider) -> None:
+            if provider is bad:
+                raise RuntimeError("child failed to start")
+            await original_connect(provider)
+
+        monkeypatch.setattr(SandboxedSkillProvider, "connect", _connect)
+        try:
+            with pytest.raises(RuntimeError, match="child failed to start"):
+                await connect_sandboxed_providers([good, bad])
+            assert good._client is None  # pyright: ignore[reportPrivateUsage]
+            assert good._held is False  # pyright: ignore[reportPrivateUsage]
+        finally:
+            await good.disconnect()
+
+    def test_launch_spec_fixed_at_construction(self, tmp_path: Path) -> None:
+        sp = _write_skill_server(tmp_path / "skill")
+        provider = SandboxedSkillProvider(skill_server_module=sp, workspace_root=sp.parent)
+        args = provider._args  # pyright: ignore[reportPrivateUsage]
+        assert args[args.index("--module") + 1] == str(sp.resolve())
+        assert provider._cwd == str(sp.parent.resolve())  # pyright: ignore[reportPrivateUsage]
+
+    async def test_unsandboxed_provider_loads_in_process(self, tmp_path: Path) -> None:
+        from fastmcp.server.providers.filesystem import FileSystemProvider
+
+        sp = _write_skill_server(tmp_path / "skill")
+        provider = SandboxedSkillProvider(
+            skill_server_module=sp, workspace_root=sp.parent, sandboxed=False
+        )
+
+        direct = provider.get_provider()
+        await provider.connect()
+
+        assert isinstance(direct, FileSystemProvider)
+        assert [t.name for t in await direct.list_tools()] == ["ping"]
+        assert provider._client is None  # pyright: ignore[reportPrivateUsage]
+        with pytest.raises(RuntimeError, match="not sandboxed"):
+            _ = provider.sandbox
+
     def test_extra_allowed_roots(self, tmp_path: Path) -> None:
         extra = tmp_path / "extra"
         extra.mkdir()
@@ -2,18 +2,33 @@
 
 from __future__ import annotations
 
+import asyncio
+import json
 from collections.abc import Iterator
 from datetime import UTC, datetime
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
+from fastapi import WebSocket
 from fastapi.testclient import TestClient
+from pydantic_ai.messages import (
+    ModelMessage,
+    ModelMessagesTypeAdapter,
+    ModelRequest,
+    ModelResponse,
+    TextPart,
+    UserPromptPart,
+)
 
 from autopoiesis.agent.worker import DeferredApprovalLockedError
+from autopoiesis.display import streaming
+from autopoiesis.models import WorkItem, WorkItemOutput
+from autopoiesis.server import routes
 from autopoiesis.server.app import app, get_session_store, set_connection_manager, set_session_store
 from autopoiesis.server.connections import ConnectionManager
 from autopoiesis.server.models import WSIncoming, WSOutgoing
-from autopoiesis.server.sessions import SessionStore
+from autopoiesis.server.sessions import SessionStore, warm_message_adapter
+from autopoiesis.server.stream_handle import WebSocketStreamHandle
 
 
 @pytest.fixture(autouse=True)
@@ -73,6 +88,18 @@ class TestSessions:
         assert resp.status_code == 200
         assert resp.json()["messages"] == []
 
+    def test_get_history_matches_wire_format(self, client: TestClient) -> None:
+        sid = client.post("/api/sessions").json()["id"]
+        messages: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelResponse(parts=[TextPart(content="hello")]),
+        ]
+        get_session_store().set_history_json(
+            sid, ModelMessagesTypeAdapter.dump_json(messages).decode()
+        )
+        resp = client.get(f"/api/sessions/{sid}/history")
+        assert resp.json()["messages"] == json.loads(ModelMessagesTypeAdapter.dump_json(messages))
+
     def test_delete_session(self, client: TestClient) -> None:
         create_resp = client.post("/api/sessions")
         sid = create_resp.json()["id"]
@@ -122,6 +149,13 @@ class TestWebSocket:
             assert resp["op"] == "error"
             assert "Unknown op" in resp["data"]["message"]
 
+    def test_websocket_accepts_binary_frames(self, client: TestClient) -> None:
+        with client.websocket_connect("/api/ws/test-session") as ws:
+            ws.send_bytes(b'{"op": "unknown", "data": {}}')
+            resp = ws.receive_json()
+            assert resp["op"] == "error"
+            assert "Unknown op" in resp["data"]["message"]
+
     def test_websocket_empty_message(self, client: TestClient) -> None:
         with client.websocket_connect("/api/ws/test-session") as ws:
             ws.send_json({"op": "message", "data": {"content": ""}})
@@ -148,6 +182,7 @@ class TestWebSocket:
             {
                 "text": None,
                 "message_history_json": "[]",
+                "message_count": 0,
                 "deferred_tool_requests_json": '{"nonce":"abc","requests":[]}',
             },
         )()
@@ -172,6 +207,7 @@ class TestChatEndpoint:
             {
                 "text": "Hello back!",
                 "message_history_json": "[]",
+                "message_count": 0,
                 "deferred_tool_requests_json": None,
             },
         )()
@@ -202,6 +238,7 @@ class TestChatEndpoint:
             {
                 "text": None,
                 "message_history_json": "[]",
+                "message_count": 0,
                 "deferred_tool_requests_json": '{"nonce":"abc","requests":[]}',
             },
         )()
@@ -242,6 +279,32 @@ class TestConnectionManager:
         mgr = ConnectionManager()
         assert mgr.active_sessions() == []
 
+    async def test_client_count_tracks_connect_and_disconnect(self) -> None:
+        mgr = ConnectionManager()
+        first, second = AsyncMock(spec=WebSocket), AsyncMock(spec=WebSocket)
+        await mgr.connect("s1", first)
+        await mgr.connect("s1", second)
+        assert mgr.client_count("s1") == 2
+        await mgr.disconnect("s1", first)
+        assert mgr.client_count("s1") == 1
+        await mgr.disconnect("s1", second)
+        assert mgr.client_count("s1") == 0
+        assert mgr.active_sessions() == []
+
+    async def test_broadcast_drops_failed_clients(self) -> None:
+        mgr = ConnectionManager()
+        alive, dead = AsyncMock(spec=WebSocket), AsyncMock(spec=WebSocket)
+        dead.send_text.side_effect = RuntimeError("closed")
+        await mgr.connect("s1", alive)
+        await mgr.connect("s1", dead)
+
+        await mgr.broadcast_json("s1", "{}")
+        assert mgr.client_count("s1") == 1
+        await mgr.broadcast_json("s1", "[]")
+
+        assert [c.args for c in alive.send_text.await_args_list] == [("{}",), ("[]",)]
+        assert mgr.client_count("s1") == 1
+
 
 class TestSessionStore:
     def test_create_and_get(self) -> None:
@@ -265,6 +328,31 @@ class TestSessionStore:
         store.set_history_json("s1", "[]")
         assert store.get_history_json("s1") == "[]"
 
+    def test_history_updates_message_count(self) -> None:
+        store = SessionStore()
+        store.create("s1")
+        messages: list[ModelMessage] = [
+            ModelRequest(parts=[UserPromptPart(content="hi")]),
+            ModelResponse(parts=[TextPart(content="hello")]),
+        ]
+        store.set_history_json("s1", ModelMessagesTypeAdapter.dump_json(messages).decode())
+        info = store.get("s1")
+        assert info is not None
+        assert info.message_count == 2
+
+    def test_history_uses_reported_message_count(self) -> None:
+        store = SessionStore()
+        store.create("s1")
+        # A reported count is trusted as-is; the history is not decoded.
+        store.set_history_json("s1", "not json", message_count=4)
+        info = store.get("s1")
+        assert info is not None
+        assert info.message_count == 4
+
+    def test_warm_message_adapter_builds_validator(self) -> None:
+        warm_message_adapter()
+        assert ModelMessagesTypeAdapter.pydantic_complete
+
     def test_remove_stale_respects_ttl(self) -> None:
         store = SessionStore()
         store.create("active")
@@ -276,6 +364,14 @@ class TestSessionStore:
         assert not store.exists("stale")
         assert store.exists("active")
 
+    def test_remove_stale_ignores_superseded_activity(self) -> None:
+        store = SessionStore()
+        store.create("s1")
+        store.backdate_last_active("s1", datetime(2020, 1, 1, tzinfo=UTC))
+        store.set_history_json("s1", "[]")  # fresh activity supersedes the backdate
+        assert store.remove_stale(ttl_seconds=60, active_sessions=set()) == []
+        assert store.exists("s1")
+
     def test_remove_stale_skips_active_websocket(self) -> None:
         store = SessionStore()
         store.create("ws-active")
@@ -283,6 +379,95 @@ class TestSessionStore:
         removed = store.remove_stale(ttl_seconds=60, active_sessions={"ws-active"})
         assert removed == []
         assert store.exists("ws-active")
+        # Still tracked: once disconnected, the next sweep evicts it.
+        assert store.remove_stale(ttl_seconds=60, active_sessions=set()) == ["ws-active"]
+
+
+class TestWebSocketStreamHandle:
+    async def test_token_frames_match_model_serialization(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        manager = ConnectionManager()
+        sent: list[str] = []
+
+        async def _capture(session_id: str, payload: str) -> None:
+            sent.append(payload)
+
+        monkeypatch.setattr(manager, "broadcast_json", _capture)
+        handle = WebSocketStreamHandle("s1", manager, asyncio.get_running_loop())
+        handle.write('h\u00e9 "x"\n')
+        handle.update_thinking("hmm")
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        expected = [
+            WSOutgoing(op="token", data={"content": 'h\u00e9 "x"\n'}),
+            WSOutgoing(op="thinking", data={"content": "hmm"}),
+        ]
+        assert [json.loads(frame) for frame in sent] == [msg.model_dump() for msg in expected]
+
+    async def test_token_bursts_coalesce_in_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        manager = ConnectionManager()
+        sent: list[dict[str, object]] = []
+
+        async def _capture(session_id: str, payload: str) -> None:
+            sent.append(json.loads(payload))
+
+        monkeypatch.setattr(manager, "broadcast_json", _capture)
+        handle = WebSocketStreamHandle("s1", manager, asyncio.get_running_loop())
+        for chunk in ("Hel", "lo", " "):
+            handle.write(chunk)
+        handle.start_tool_call("c1", "exec")
+        handle.write("done")
+        handle.close()
+        handle.write("ignored")
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        assert [(frame["op"], frame["data"]) for frame in sent] == [
+            ("token", {"content": "Hello "}),
+            ("tool_call", {"tool_call_id": "c1", "name": "exec", "details": None}),
+            ("token", {"content": "done"}),
+        ]
+
+    async def test_done_follows_streamed_frames_for_every_client(self) -> None:
+        """``done`` reaches each client only after the turn's queued frames."""
+        manager = ConnectionManager()
+        set_connection_manager(manager)
+        received: dict[str, list[str]] = {"a": [], "b": []}
+
+        def _client(name: str) -> AsyncMock:
+            async def _send_text(payload: str) -> None:
+                await asyncio.sleep(0.01)  # slow socket: the drain lags the worker
+                received[name].append(json.loads(payload)["op"])
+
+            ws = AsyncMock(spec=WebSocket)
+            ws.send_text.side_effect = _send_text
+            return ws
+
+        first, second = _client("a"), _client("b")
+        await manager.connect("s1", first)
+        await manager.connect("s1", second)
+
+        def _run(item: WorkItem) -> WorkItemOutput:
+            handle = streaming.take_stream(item.id)
+            assert isinstance(handle, WebSocketStreamHandle)
+            handle.write("Hel")
+            handle.start_tool_call("c1", "exec")
+            handle.finish_tool_call("c1", "ok")
+            handle.write("lo")
+            handle.close()
+            return WorkItemOutput(text="Hello", message_history_json="[]")
+
+        handle_message = routes._handle_message  # pyright: ignore[reportPrivateUsage]
+        with (
+            patch("autopoiesis.agent.runtime.get_runtime"),
+            patch("autopoiesis.agent.worker.enqueue_and_wait", side_effect=_run),
+        ):
+            await handle_message("s1", {"content": "hi"}, first)
+
+        expected = ["token", "tool_call", "tool_result", "token", "done"]
+        assert received == {"a": expected, "b": expected}
 
 
 class TestWSModels:
@@ -290,7 +475,28 @@ class TestWSModels:
         msg = WSIncoming(op="message", data={"content": "hi"})
         assert msg.op == "message"
 
+    def test_incoming_validate_json(self) -> None:
+        msg = WSIncoming.model_validate_json('{"op": "message", "data": {"content": "hi"}}')
+        assert (msg.op, msg.data) == ("message", {"content": "hi"})
+        assert WSIncoming.model_validate_json('{"op": "approve"}').data == {}
+
+    @pytest.mark.parametrize(
+        "raw", ["not json", "[]", '{"data": {}}', '{"op": 1}', '{"op": "message", "data": null}']
+    )
+    def test_incoming_validate_json_rejects_bad_frames(self, raw: str) -> None:
+        with pytest.raises(ValueError):
+            WSIncoming.model_validate_json(raw)
+
     def test_outgoing_model(self) -> None:
         msg = WSOutgoing(op="token", data={"content": "Hello"})
         dumped = msg.model_dump_json()
         assert "token" in dumped
+
+    def test_outgoing_to_json_reuses_static_frames(self) -> None:
+        first = WSOutgoing(op="done").to_json()
+        assert first == WSOutgoing(op="done", data={}).model_dump_json()
+        assert WSOutgoing(op="done").to_json() is first
+
+    def test_outgoing_to_json_with_payload(self) -> None:
+        msg = WSOutgoing(op="token", data={"content": "Hi"})
+        assert msg.to_json() == msg.model_dump_json()
@@ -141,6 +141,61 @@ class TestSkillActivatorDeactivation:
         assert "alpha" not in activator.active_skills  # type: ignore[attr-defined]
 
 
+class TestSkillActivatorServerCache:
+    def test_server_probe_cached_until_invalidated(self, tmp_path: Path) -> None:
+        from autopoiesis.skills.skill_activator import SkillActivator
+
+        activator = SkillActivator(MagicMock(), tmp_path)
+        assert activator.activate("late") is False
+
+        (tmp_path / "late").mkdir()
+        (tmp_path / "late" / "server.py").write_text("# server")
+        assert activator.activate("late") is False
+
+        activator.invalidate_server_cache("late")
+        assert activator.activate("late") is True
+
+    def test_directory_named_server_py_is_not_a_server(self, tmp_path: Path) -> None:
+        from autopoiesis.skills.skill_activator import SkillActivator
+
+        (tmp_path / "odd" / "server.py").mkdir(parents=True)
+        activator = SkillActivator(MagicMock(), tmp_path)
+        assert activator.activate("odd") is False
+
+
+class TestSkillActivatorBatch:
+    def test_activate_many_enables_once(self, tmp_path: Path) -> None:
+        from autopoiesis.skills.skill_activator import SkillActivator
+
+        for name in ("alpha", "beta"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "server.py").write_text("# server")
+        mock_mcp = MagicMock()
+        activator = SkillActivator(mock_mcp, tmp_path)
+
+        enabled = activator.activate_many(["alpha", "beta", "missing"])
+
+        assert enabled == {"alpha", "beta"}
+        mock_mcp.enable.assert_called_once_with(tags={"alpha", "beta"})
+        assert activator.active_skills == frozenset({"alpha", "beta"})
+
+    def test_deactivate_many_disables_only_active(self, tmp_path: Path) -> None:
+        from autopoiesis.skills.skill_activator import SkillActivator
+
+        (tmp_path / "alpha").mkdir()
+        (tmp_path / "alpha" / "server.py").write_text("# server")
+        mock_mcp = MagicMock()
+        activator = SkillActivator(mock_mcp, tmp_path)
+        activator.activate("alpha")
+
+        disabled = activator.deactivate_many(["alpha", "beta"])
+
+        assert disabled == {"alpha"}
+        mock_mcp.disable.assert_called_once_with(tags={"alpha"})
+        assert activator.active_skills == frozenset()
+        assert activator.deactivate_many(["alpha"]) == set()
+
+
 class TestSkillActivatorTopicWiring:
     def _make_activator(self, tmp_path: Path, skill_names: list[str]) -> object:
         from autopoiesis.skills.skill_activator import SkillActivator
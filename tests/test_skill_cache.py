@@ -1,7 +1,11 @@
 """Tests for skill instruction cache invalidation on file mtime change."""
 
+import os
 from pathlib import Path
 
+import pytest
+
+from autopoiesis.skills import skills
 from autopoiesis.skills.skills import Skill, load_skill_instructions
 
 
@@ -34,11 +38,15 @@ def test_load_skill_caches_instructions(tmp_path: Path) -> None:
     assert result2 == result1
 
 
-def test_load_skill_invalidates_on_mtime_change(tmp_path: Path) -> None:
+def test_load_skill_invalidates_on_mtime_change(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Cache is invalidated when the SKILL.md file mtime changes."""
     import os
     import time
 
+    monkeypatch.setattr(skills, "_INSTRUCTIONS_TTL_SECONDS", 0.0)
+
     skill_dir = _make_skill_dir(tmp_path, "demo", "original instructions")
     skill = Skill(name="demo", description="test", path=skill_dir)
     cache = {"demo": skill}
@@ -64,8 +72,76 @@ def test_load_skill_invalidates_on_mtime_change(tmp_path: Path) -> None:
     assert "updated instructions" in result
 
 
+def test_load_skill_skips_stat_within_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeated loads inside the TTL reuse instructions without a stat()."""
+    skill_dir = _make_skill_dir(tmp_path, "demo", "original instructions")
+    skill = Skill(name="demo", description="test", path=skill_dir)
+    cache = {"demo": skill}
+    clock = [100.0]
+    monkeypatch.setattr(skills.time, "monotonic", lambda: clock[0])
+    load_skill_instructions(cache, "demo")
+
+    stale_check_calls: list[Skill] = []
+    real_ensure_parsed = skills._ensure_parsed  # pyright: ignore[reportPrivateUsage]
+
+    def record_check(checked: Skill) -> tuple[dict[str, object], str]:
+        stale_check_calls.append(checked)
+        return real_ensure_parsed(checked)
+
+    monkeypatch.setattr(skills, "_ensure_parsed", record_check)
+    clock[0] += skills._INSTRUCTIONS_TTL_SECONDS / 2  # pyright: ignore[reportPrivateUsage]
+    assert "original instructions" in load_skill_instructions(cache, "demo")
+    assert stale_check_calls == []
+
+    clock[0] += skills._INSTRUCTIONS_TTL_SECONDS  # pyright: ignore[reportPrivateUsage]
+    load_skill_instructions(cache, "demo")
+    assert stale_check_calls == [skill]
+
+
+def test_load_skill_reuses_formatted_string(tmp_path: Path) -> None:
+    """The composed instructions string is built once per load."""
+    skill_dir = _make_skill_dir(tmp_path, "demo", "original instructions")
+    skill = Skill(name="demo", description="test", path=skill_dir)
+    cache = {"demo": skill}
+
+    first = load_skill_instructions(cache, "demo")
+    assert first == "# Skill: demo\n\noriginal instructions"
+    assert load_skill_instructions(cache, "demo") is first
+
+
 def test_load_skill_not_found() -> None:
     """Loading a nonexistent skill returns a helpful message."""
     cache: dict[str, Skill] = {}
     result = load_skill_instructions(cache, "nope")
     assert "not found" in result.lower()
+
+
+def test_validate_and_lint_reuse_loaded_parse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """validate/lint reuse the parse from load_skill until SKILL.md changes."""
+    skill_dir = _make_skill_dir(tmp_path, "demo", "original instructions")
+    skill = Skill(name="demo", description="test", path=skill_dir)
+    cache = {"demo": skill}
+    parses: list[str] = []
+    real_parse = skills.parse_skill_md
+
+    def counting_parse(content: str) -> tuple[dict[str, object], str]:
+        parses.append(content)
+        return real_parse(content)
+
+    monkeypatch.setattr(skills, "parse_skill_md", counting_parse)
+    load_skill_instructions(cache, "demo")
+    skills._validate_skill(cache, "demo")  # pyright: ignore[reportPrivateUsage]
+    skills._lint_skill(cache, "demo")  # pyright: ignore[reportPrivateUsage]
+    assert len(parses) == 1
+    assert skill.frontmatter is not None
+    assert skill.frontmatter["name"] == "demo"
+
+    skill_file = skill_dir / "SKILL.md"
+    skill_file.write_text(skill_file.read_text().replace("original", "edited"))
+    stat = skill_file.stat()
+    os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    skills._lint_skill(cache, "demo")  # pyright: ignore[reportPrivateUsage]
+    assert len(parses) == 2
+    assert skill.instructions == "edited instructions"
@@ -104,6 +104,55 @@ class TestDiscoverSkillProviders:
         assert "real_skill" in names
         assert len(names) == 1
 
+    def test_symlinked_skill_dir_skipped(self, tmp_path: Path) -> None:
+        outside = tmp_path / "outside"
+        _write_minimal_server(outside / "evil", "evil")
+        root = tmp_path / "skills"
+        root.mkdir()
+        (root / "evil").symlink_to(outside / "evil", target_is_directory=True)
+
+        assert discover_skill_providers(root) == []
+
+    def test_symlinked_server_py_skipped(self, tmp_path: Path) -> None:
+        _write_minimal_server(tmp_path / "outside", "linked")
+        skill_dir = tmp_path / "skills" / "linked"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "server.py").symlink_to(tmp_path / "outside" / "server.py")
+
+        assert discover_skill_providers(tmp_path / "skills") == []
+
+    def test_unchanged_skill_reuses_provider(self, tmp_path: Path) -> None:
+        _write_minimal_server(tmp_path / "alpha", "alpha")
+
+        first = discover_skill_providers(tmp_path)
+        second = discover_skill_providers(tmp_path)
+
+        assert first[0][1] is second[0][1]
+
+    def test_edited_server_py_rebuilds_provider(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "alpha"
+        _write_minimal_server(skill_dir, "alpha")
+        first = discover_skill_providers(tmp_path)
+
+        server_py = skill_dir / "server.py"
+        server_py.write_text(server_py.read_text() + "\n# edited\n")
+        second = discover_skill_providers(tmp_path)
+
+        assert first[0][1] is not second[0][1]
+
+    def test_edited_sibling_module_rebuilds_provider(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "alpha"
+        _write_minimal_server(skill_dir, "alpha")
+        helpers = skill_dir / "lib" / "helpers.py"
+        helpers.parent.mkdir()
+        helpers.write_text("VALUE = 1\n")
+        first = discover_skill_providers(tmp_path)
+
+        helpers.write_text("VALUE = 1\nOTHER = 2\n")
+        second = discover_skill_providers(tmp_path)
+
+        assert first[0][1] is not second[0][1]
+
 
 # ---------------------------------------------------------------------------
 # register_skill_providers
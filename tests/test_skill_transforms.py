@@ -7,11 +7,15 @@ FastMCP Visibility transforms.
 from __future__ import annotations
 
 import asyncio
+from pathlib import Path
 
+from autopoiesis.security.path_validator import PathValidator
 from autopoiesis.skills.skill_transforms import (
+    PathValidationTransform,
     make_allowlist_transform,
     make_skill_disable_transform,
     make_skill_enable_transform,
+    make_skills_disable_transform,
     make_tag_allowlist_transform,
 )
 
@@ -52,11 +56,11 @@ def _tool_names(mcp: object) -> set[str]:
 
 
 class TestMakeSkillDisableTransform:
-    def test_returns_list_of_visibility(self) -> None:
+    def test_returns_tuple_of_visibility(self) -> None:
         from fastmcp.server.transforms import Visibility
 
         transforms = make_skill_disable_transform("my_skill")
-        assert isinstance(transforms, list)
+        assert isinstance(transforms, tuple)
         assert len(transforms) >= 1
         assert all(isinstance(t, Visibility) for t in transforms)
 
@@ -88,6 +92,27 @@ class TestMakeSkillDisableTransform:
         assert "untagged" in visible
 
 
+# ---------------------------------------------------------------------------
+# make_skills_disable_transform
+# ---------------------------------------------------------------------------
+
+
+class TestMakeSkillsDisableTransform:
+    def test_one_transform_hides_every_skill(self) -> None:
+        mcp = _make_server_with_tagged_tools()
+        transforms = make_skills_disable_transform(["skill_a", "skill_b"])
+        assert len(transforms) == 1
+        mcp.add_transform(transforms[0])  # type: ignore[attr-defined]
+        assert _tool_names(mcp) == set()
+
+        for t in make_skill_enable_transform("skill_b"):
+            mcp.add_transform(t)  # type: ignore[attr-defined]
+        assert _tool_names(mcp) == {"tool_b"}
+
+    def test_no_skills_yields_no_transform(self) -> None:
+        assert make_skills_disable_transform([]) == ()
+
+
 # ---------------------------------------------------------------------------
 # make_skill_enable_transform
 # ---------------------------------------------------------------------------
@@ -107,11 +132,11 @@ class TestMakeSkillEnableTransform:
             mcp.add_transform(t)  # type: ignore[attr-defined]
         assert "tool_a" in _tool_names(mcp)
 
-    def test_returns_list_of_visibility(self) -> None:
+    def test_returns_tuple_of_visibility(self) -> None:
         from fastmcp.server.transforms import Visibility
 
         transforms = make_skill_enable_transform("skill_x")
-        assert isinstance(transforms, list)
+        assert isinstance(transforms, tuple)
         assert all(isinstance(t, Visibility) for t in transforms)
 
 
@@ -132,7 +157,7 @@ class TestMakeAllowlistTransform:
 
     def test_empty_allowlist_hides_everything(self) -> None:
         mcp = _make_server_with_tagged_tools()
-        for t in make_allowlist_transform(frozenset()):
+        for t in make_allowlist_transform(frozenset[str]()):
             mcp.add_transform(t)  # type: ignore[attr-defined]
 
         assert _tool_names(mcp) == set()
@@ -145,11 +170,22 @@ class TestMakeAllowlistTransform:
         visible = _tool_names(mcp)
         assert {"tool_a", "tool_b"} <= visible
 
-    def test_returns_list(self) -> None:
+    def test_returns_tuple(self) -> None:
         transforms = make_allowlist_transform(frozenset({"some_tool"}))
-        assert isinstance(transforms, list)
+        assert isinstance(transforms, tuple)
         assert len(transforms) >= 1
 
+    def test_same_allowlist_reuses_transforms(self) -> None:
+        first = make_allowlist_transform(frozenset({"tool_a", "tool_b"}))
+        second = make_allowlist_transform(frozenset({"tool_b", "tool_a"}))
+        assert first is second
+        assert first[0] is make_tag_allowlist_transform(frozenset({"skill_a"}))[0]
+
+    def test_empty_allowlists_share_hide_all(self) -> None:
+        assert make_allowlist_transform(frozenset[str]()) is make_tag_allowlist_transform(
+            frozenset[str]()
+        )
+
 
 # ---------------------------------------------------------------------------
 # make_tag_allowlist_transform
@@ -168,7 +204,7 @@ class TestMakeTagAllowlistTransform:
 
     def test_empty_tags_hides_everything(self) -> None:
         mcp = _make_server_with_tagged_tools()
-        for t in make_tag_allowlist_transform(frozenset()):
+        for t in make_tag_allowlist_transform(frozenset[str]()):
             mcp.add_transform(t)  # type: ignore[attr-defined]
 
         assert _tool_names(mcp) == set()
@@ -217,3 +253,105 @@ class TestLazyLoadingPattern:
         for t in make_skill_disable_transform("skill_a"):
             mcp.add_transform(t)  # type: ignore[attr-defined]
         assert "tool_a" not in _tool_names(mcp)
+
+
+# ---------------------------------------------------------------------------
+# PathValidationTransform
+# ---------------------------------------------------------------------------
+
+
+class TestPathValidationTransform:
+    def test_wraps_path_tool_once_and_blocks_escape(self, tmp_path: Path) -> None:
+        from fastmcp import FastMCP
+
+        mcp = FastMCP("paths")
+
+        @mcp.tool()
+        def read(path: str) -> str:
+            """Echo the validated path."""
+            return path
+
+        _ = read  # registered via decorator
+        mcp.add_transform(
+            PathValidationTransform(path_validator=PathValidator(workspace_root=tmp_path))
+        )
+
+        first = asyncio.run(mcp.get_tool("read"))
+        second = asyncio.run(mcp.get_tool("read"))
+        assert first is not None
+        assert first is second
+
+        blocked = asyncio.run(mcp.call_tool("read", {"path": "../../etc/passwd"}))
+        assert blocked.meta is not None
+        assert blocked.meta["reason"] == "path_validation"
+
+    def test_tools_without_path_arguments_pass_through(self, tmp_path: Path) -> None:
+        from fastmcp import FastMCP
+
+        mcp = FastMCP("paths")
+
+        @mcp.tool()
+        def count(path_count: int, label: str) -> str:
+            """No path-like argument."""
+            return f"{label}: {path_count}"
+
+        _ = count  # registered via decorator
+        transform = PathValidationTransform(path_validator=PathValidator(workspace_root=tmp_path))
+        tool = asyncio.run(mcp.get_tool("count"))
+        assert tool is not None
+
+        assert asyncio.run(transform.list_tools([tool])) == [tool]
+
+    def test_wrapper_does_not_share_containers_with_delegate(self, tmp_path: Path) -> None:
+        from fastmcp import FastMCP
+
+        mcp = FastMCP("paths")
+
+        @mcp.tool(tags={"files"}, meta={"kind": "read"})
+        def read(path: str) -> str:
+            """Echo the validated path."""
+            return path
+
+        _ = read  # registered via decorator
+        source = asyncio.run(mcp.get_tool("read"))
+        assert source is not None
+        transform = PathValidationTransform(path_validator=PathValidator(workspace_root=tmp_path))
+        wrapped = asyncio.run(transform.list_tools([source]))[0]
+
+        assert wrapped is not source
+        assert wrapped.parameters == source.parameters
+        assert wrapped.parameters is not source.parameters
+        assert wrapped.tags is not source.tags
+        assert wrapped.meta is not source.meta
+
+    def test_arguments_copied_only_when_a_path_is_rewritten(self, tmp_path: Path) -> None:
+        from fastmcp import FastMCP
+
+        from autopoiesis.skills.skill_transforms import (
+            _PathValidatedTool,  # pyright: ignore[reportPrivateUsage]
+        )
+
+        mcp = FastMCP("paths")
+
+        @mcp.tool()
+        def read(path: str) -> str:
+            """Echo the validated path."""
+            return path
+
+        _ = read  # registered via decorator
+        transform = PathValidationTransform(path_validator=PathValidator(workspace_root=tmp_path))
+        source = asyncio.run(mcp.get_tool("read"))
+        assert source is not None
+        wrapped = asyncio.run(transform.list_tools([source]))[0]
+        assert isinstance(wrapped, _PathValidatedTool)
+
+        absent: dict[str, object] = {}
+        canonical: dict[str, object] = {"path": str(tmp_path.resolve())}
+        relative: dict[str, object] = {"path": "notes.txt"}
+        validate = wrapped._validate_arguments  # pyright: ignore[reportPrivateUsage]
+
+        assert validate(absent) is absent
+        assert validate(canonical) is canonical
+        rewritten = validate(relative)
+        assert rewritten == {"path": str(tmp_path.resolve() / "notes.txt")}
+        assert relative == {"path": "notes.txt"}
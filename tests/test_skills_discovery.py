@@ -2,11 +2,19 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 
 import pytest
 
-from autopoiesis.skills.skills import Skill, SkillDirectory, discover_skills, parse_skill_md
+from autopoiesis.skills import skill_discovery
+from autopoiesis.skills.skills import (
+    Skill,
+    SkillDirectory,
+    _read_resource,  # pyright: ignore[reportPrivateUsage]
+    discover_skills,
+    parse_skill_md,
+)
 
 
 def _write_skill(directory: Path, name: str, description: str = "A test skill") -> Path:
@@ -45,6 +53,13 @@ class TestParseSkillMd:
         with pytest.raises(yaml.YAMLError):
             parse_skill_md(content)
 
+    def test_python_tags_rejected(self) -> None:
+        content = "---\nname: !!python/object/apply:os.getcwd []\n---\nbody"
+        import yaml
+
+        with pytest.raises(yaml.YAMLError):
+            parse_skill_md(content)
+
     def test_non_mapping_frontmatter_raises(self) -> None:
         content = "---\n- list item\n---\nbody"
         with pytest.raises(ValueError, match="must be a mapping"):
@@ -62,6 +77,12 @@ class TestParseSkillMd:
         assert fm == {}
         assert "no closing" in instructions
 
+    def test_crlf_and_padded_delimiters(self) -> None:
+        content = "--- \r\nname: crlf\r\nrule: ----\r\n  ---\r\nBody\r\n---\r\nMore"
+        fm, instructions = parse_skill_md(content)
+        assert fm == {"name": "crlf", "rule": "----"}
+        assert instructions == "Body\r\n---\r\nMore"
+
     def test_multiline_instructions(self) -> None:
         content = "---\nname: multi\n---\nLine 1\nLine 2\nLine 3"
         _, instructions = parse_skill_md(content)
@@ -136,6 +157,108 @@ class TestDiscoverSkills:
         assert "helper.py" in target.resources
         assert "data.json" in target.resources
 
+    def test_has_resource_matches_listing(self, tmp_path: Path) -> None:
+        skill_dir = _write_skill(tmp_path, "lookup")
+        (skill_dir / "guide.md").write_text("g")
+        (skill,) = discover_skills([SkillDirectory(path=tmp_path)])
+        assert skill.has_resource("guide.md")
+        assert not skill.has_resource("SKILL.md")
+        assert Skill(name="x", description="d", path=tmp_path, resources=["a"]).has_resource("a")
+
+    def test_path_validator_built_once(self, tmp_path: Path) -> None:
+        skill = Skill(name="v", description="d", path=tmp_path / "v")
+        validator = skill.path_validator()
+        assert skill.path_validator() is validator
+        assert validator.workspace_root == (tmp_path / "v").resolve()
+
+    def test_resources_are_direct_child_files(self, tmp_path: Path) -> None:
+        skill_dir = _write_skill(tmp_path, "mixed")
+        (skill_dir / "notes.md").write_text("n")
+        (skill_dir / "alias.md").symlink_to(skill_dir / "notes.md")
+        (skill_dir / "sub").mkdir()
+        (skill_dir / "sub" / "inner.md").write_text("i")
+        (skill,) = discover_skills([SkillDirectory(path=tmp_path)])
+        assert sorted(skill.resources) == ["alias.md", "notes.md"]
+
+    def test_recursive_walk_skips_symlinked_dirs(self, tmp_path: Path) -> None:
+        root = tmp_path / "root"
+        _write_skill(root / "nested", "deep")
+        _write_skill(tmp_path / "elsewhere", "linked")
+        (root / "link").symlink_to(tmp_path / "elsewhere")
+        (root / "nested" / "loop").symlink_to(root)
+        names = {s.name for s in discover_skills([SkillDirectory(path=root)])}
+        assert names == {"deep"}
+
+    def test_non_recursive_follows_symlinked_skill(self, tmp_path: Path) -> None:
+        root = tmp_path / "root"
+        root.mkdir()
+        target = _write_skill(tmp_path / "elsewhere", "linked")
+        (root / "linked").symlink_to(target)
+        dirs = [SkillDirectory(path=root, recursive=False)]
+        assert [s.name for s in discover_skills(dirs)] == ["linked"]
+
+    def test_reads_only_frontmatter(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "big_body"
+        skill_dir.mkdir()
+        # Undecodable bytes well past the header prove discovery stops reading
+        # at the closing delimiter instead of loading the whole body.
+        (skill_dir / "SKILL.md").write_bytes(
+            b"---\nname: big_body\ndescription: d\n---\n" + b"x" * 65536 + b"\xff\xfe"
+        )
+        skills = discover_skills([SkillDirectory(path=tmp_path)])
+        assert [s.name for s in skills] == ["big_body"]
+
+    def test_skips_unterminated_frontmatter(self, tmp_path: Path) -> None:
+        skill_dir = tmp_path / "open"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname: open\ndescription: d\n")
+        assert discover_skills([SkillDirectory(path=tmp_path)]) == []
+
+
+class TestSkillMetadataCache:
+    """Tests for reusing parsed metadata across discovery calls."""
+
+    def _count_reads(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        reads: list[Path] = []
+        real = skill_discovery._read_frontmatter_only  # pyright: ignore[reportPrivateUsage]
+
+        def counting(skill_file: Path) -> dict[str, object]:
+            reads.append(skill_file)
+            return real(skill_file)
+
+        monkeypatch.setattr(skill_discovery, "_read_frontmatter_only", counting)
+        return reads
+
+    def test_unchanged_skill_not_reparsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        _write_skill(tmp_path, "stable")
+        reads = self._count_reads(monkeypatch)
+        first = discover_skills([SkillDirectory(path=tmp_path)])
+        second = discover_skills([SkillDirectory(path=tmp_path)])
+        assert len(reads) == 1
+        assert first[0] == second[0]
+        assert first[0] is not second[0]
+
+    def test_edited_skill_reparsed(self, tmp_path: Path) -> None:
+        skill_dir = _write_skill(tmp_path, "edited", description="old")
+        discover_skills([SkillDirectory(path=tmp_path)])
+        skill_file = skill_dir / "SKILL.md"
+        skill_file.write_text(skill_file.read_text().replace("old", "new"))
+        stat = skill_file.stat()
+        os.utime(skill_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (skill,) = discover_skills([SkillDirectory(path=tmp_path)])
+        assert skill.description == "new"
+
+    def test_added_resource_refreshes_listing(self, tmp_path: Path) -> None:
+        skill_dir = _write_skill(tmp_path, "grows")
+        discover_skills([SkillDirectory(path=tmp_path)])
+        (skill_dir / "extra.md").write_text("more")
+        stat = skill_dir.stat()
+        os.utime(skill_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        (skill,) = discover_skills([SkillDirectory(path=tmp_path)])
+        assert skill.resources == ["extra.md"]
+
 
 class TestLoadSkillInstructions:
     """Tests for loading instructions with missing SKILL.md."""
@@ -147,3 +270,40 @@ class TestLoadSkillInstructions:
         cache = {"ghost": skill}
         result = load_skill_instructions(cache, "ghost")
         assert "not found" in result.lower() or "SKILL.md" in result
+
+
+class TestReadResource:
+    """Tests for reading skill resources and their error messages."""
+
+    def _skill(self, tmp_path: Path) -> dict[str, Skill]:
+        skill_dir = _write_skill(tmp_path, "res")
+        (skill_dir / "guide.md").write_text("guide text")
+        (skill,) = discover_skills([SkillDirectory(path=tmp_path)])
+        return {"res": skill}
+
+    def test_reads_listed_resource(self, tmp_path: Path) -> None:
+        assert _read_resource(self._skill(tmp_path), "res", "guide.md") == "guide text"
+
+    def test_unlisted_resource(self, tmp_path: Path) -> None:
+        result = _read_resource(self._skill(tmp_path), "res", "other.md")
+        assert result == "Resource 'other.md' not listed. Available: guide.md"
+
+    def test_deleted_resource(self, tmp_path: Path) -> None:
+        cache = self._skill(tmp_path)
+        (tmp_path / "res" / "guide.md").unlink()
+        result = _read_resource(cache, "res", "guide.md")
+        assert result == "Resource 'guide.md' not found. Available: guide.md"
+
+    def test_resource_replaced_by_directory(self, tmp_path: Path) -> None:
+        cache = self._skill(tmp_path)
+        (tmp_path / "res" / "guide.md").unlink()
+        (tmp_path / "res" / "guide.md").mkdir()
+        assert _read_resource(cache, "res", "guide.md") == "Resource 'guide.md' is not a file."
+
+    def test_resource_escaping_skill_dir(self, tmp_path: Path) -> None:
+        cache = self._skill(tmp_path)
+        (tmp_path / "secret.txt").write_text("secret")
+        (tmp_path / "res" / "guide.md").unlink()
+        (tmp_path / "res" / "guide.md").symlink_to(tmp_path / "secret.txt")
+        result = _read_resource(cache, "res", "guide.md")
+        assert result == "Error: resource path escapes skill directory."
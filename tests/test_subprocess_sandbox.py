@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 from unittest.mock import MagicMock
 
 import pytest
 
 import autopoiesis.security.subprocess_sandbox as sandbox_module
-from autopoiesis.security.subprocess_sandbox import SubprocessSandboxManager
+from autopoiesis.security.subprocess_sandbox import SandboxLimits, SubprocessSandboxManager
 
 
 def test_resolve_cwd_enforces_workspace_boundary(tmp_path: Path) -> None:
@@ -115,12 +116,17 @@ def test_preexec_fn_caps_fsize_and_cpu_even_when_soft_is_infinite(
     assert set_calls[2] == (3, (30, 1024))
 
 
-def test_run_uses_subprocess_with_preexec(
+def test_run_uses_subprocess_with_preexec_without_prlimit(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
 ) -> None:
     workspace = tmp_path / "workspace"
     workspace.mkdir()
+
+    def no_prlimit(_name: str) -> None:
+        return None
+
+    monkeypatch.setattr(sandbox_module.shutil, "which", no_prlimit)
     sandbox = SubprocessSandboxManager(workspace_root=workspace)
     expected = MagicMock()
     run_mock = MagicMock(return_value=expected)
@@ -134,3 +140,59 @@ def test_run_uses_subprocess_with_preexec(
     assert call.args[0] == ["git", "status"]
     assert call.kwargs["cwd"] == str(workspace.resolve())
     assert callable(call.kwargs["preexec_fn"])
+
+
+def test_run_prefixes_prlimit_launcher_and_skips_preexec(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+
+    def fake_which(_name: str) -> str:
+        return "/usr/bin/prlimit"
+
+    monkeypatch.setattr(sandbox_module.shutil, "which", fake_which)
+    monkeypatch.setattr(sandbox_module.resource, "RLIMIT_NPROC", 1, raising=False)
+    monkeypatch.setattr(sandbox_module.resource, "RLIMIT_FSIZE", 2, raising=False)
+    monkeypatch.setattr(sandbox_module.resource, "RLIMIT_CPU", 3, raising=False)
+
+    def fake_getrlimit(limit: int) -> tuple[int, int]:
+        if limit == 1:
+            return (sandbox_module.resource.RLIM_INFINITY, sandbox_module.resource.RLIM_INFINITY)
+        return (0, 1024)
+
+    monkeypatch.setattr(sandbox_module.resource, "getrlimit", fake_getrlimit)
+    sandbox = SubprocessSandboxManager(workspace_root=workspace)
+    run_mock = MagicMock()
+    monkeypatch.setattr(sandbox_module.subprocess, "run", run_mock)
+
+    sandbox.run(["git", "status"])
+
+    call = run_mock.call_args
+    assert call is not None
+    assert call.args[0] == [
+        "/usr/bin/prlimit",
+        "--nproc=unlimited:",
+        "--fsize=1024:",
+        "--cpu=30:",
+        "--",
+        "git",
+        "status",
+    ]
+    assert call.kwargs["preexec_fn"] is None
+
+
+@pytest.mark.skipif(shutil.which("prlimit") is None, reason="prlimit not installed")
+def test_run_applies_cpu_limit_through_prlimit(tmp_path: Path) -> None:
+    workspace = tmp_path / "workspace"
+    workspace.mkdir()
+    sandbox = SubprocessSandboxManager(
+        workspace_root=workspace,
+        limits=SandboxLimits(max_cpu_seconds=7),
+    )
+
+    result = sandbox.run(["sh", "-c", "ulimit -St"])
+
+    assert result.returncode == 0
+    assert result.stdout.strip() == "7"
@@ -0,0 +1,49 @@
+"""Tests for the shared tool wrapper cache used by skill transforms."""
+
+from __future__ import annotations
+
+from fastmcp.tools.tool import Tool
+
+from autopoiesis.skills.tool_wrap_cache import ToolWrapCache
+
+
+def _make_tool(name: str) -> Tool:
+    def _noop() -> str:
+        return name
+
+    return Tool.from_function(_noop, name=name)
+
+
+def test_wrapper_built_once_per_tool() -> None:
+    calls: list[str] = []
+
+    def _wrap(tool: Tool) -> Tool:
+        calls.append(tool.name)
+        return tool.model_copy(update={"title": "wrapped"})
+
+    cache = ToolWrapCache(_wrap)
+    tool = _make_tool("alpha")
+
+    first = cache.get(tool)
+    second = cache.get(tool)
+
+    assert first is second
+    assert first.title == "wrapped"
+    assert calls == ["alpha"]
+
+
+def test_oldest_entry_evicted_beyond_max_size() -> None:
+    calls: list[str] = []
+
+    def _wrap(tool: Tool) -> Tool:
+        calls.append(tool.name)
+        return tool
+
+    cache = ToolWrapCache(_wrap, max_size=2)
+    tools = [_make_tool(name) for name in ("a", "b", "c")]
+    for tool in tools:
+        cache.get(tool)
+
+    assert len(cache) == 2
+    cache.get(tools[0])
+    assert calls == ["a", "b", "c", "a"]